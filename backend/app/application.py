@@ -1,21 +1,54 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from .config import load_settings
 from .container import Container
 from .routes import auth_router, drive_router, prompt_router
 
 
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by outbound Google API calls."""
+
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0, connect=5.0, pool=5.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=40,
+            keepalive_expiry=30.0,
+        ),
+        http2=True,
+    )
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Services are built once the event loop is running so that anything they
+    # open is owned by the serving loop and released on shutdown.
+    http_client = create_http_client()
+    app.state.http_client = http_client
+    app.state.container = Container(app.state.settings, http_client=http_client)
+    try:
+        yield
+    finally:
+        await http_client.aclose()
+
+
 def create_app() -> FastAPI:
     """Create and configure a FastAPI application instance."""
 
-    container = Container()
+    settings = load_settings()
 
-    app = FastAPI()
-    app.state.container = container
+    app = FastAPI(lifespan=_lifespan, default_response_class=ORJSONResponse)
+    app.state.settings = settings
 
-    frontend_origin = container.settings.frontend_origin
+    frontend_origin = settings.frontend_origin
     allow_origins = [frontend_origin] if frontend_origin != "*" else ["*"]
 
     app.add_middleware(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
@@ -11,6 +12,14 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@lru_cache(maxsize=8)
+def _origin_from_url(url: str) -> str:
+    parsed = urlparse(url)
+    if not parsed.scheme:
+        return "*"
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
 @dataclass(frozen=True)
 class Settings:
     """Application configuration loaded from environment variables."""
@@ -26,10 +35,7 @@ class Settings:
 
     @property
     def frontend_origin(self) -> str:
-        parsed = urlparse(self.frontend_redirect_url)
-        if not parsed.scheme:
-            return "*"
-        return f"{parsed.scheme}://{parsed.netloc}"
+        return _origin_from_url(self.frontend_redirect_url)
 
     @property
     def has_oauth_credentials(self) -> bool:
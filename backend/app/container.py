@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from typing import Optional
+
+import httpx
+
 from .config import Settings, load_settings
 from .services.ai_generation import AIGenerationService
 from .services.configuration_images import ConfigurationImageService
@@ -7,30 +11,41 @@ from .services.prompt_config import PromptConfigService
 from .services.prompt_request_log import PromptRequestLogService
 from .services.google_drive import GoogleDriveService
 from .services.oauth import GoogleOAuthService
+from .services.openai_client import create_openai_client
 from .services.security_report import SecurityReportService
 from .token_store import TokenStorage
-from openai import OpenAI
 
 
 class Container:
     """Application service container for dependency management."""
 
-    def __init__(self) -> None:
-        self._settings = load_settings()
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        *,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        self._settings = settings or load_settings()
         self._token_storage = TokenStorage(self._settings.tokens_path)
         self._oauth_service = GoogleOAuthService(self._settings, self._token_storage)
         self._drive_service = GoogleDriveService(
-            self._settings, self._token_storage, self._oauth_service
+            self._settings,
+            self._token_storage,
+            self._oauth_service,
+            http_client=http_client,
         )
         prompt_storage_path = self._settings.tokens_path.with_name("prompt_configs.json")
         self._prompt_config_service = PromptConfigService(prompt_storage_path)
         request_log_path = self._settings.tokens_path.with_name("prompt_requests.log")
         self._prompt_request_log_service = PromptRequestLogService(request_log_path)
+        # One OpenAI client (and its HTTP/2 connection pool) serves every service.
+        openai_client = create_openai_client(self._settings.openai_api_key)
         self._ai_generation_service = AIGenerationService(
-            self._settings, self._prompt_config_service, self._prompt_request_log_service
+            self._settings,
+            self._prompt_config_service,
+            self._prompt_request_log_service,
+            openai_client=openai_client,
         )
-        api_key = self._settings.openai_api_key
-        openai_client = OpenAI(api_key=api_key) if api_key else OpenAI()
         self._security_report_service = SecurityReportService(
             drive_service=self._drive_service,
             prompt_config_service=self._prompt_config_service,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import httpx
 from fastapi import Depends, Request
 
 from .container import Container
@@ -20,6 +21,13 @@ def get_container(request: Request) -> Container:
     return container
 
 
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    client = getattr(request.app.state, "http_client", None)
+    if not isinstance(client, httpx.AsyncClient):
+        raise RuntimeError("Shared HTTP client is not configured on FastAPI app state.")
+    return client
+
+
 def get_token_storage(container: Container = Depends(get_container)) -> TokenStorage:
     return container.token_storage
 
@@ -1,17 +1,35 @@
 from __future__ import annotations
 
 from typing import Optional
-from urllib.parse import urlencode
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse
 
-from ..dependencies import get_oauth_service, get_token_storage
-from ..services.oauth import GOOGLE_AUTH_ENDPOINT, GOOGLE_SCOPES, GoogleOAuthService
+from ..dependencies import get_http_client, get_oauth_service, get_token_storage
+from ..services.oauth import GoogleOAuthService
 from ..token_store import TokenStorage
 
 router = APIRouter()
 
+_SUCCESS_PAGE_BYTES = """
+        <html>
+            <head>
+                <meta charset="utf-8" />
+                <title>Google 인증 완료</title>
+                <style>
+                    body { font-family: sans-serif; padding: 48px; text-align: center; }
+                    h1 { color: #2563eb; }
+                </style>
+            </head>
+            <body>
+                <h1>Google Drive 인증이 완료되었습니다.</h1>
+                <p>이 창은 닫으셔도 됩니다.</p>
+            </body>
+        </html>
+        """.encode("utf-8")
+_SUCCESS_PAGE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
 
 @router.get("/auth/google/login")
 def google_login(
@@ -20,25 +38,14 @@ def google_login(
     oauth_service.ensure_credentials()
 
     state = oauth_service.create_state()
-    params = {
-        "client_id": oauth_service.settings.client_id,
-        "redirect_uri": oauth_service.settings.redirect_uri,
-        "response_type": "code",
-        "scope": " ".join(GOOGLE_SCOPES),
-        "access_type": "offline",
-        "prompt": "consent",
-        "include_granted_scopes": "true",
-        "state": state,
-    }
-
-    auth_url = f"{GOOGLE_AUTH_ENDPOINT}?{urlencode(params)}"
-    return RedirectResponse(auth_url)
+    return RedirectResponse(oauth_service.build_authorization_url(state))
 
 
 @router.get("/auth/google/callback")
 async def google_callback(
     request: Request,
     oauth_service: GoogleOAuthService = Depends(get_oauth_service),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ) -> RedirectResponse:
     oauth_service.ensure_credentials()
 
@@ -57,12 +64,12 @@ async def google_callback(
 
     try:
         oauth_service.validate_state(state)
-        tokens = await oauth_service.exchange_code_for_tokens(code)
+        tokens = await oauth_service.exchange_code_for_tokens(code, client=http_client)
         access_token = tokens.get("access_token")
         if not isinstance(access_token, str) or not access_token:
             raise HTTPException(status_code=502, detail="Google 토큰 발급에 실패했습니다.")
 
-        userinfo = await oauth_service.fetch_userinfo(access_token)
+        userinfo = await oauth_service.fetch_userinfo(access_token, client=http_client)
         stored = oauth_service.save_tokens(userinfo, tokens)
     except HTTPException as exc:  # convert to frontend redirect
         detail = exc.detail if isinstance(exc.detail, str) else str(exc.detail)
@@ -82,7 +89,7 @@ def read_tokens(
     email: Optional[str] = Query(None, description="조회할 Google 계정 이메일"),
     token_storage: TokenStorage = Depends(get_token_storage),
     oauth_service: GoogleOAuthService = Depends(get_oauth_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     oauth_service.ensure_credentials()
 
     if not google_id and not email:
@@ -91,11 +98,7 @@ def read_tokens(
             detail="google_id 또는 email 중 하나는 반드시 제공해야 합니다.",
         )
 
-    stored = None
-    if google_id:
-        stored = token_storage.load_by_google_id(google_id)
-    if stored is None and email:
-        stored = token_storage.load_by_email(email)
+    stored = token_storage.load_by_google_id_or_email(google_id, email)
     if not stored:
         raise HTTPException(status_code=404, detail="요청한 사용자에 대한 저장된 토큰이 없습니다.")
 
@@ -103,37 +106,20 @@ def read_tokens(
     payload.pop("access_token", None)
     payload.pop("refresh_token", None)
 
-    return JSONResponse(payload)
+    return ORJSONResponse(payload)
 
 
 @router.get("/auth/google/users")
 def list_users(
     token_storage: TokenStorage = Depends(get_token_storage),
     oauth_service: GoogleOAuthService = Depends(get_oauth_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     oauth_service.ensure_credentials()
 
     accounts = [account.to_dict() for account in token_storage.list_accounts()]
-    return JSONResponse(accounts)
+    return ORJSONResponse(accounts)
 
 
 @router.get("/auth/google/callback/success")
 def success_page() -> HTMLResponse:
-    return HTMLResponse(
-        """
-        <html>
-            <head>
-                <meta charset="utf-8" />
-                <title>Google 인증 완료</title>
-                <style>
-                    body { font-family: sans-serif; padding: 48px; text-align: center; }
-                    h1 { color: #2563eb; }
-                </style>
-            </head>
-            <body>
-                <h1>Google Drive 인증이 완료되었습니다.</h1>
-                <p>이 창은 닫으셔도 됩니다.</p>
-            </body>
-        </html>
-        """,
-    )
+    return HTMLResponse(_SUCCESS_PAGE_BYTES, headers=_SUCCESS_PAGE_HEADERS)
@@ -1,20 +1,19 @@
 from __future__ import annotations
 
-import base64
-import csv
-import io
 import base64
 import csv
 import io
 import json
 import re
+from contextlib import aclosing
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, Sequence, Tuple, TypedDict
 from urllib.parse import quote
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, Response
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from starlette.types import Receive, Scope, Send
 
 from ..dependencies import (
     get_ai_generation_service,
@@ -243,6 +242,20 @@ _REQUIRED_MENU_DOCUMENTS: Dict[str, List[RequiredDocument]] = {
     ],
 }
 
+# menu_id -> doc_id -> (allowed extensions, "PDF, DOCX, ..." label for errors)
+_REQUIRED_DOCUMENT_EXTENSIONS: Dict[str, Dict[str, Tuple[frozenset[str], str]]] = {
+    menu_id: {
+        doc["id"]: (
+            frozenset(ext.lower() for ext in doc.get("allowed_extensions", []) if ext),
+            ", ".join(ext.upper() for ext in doc.get("allowed_extensions", []) if ext),
+        )
+        for doc in docs
+    }
+    for menu_id, docs in _REQUIRED_MENU_DOCUMENTS.items()
+}
+_PROJECT_UPLOAD_EXTENSIONS = frozenset({"docx"})
+_INVICTI_REPORT_EXTENSIONS = frozenset({"html", "htm"})
+
 _TEMPLATE_ROOT = Path(__file__).resolve().parents[2] / "template"
 _DEFECT_REPORT_TEMPLATE = _TEMPLATE_ROOT / "다.수행" / "GS-B-2X-XXXX 결함리포트 v1.0.xlsx"
 _TESTCASE_TEMPLATE = _TEMPLATE_ROOT / "나.설계" / "GS-B-XX-XXXX 테스트케이스.xlsx"
@@ -252,6 +265,11 @@ _STANDARD_TEMPLATE_POPULATORS: Dict[str, tuple[Path, Callable[[bytes, str], byte
 }
 
 
+def _file_extension(filename: Optional[str]) -> str:
+    _, separator, extension = (filename or "").rpartition(".")
+    return extension.lower() if separator else ""
+
+
 def _decode_text(raw: bytes) -> str:
     for encoding in ("utf-8", "cp949"):
         try:
@@ -297,6 +315,18 @@ def _build_attachment_header(filename: str, *, default_filename: str = "security
     return f'attachment; filename="{ascii_fallback}"; filename*=UTF-8\'\'{quoted}'
 
 
+class _ClosingStreamingResponse(StreamingResponse):
+    """Close the body iterator even when the client disconnects mid-transfer.
+
+    Starlette abandons the iterator on disconnect, which would keep a relayed
+    Drive download (and its pooled connection) open until garbage collection.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async with aclosing(self.body_iterator):
+            await super().__call__(scope, receive, send)
+
+
 def _build_inline_header(filename: str, *, default_filename: str = "capture.png") -> str:
     ascii_fallback = re.sub(r"[^A-Za-z0-9._-]+", "_", filename)
     if not ascii_fallback or not re.search(r"[A-Za-z0-9]", ascii_fallback):
@@ -517,9 +547,9 @@ async def _collect_defect_report_attachments(
 async def ensure_gs_folder(
     google_id: Optional[str] = Query(None, description="Drive 작업에 사용할 Google 사용자 식별자 (sub)"),
     drive_service: GoogleDriveService = Depends(get_drive_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     result = await drive_service.ensure_drive_setup(google_id)
-    return JSONResponse(result)
+    return ORJSONResponse(result)
 
 
 @router.post("/drive/projects")
@@ -535,7 +565,7 @@ async def create_drive_project(
     invalid_files: List[str] = []
     for upload in files:
         filename = upload.filename or "업로드된 파일"
-        if not filename.lower().endswith(".docx"):
+        if _file_extension(filename) not in _PROJECT_UPLOAD_EXTENSIONS:
             invalid_files.append(filename)
 
     if invalid_files:
@@ -667,7 +697,7 @@ async def generate_project_asset(
         finally:
             await upload.close()
 
-        return JSONResponse(result)
+        return ORJSONResponse(result)
 
     if menu_id == "defect-report" and serialized_rows:
         try:
@@ -740,7 +770,7 @@ async def generate_project_asset(
             "headers": list(drive_defect_reports.DEFECT_REPORT_EXPECTED_HEADERS),
         }
 
-        return JSONResponse(payload)
+        return ORJSONResponse(payload)
 
     if menu_id == "security-report":
         if metadata_entries:
@@ -748,8 +778,7 @@ async def generate_project_asset(
         if len(uploads) != 1:
             raise HTTPException(status_code=422, detail="Invicti HTML 결과 파일을 1개 업로드해 주세요.")
         upload = uploads[0]
-        filename = (upload.filename or "invicti-report").lower()
-        if not filename.endswith(".html") and not filename.endswith(".htm"):
+        if _file_extension(upload.filename) not in _INVICTI_REPORT_EXTENSIONS:
             raise HTTPException(status_code=422, detail="Invicti HTML 결과 파일만 업로드할 수 있습니다.")
 
         result = await security_report_service.generate_csv_report(
@@ -800,6 +829,7 @@ async def generate_project_asset(
             )
 
         required_docs_by_id = {doc["id"]: doc for doc in required_docs}
+        extensions_by_id = _REQUIRED_DOCUMENT_EXTENSIONS.get(menu_id, {})
         for upload, entry in zip(uploads, metadata_entries):
             if entry.get("role") != "required":
                 continue
@@ -809,20 +839,11 @@ async def generate_project_asset(
                 raise HTTPException(status_code=422, detail="알 수 없는 필수 문서 유형입니다.")
 
             doc_info = required_docs_by_id[doc_id]
-            allowed_extensions = [
-                ext.lower()
-                for ext in doc_info.get("allowed_extensions", [])
-                if isinstance(ext, str) and ext
-            ]
+            allowed_extensions, allowed_text = extensions_by_id[doc_id]
             if not allowed_extensions:
                 continue
 
-            extension = ""
-            if upload.filename and "." in upload.filename:
-                extension = upload.filename.rsplit(".", 1)[-1].lower()
-
-            if extension not in allowed_extensions:
-                allowed_text = ", ".join(ext.upper() for ext in allowed_extensions)
+            if _file_extension(upload.filename) not in allowed_extensions:
                 label = doc_info.get("label", doc_id)
                 filename = upload.filename or label
                 raise HTTPException(
@@ -906,7 +927,7 @@ async def generate_project_asset(
             "headers": list(drive_defect_reports.DEFECT_REPORT_EXPECTED_HEADERS),
         }
 
-        return JSONResponse(payload)
+        return ORJSONResponse(payload)
 
     result = await ai_generation_service.generate_csv(
         project_id=project_id,
@@ -939,7 +960,7 @@ async def generate_project_asset(
         if getattr(result, "filename", None):
             payload["generatedFilename"] = result.filename
 
-        return JSONResponse(payload)
+        return ORJSONResponse(payload)
 
     if menu_id in _STANDARD_TEMPLATE_POPULATORS:
         template_path, populate_template = _STANDARD_TEMPLATE_POPULATORS[menu_id]
@@ -1051,7 +1072,7 @@ async def generate_project_asset(
             "headers": list(drive_defect_reports.DEFECT_REPORT_EXPECTED_HEADERS),
         }
 
-        return JSONResponse(payload)
+        return ORJSONResponse(payload)
 
 
     headers = {
@@ -1101,7 +1122,7 @@ async def download_configuration_image(
     configuration_image_service: ConfigurationImageService = Depends(
         get_configuration_image_service
     ),
-) -> Response:
+) -> StreamingResponse:
     payload = await configuration_image_service.download_file(
         project_id=project_id,
         google_id=google_id,
@@ -1109,8 +1130,8 @@ async def download_configuration_image(
     )
 
     file_name = str(payload.get("fileName", file_id))
-    content = payload.get("content")
-    if not isinstance(content, (bytes, bytearray)):
+    stream = payload.get("stream")
+    if stream is None:
         raise HTTPException(status_code=500, detail="파일을 다운로드하지 못했습니다. 다시 시도해 주세요.")
     media_type = str(payload.get("mimeType") or "application/octet-stream")
 
@@ -1119,7 +1140,7 @@ async def download_configuration_image(
         "Content-Disposition": _build_inline_header(file_name, default_filename="capture.png"),
     }
 
-    return Response(content=bytes(content), media_type=media_type, headers=headers)
+    return _ClosingStreamingResponse(stream, media_type=media_type, headers=headers)
 
 
 @router.get("/drive/projects/{project_id}/feature-list")
@@ -1354,67 +1375,7 @@ def _build_feature_list_context(rows: Sequence[Dict[str, str]], *, limit: int =
 
 async def _extract_feature_list_context(upload: UploadFile) -> str:
     filename = upload.filename or "feature-list"
-    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
-    content = await _read_upload_bytes(upload)
-
-    if not content:
-        raise HTTPException(status_code=422, detail="업로드된 기능리스트 파일이 비어 있습니다.")
-
-    rows: List[Dict[str, str]] = []
-
-    if extension in {"xlsx", "xlsm"}:
-        try:
-            _, _, _, parsed_rows = drive_feature_lists.parse_feature_list_workbook(content)
-            rows = _normalize_feature_list_records(parsed_rows)
-        except HTTPException:
-            raise
-        except Exception as exc:  # pragma: no cover - 안전망
-            raise HTTPException(
-                status_code=422,
-                detail="기능리스트 엑셀 파일을 해석하는 중 오류가 발생했습니다.",
-            ) from exc
-    elif extension == "xls":
-        rows = _decode_feature_list_xls(content)
-    elif extension == "csv":
-        rows = _normalize_feature_list_records(_decode_feature_list_csv(content))
-    else:
-        raise HTTPException(
-            status_code=422,
-            detail="지원하지 않는 기능리스트 파일 형식입니다. XLSX, XLS 또는 CSV 파일을 업로드해 주세요.",
-        )
-
-    if not rows:
-        raise HTTPException(status_code=422, detail="기능리스트에서 항목을 찾을 수 없습니다.")
-
-    return _build_feature_list_context(rows)
-
-
-def _build_feature_list_context(rows: Sequence[Dict[str, str]], *, limit: int = 40) -> str:
-    lines: List[str] = []
-    total = len(rows)
-    for idx, row in enumerate(rows[:limit], start=1):
-        major = str(row.get("majorCategory", "") or "").strip()
-        middle = str(row.get("middleCategory", "") or "").strip()
-        minor = str(row.get("minorCategory", "") or "").strip()
-        description = str(row.get("featureDescription", "") or "").strip()
-
-        categories = [part for part in [major, middle, minor] if part]
-        if categories and description:
-            lines.append(f"{idx}. {' | '.join(categories)}: {description}")
-        elif description:
-            lines.append(f"{idx}. {description}")
-        elif categories:
-            lines.append(f"{idx}. {' | '.join(categories)}")
-
-    if total > limit:
-        lines.append(f"… (총 {total}개 기능 중 상위 {limit}개 항목만 요약했습니다.)")
-
-    return "\n".join(lines)
-
-
-async def _extract_feature_list_context(upload: UploadFile) -> str:
-    filename = upload.filename or "feature-list"
-    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    extension = _file_extension(filename)
     content = await _read_upload_bytes(upload)
 
     if not content:
@@ -1455,7 +1416,7 @@ async def prepare_testcase_feature_list(
     ),
 ) -> TestcaseFeatureListResponse:
     filename = feature_list_file.filename or "feature-list"
-    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    extension = _file_extension(filename)
     content = await _read_upload_bytes(feature_list_file)
 
     rows: List[Dict[str, str]] = []
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict
-
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from ..dependencies import (
     get_prompt_config_service,
@@ -18,36 +17,38 @@ router = APIRouter(prefix="/admin/prompts", tags=["prompt-config"])
 def list_prompt_request_logs(
     limit: int = Query(5, ge=1, le=5, description="가져올 로그 수"),
     log_service: PromptRequestLogService = Depends(get_prompt_request_log_service),
-) -> Dict[str, list[dict[str, str]]]:
+) -> ORJSONResponse:
     entries = log_service.list_recent(limit=limit)
-    return {"logs": [entry.to_dict() for entry in entries]}
+    return ORJSONResponse({"logs": [entry.to_dict() for entry in entries]})
 
 
-@router.get("", response_model=None)
+@router.get("")
 def list_prompt_configs(
     prompt_service: PromptConfigService = Depends(get_prompt_config_service),
-) -> Dict[str, Dict[str, Dict]]:
+) -> ORJSONResponse:
     configs = prompt_service.list_configs()
     defaults = prompt_service.get_defaults()
-    return {
-        "current": {
-            key: config.model_dump(mode="json", by_alias=True)
-            for key, config in configs.items()
-        },
-        "defaults": defaults,
-    }
+    return ORJSONResponse(
+        {
+            "current": {
+                key: config.model_dump(mode="json", by_alias=True)
+                for key, config in configs.items()
+            },
+            "defaults": defaults,
+        }
+    )
 
 
 @router.get("/{menu_id}")
 def get_prompt_config(
     menu_id: str,
     prompt_service: PromptConfigService = Depends(get_prompt_config_service),
-) -> Dict[str, Dict]:
+) -> ORJSONResponse:
     try:
         config = prompt_service.get_config(menu_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="알 수 없는 메뉴입니다.") from exc
-    return {"config": config.model_dump(mode="json", by_alias=True)}
+    return ORJSONResponse({"config": config.model_dump(mode="json", by_alias=True)})
 
 
 @router.put("/{menu_id}")
@@ -55,20 +56,12 @@ def update_prompt_config(
     menu_id: str,
     payload: PromptConfig,
     prompt_service: PromptConfigService = Depends(get_prompt_config_service),
-) -> Dict[str, Dict]:
+) -> ORJSONResponse:
     try:
         updated = prompt_service.update_config(
             menu_id, payload.model_dump(mode="json", by_alias=True)
         )
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="알 수 없는 메뉴입니다.") from exc
-    return {"config": updated.model_dump(mode="json", by_alias=True)}
-
+    return ORJSONResponse({"config": updated.model_dump(mode="json", by_alias=True)})
 
-@router.get("/logs")
-def list_prompt_request_logs(
-    limit: int = Query(5, ge=1, le=5, description="가져올 로그 수"),
-    log_service: PromptRequestLogService = Depends(get_prompt_request_log_service),
-) -> Dict[str, list[dict[str, str]]]:
-    entries = log_service.list_recent(limit=limit)
-    return {"logs": [entry.to_dict() for entry in entries]}
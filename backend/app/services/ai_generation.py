@@ -1,21 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence
+from typing import Any, BinaryIO, Dict, Iterable, List, Literal, Optional, Sequence
 import asyncio
 import csv
-import base64
+import hashlib
 import io
 import json
 import logging
 import mimetypes
 import os
 import re
+import shutil
+import sys
+import tempfile
 import zipfile
 from pathlib import Path
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Literal, Mapping
@@ -32,6 +36,12 @@ from openai import (
     RateLimitError,
 )
 
+try:  # pragma: no cover - optional dependency
+    from openpyxl import load_workbook
+    from openpyxl.utils.datetime import to_excel
+except ImportError:  # pragma: no cover
+    load_workbook = None  # type: ignore[assignment]
+
 from ..config import Settings
 from .excel_templates import TESTCASE_EXPECTED_HEADERS
 from .excel_templates.utils import AI_CSV_DELIMITER
@@ -45,13 +55,93 @@ from .prompt_config import (
 )
 from .prompt_request_log import PromptRequestLogService
 
+# Upper bound on concurrent OpenAI file uploads issued by a single request.
+OPENAI_UPLOAD_CONCURRENCY = 8
+# Number of persistent (never cleaned up) uploads remembered by content hash.
+OPENAI_UPLOAD_CACHE_SIZE = 256
+
+_NUMBERED_ITEM_PATTERN = re.compile(r"(?:^|\n)\s*(\d+)\.(.*?)(?=(?:\n\s*\d+\.)|\Z)", re.S)
+_CSV_FENCE_PATTERN = re.compile(r"```(?:csv)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_JSON_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_UNSAFE_FILENAME_PATTERN = re.compile(r"[^A-Za-z0-9_-]+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_OVERVIEW_COLON_PATTERN = re.compile(r"^(?:프로젝트\s*)?개요\s*[:：\-]\s*(.+)$", re.IGNORECASE)
+_OVERVIEW_FALLBACK_PATTERN = re.compile(r"(?:^|\n)\s*(?:프로젝트\s*)?개요\s*(?:[:：\-]\s*)?(.+)")
+_OVERVIEW_PREFIX_PATTERN = re.compile(r"^(?:프로젝트|프로그램)\s*개요[:：\-]?\s*", re.IGNORECASE)
+_OVERVIEW_SUBJECT_PATTERN = re.compile(r"^이\s*(?:프로그램|프로젝트)\s*는\s*", re.IGNORECASE)
+_TRAILING_PERIOD_PATTERN = re.compile(r"[.。．]+$")
+
+_EXTENSION_ALIASES = {"JPEG": "JPG"}
+_IMAGE_EXTENSIONS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tiff", ".tif", ".heic"}
+)
+
+# Uploads larger than this spill from memory to a temporary file on disk.
+UPLOAD_SPOOL_MAX_SIZE = 1024 * 1024
+_UPLOAD_READ_CHUNK_SIZE = 1024 * 1024
+
 
 @dataclass
 class BufferedUpload:
     name: str
-    content: bytes
+    file: BinaryIO
+    size: int
     content_type: str | None
 
+    @classmethod
+    def from_bytes(
+        cls, *, name: str, content: bytes, content_type: str | None
+    ) -> "BufferedUpload":
+        return cls(
+            name=name,
+            file=io.BytesIO(content),
+            size=len(content),
+            content_type=content_type,
+        )
+
+    @classmethod
+    async def from_upload_file(cls, upload: UploadFile, *, name: str) -> "BufferedUpload":
+        """Copy ``upload`` into a spooled temporary file in fixed-size chunks.
+
+        The whole copy runs in one worker thread instead of awaiting
+        ``UploadFile.read`` once per chunk.
+        """
+
+        content_type = upload.content_type
+        spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE)
+        try:
+            await asyncio.to_thread(
+                shutil.copyfileobj, upload.file, spool, _UPLOAD_READ_CHUNK_SIZE
+            )
+        except BaseException:
+            spool.close()
+            raise
+        size = spool.tell()
+        spool.seek(0)
+        return cls(name=name, file=spool, size=size, content_type=content_type)
+
+    @property
+    def content(self) -> bytes:
+        return self.open().read()
+
+    def open(self) -> BinaryIO:
+        """Return the underlying file rewound to the start."""
+
+        self.file.seek(0)
+        return self.file
+
+    def in_memory(self) -> "BufferedUpload":
+        """Return a copy that stays readable after this upload is closed."""
+
+        return BufferedUpload.from_bytes(
+            name=self.name, content=self.content, content_type=self.content_type
+        )
+
+    def close(self) -> None:
+        """Release the underlying file, removing any spilled temporary file."""
+
+        self.file.close()
+
 
 @dataclass
 class GeneratedCsv:
@@ -130,35 +220,32 @@ class AIGenerationService:
         settings: Settings,
         prompt_config_service: PromptConfigService | None = None,
         request_log_service: PromptRequestLogService | None = None,
+        *,
+        openai_client: OpenAI,
     ):
         self._settings = settings
         if prompt_config_service is None:
             storage_path = settings.tokens_path.with_name("prompt_configs.json")
             prompt_config_service = PromptConfigService(storage_path)
         self._prompt_config_service = prompt_config_service
-        self._client: OpenAI | None = None
+        self._client = openai_client
         self._request_log_service = request_log_service
-
-    def _get_client(self) -> OpenAI:
-        if self._client is None:
-            api_key = self._settings.openai_api_key
-            if not api_key:
-                raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되어 있지 않습니다.")
-            self._client = OpenAI(api_key=api_key)
-        return self._client
+        self._upload_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
 
     @staticmethod
     def _descriptor_from_context(
         context: UploadContext,
     ) -> tuple[str, str | None, bool, Dict[str, Any]]:
-        metadata = context.metadata or {}
-        role = str(metadata.get("role") or "").strip()
-        label = str(
-            metadata.get("label") or metadata.get("description") or ""
-        ).strip()
-        description = str(metadata.get("description") or "").strip()
-        notes = str(metadata.get("notes") or "").strip()
-        source_path = str(metadata.get("source_path") or "").strip()
+        ctx_metadata = context.metadata or {}
+        raw_role, raw_label, raw_description, raw_notes, raw_source_path, raw_id = map(
+            ctx_metadata.get,
+            ("role", "label", "description", "notes", "source_path", "id"),
+        )
+        role = str(raw_role or "").strip()
+        label = str(raw_label or raw_description or "").strip()
+        description = str(raw_description or "").strip()
+        notes = str(raw_notes or "").strip()
+        source_path = str(raw_source_path or "").strip()
 
         extension = AIGenerationService._extension(context.upload)
 
@@ -173,11 +260,9 @@ class AIGenerationService:
         if extension:
             descriptor = f"{descriptor} ({extension})"
 
-        doc_id = (
-            str(metadata.get("id")) if role == "required" and metadata.get("id") else None
-        )
+        doc_id = str(raw_id) if role == "required" and raw_id else None
 
-        include_in_attachment_list = bool(metadata.get("show_in_attachment_list", True))
+        include_in_attachment_list = bool(ctx_metadata.get("show_in_attachment_list", True))
         preview_metadata: Dict[str, Any] = {
             "label": label or context.upload.name,
             "description": description,
@@ -196,8 +281,7 @@ class AIGenerationService:
         elif upload.content_type:
             subtype = upload.content_type.split("/")[-1]
             extension = subtype.upper()
-        mapping = {"JPEG": "JPG"}
-        return mapping.get(extension, extension)
+        return _EXTENSION_ALIASES.get(extension, extension)
 
     @staticmethod
     def _attachment_kind(upload: BufferedUpload) -> Literal["file", "image"]:
@@ -205,18 +289,7 @@ class AIGenerationService:
         if content_type.startswith("image/"):
             return "image"
 
-        extension = os.path.splitext(upload.name)[1].lower()
-        if extension in {
-            ".png",
-            ".jpg",
-            ".jpeg",
-            ".gif",
-            ".bmp",
-            ".webp",
-            ".tiff",
-            ".tif",
-            ".heic",
-        }:
+        if os.path.splitext(upload.name)[1].lower() in _IMAGE_EXTENSIONS:
             return "image"
 
         return "file"
@@ -262,7 +335,7 @@ class AIGenerationService:
         stem = Path(upload.name).stem or "document"
         new_name = f"{stem}.pdf"
 
-        return BufferedUpload(
+        return BufferedUpload.from_bytes(
             name=new_name,
             content=pdf_bytes,
             content_type="application/pdf",
@@ -287,26 +360,18 @@ class AIGenerationService:
         if not contexts:
             return ""
 
+        labels = [context.metadata.get("label") or context.descriptor for context in contexts]
+        label_by_id: Dict[str, str] = {}
+        for context, label in zip(contexts, labels):
+            if context.doc_id:
+                # Keep the first context per doc_id, matching the original scan order.
+                label_by_id.setdefault(context.doc_id, label)
+
         def describe(preferred_ids: List[str]) -> str:
-            ordered: List[str] = []
-            for doc_id in preferred_ids:
-                match = next(
-                    (
-                        context.metadata.get("label")
-                        or context.descriptor
-                        for context in contexts
-                        if context.doc_id == doc_id
-                    ),
-                    None,
-                )
-                if match:
-                    ordered.append(match)
+            ordered = [label_by_id[doc_id] for doc_id in preferred_ids if label_by_id.get(doc_id)]
             if len(ordered) == len(preferred_ids):
                 return ", ".join(ordered)
-            return ", ".join(
-                context.metadata.get("label") or context.descriptor
-                for context in contexts
-            )
+            return ", ".join(labels)
 
         if menu_id == "feature-list":
             description = describe(["user-manual", "configuration", "vendor-feature-list"])
@@ -316,9 +381,7 @@ class AIGenerationService:
             description = describe(["user-manual", "configuration", "vendor-feature-list"])
             return description
 
-        return ", ".join(
-            context.metadata.get("label") or context.descriptor for context in contexts
-        )
+        return ", ".join(labels)
 
     @staticmethod
     def _build_context_previews(
@@ -343,15 +406,49 @@ class AIGenerationService:
             )
         return previews
 
-    async def _upload_openai_file(self, client: OpenAI, context: UploadContext) -> str:
+    async def _upload_openai_file(
+        self,
+        client: OpenAI,
+        context: UploadContext,
+        *,
+        semaphore: asyncio.Semaphore | None = None,
+        purpose: Literal["assistants", "vision"] = "assistants",
+        reuse: bool = False,
+    ) -> str:
+        """Upload ``context`` and return its OpenAI file_id.
+
+        With ``reuse`` the upload is keyed by its SHA-256 digest, and a file
+        uploaded earlier with the same content and purpose is returned instead
+        of uploading again. Only pass it for files that are never cleaned up.
+        """
+
         upload = context.upload
-        stream = io.BytesIO(upload.content)
+        cache_key: tuple[str, str] | None = None
+        if reuse:
+            digest = await asyncio.to_thread(hashlib.file_digest, upload.open(), "sha256")
+            cache_key = (digest.hexdigest(), purpose)
+            cached_id = self._upload_cache.get(cache_key)
+            if cached_id is not None:
+                if await self._openai_file_exists(client, cached_id):
+                    self._upload_cache.move_to_end(cache_key)
+                    return cached_id
+                self._upload_cache.pop(cache_key, None)
+
+        stream = upload.open()
         try:
-            created = await asyncio.to_thread(
-                client.files.create,
-                file=(upload.name, stream),
-                purpose="assistants",
-            )
+            if semaphore is None:
+                created = await asyncio.to_thread(
+                    client.files.create,
+                    file=(upload.name, stream),
+                    purpose=purpose,
+                )
+            else:
+                async with semaphore:
+                    created = await asyncio.to_thread(
+                        client.files.create,
+                        file=(upload.name, stream),
+                        purpose=purpose,
+                    )
         except (APIError, OpenAIError) as exc:
             raise HTTPException(
                 status_code=502,
@@ -380,20 +477,87 @@ class AIGenerationService:
                 detail="OpenAI 파일 업로드 응답에 file_id가 없습니다.",
             )
 
+        if cache_key is not None:
+            self._upload_cache[cache_key] = file_id
+            while len(self._upload_cache) > OPENAI_UPLOAD_CACHE_SIZE:
+                self._upload_cache.popitem(last=False)
+
         return file_id
 
+    @staticmethod
+    async def _openai_file_exists(client: OpenAI, file_id: str) -> bool:
+        try:
+            await asyncio.to_thread(client.files.retrieve, file_id)
+        except Exception:  # pragma: no cover - 캐시 검증 실패 시 재업로드
+            return False
+        return True
+
+    async def _prepare_attachments(
+        self,
+        client: OpenAI,
+        contexts: Sequence[UploadContext],
+        file_records: List[tuple[str, bool]],
+    ) -> List[AttachmentMetadata]:
+        """Upload every context concurrently and return attachments in order.
+
+        Images are uploaded with the ``vision`` purpose and referenced by
+        file_id, like documents, rather than inlined as base64 data URLs. Every
+        successful upload is appended to ``file_records`` before any failure is
+        re-raised so callers can still clean it up.
+        """
+
+        kinds = [self._attachment_kind(context.upload) for context in contexts]
+        semaphore = asyncio.Semaphore(OPENAI_UPLOAD_CONCURRENCY)
+        results = await asyncio.gather(
+            *(
+                self._upload_openai_file(
+                    client,
+                    context,
+                    semaphore=semaphore,
+                    purpose="vision" if kind == "image" else "assistants",
+                    reuse=bool((context.metadata or {}).get("skip_cleanup")),
+                )
+                for context, kind in zip(contexts, kinds)
+            ),
+            return_exceptions=True,
+        )
+
+        attachments: List[AttachmentMetadata] = []
+        first_error: BaseException | None = None
+        for context, kind, result in zip(contexts, kinds, results):
+            if isinstance(result, BaseException):
+                first_error = first_error or result
+                continue
+            metadata_entry = context.metadata or {}
+            file_records.append((result, bool(metadata_entry.get("skip_cleanup"))))
+            attachments.append({"file_id": result, "kind": kind})
+
+        if first_error is not None:
+            raise first_error
+
+        return attachments
+
     async def _cleanup_openai_files(
         self, client: OpenAI, file_records: Iterable[tuple[str, bool]]
     ) -> None:
-        for file_id, skip_cleanup in file_records:
-            if skip_cleanup:
-                continue
-            try:
+        file_ids = [file_id for file_id, skip_cleanup in file_records if not skip_cleanup]
+        if not file_ids:
+            return
+
+        semaphore = asyncio.Semaphore(OPENAI_UPLOAD_CONCURRENCY)
+
+        async def delete(file_id: str) -> None:
+            async with semaphore:
                 await asyncio.to_thread(client.files.delete, file_id=file_id)
-            except Exception as exc:  # pragma: no cover - 로그 목적
+
+        results = await asyncio.gather(
+            *(delete(file_id) for file_id in file_ids), return_exceptions=True
+        )
+        for file_id, result in zip(file_ids, results):
+            if isinstance(result, Exception):  # pragma: no cover - 로그 목적
                 logger.warning(
                     "Failed to delete temporary OpenAI file",
-                    extra={"file_id": file_id, "error": str(exc)},
+                    extra={"file_id": file_id, "error": str(result)},
                 )
 
     async def formalize_defect_notes(
@@ -406,7 +570,7 @@ class AIGenerationService:
         if not entries:
             raise HTTPException(status_code=422, detail="정제할 결함 항목이 없습니다.")
 
-        client = self._get_client()
+        client = self._client
         system_prompt = (
             "당신은 소프트웨어 시험 결과를 정리하는 품질 보증 문서 작성자입니다. "
             "사용자가 제공한 비격식 표현을 공문서에 적합한 격식 있는 문장으로 다듬어야 합니다."
@@ -510,12 +674,7 @@ class AIGenerationService:
             raise HTTPException(status_code=502, detail="OpenAI 응답에서 번호 목록을 찾을 수 없습니다.")
 
         polished_by_index: Dict[int, str] = {}
-        numbered_pattern = re.compile(
-            r"(?:^|\n)\s*(\d+)\.(.*?)(?=(?:\n\s*\d+\.)|\Z)",
-            re.S,
-        )
-
-        for match in numbered_pattern.finditer(response_text):
+        for match in _NUMBERED_ITEM_PATTERN.finditer(response_text):
             index_str, body = match.groups()
             try:
                 index_value = int(index_str)
@@ -607,7 +766,7 @@ class AIGenerationService:
 
         user_prompt = "\n\n".join(prompt_parts)
 
-        client = self._get_client()
+        client = self._client
         messages = [
             OpenAIMessageBuilder.text_message("system", system_prompt),
             OpenAIMessageBuilder.text_message("user", user_prompt),
@@ -682,7 +841,10 @@ class AIGenerationService:
     @staticmethod
     def _sanitize_csv(text: str) -> str:
         cleaned = text.strip()
-        fence_match = re.search(r"```(?:csv)?\s*(.*?)```", cleaned, re.DOTALL | re.IGNORECASE)
+        if "```" not in cleaned:
+            # Most responses come back unfenced; skip the DOTALL regex scan.
+            return cleaned
+        fence_match = _CSV_FENCE_PATTERN.search(cleaned)
         if fence_match:
             cleaned = fence_match.group(1).strip()
         return cleaned
@@ -690,7 +852,7 @@ class AIGenerationService:
     @staticmethod
     def _sanitize_json(text: str) -> str:
         cleaned = text.strip()
-        fence_match = re.search(r"```(?:json)?\s*(.*?)```", cleaned, re.DOTALL | re.IGNORECASE)
+        fence_match = _JSON_FENCE_PATTERN.search(cleaned)
         if fence_match:
             cleaned = fence_match.group(1).strip()
         return cleaned
@@ -710,51 +872,37 @@ class AIGenerationService:
         normalized_count = max(1, min(5, scenario_count))
         buffered_uploads: List[BufferedUpload] = []
         metadata_entries: List[Dict[str, Any]] = []
+        uploaded_records: List[tuple[str, bool]] = []
 
-        for index, upload in enumerate(attachments, start=1):
-            try:
-                content = await upload.read()
-            finally:
-                await upload.close()
-
-            name = upload.filename or f"attachment-{index}"
-            buffered_uploads.append(
-                BufferedUpload(
-                    name=name,
-                    content=content,
-                    content_type=upload.content_type,
+        try:
+            for index, upload in enumerate(attachments, start=1):
+                try:
+                    buffered_uploads.append(
+                        await BufferedUpload.from_upload_file(
+                            upload, name=upload.filename or f"attachment-{index}"
+                        )
+                    )
+                finally:
+                    await upload.close()
+
+                metadata_entries.append(
+                    {
+                        "label": f"{minor_category or '소분류'} 참고 자료 {index}",
+                        "role": "additional",
+                    }
                 )
-            )
-            metadata_entries.append(
-                {
-                    "label": f"{minor_category or '소분류'} 참고 자료 {index}",
-                    "role": "additional",
-                }
-            )
 
-        contexts: List[UploadContext] = [
-            UploadContext(upload=upload, metadata=metadata)
-            for upload, metadata in zip(buffered_uploads, metadata_entries)
-        ]
+            contexts: List[UploadContext] = [
+                UploadContext(upload=upload, metadata=metadata)
+                for upload, metadata in zip(buffered_uploads, metadata_entries)
+            ]
 
-        client = self._get_client()
-        uploaded_records: List[tuple[str, bool]] = []
-        attachments_payload: List[AttachmentMetadata] = []
+            client = self._client
+            attachments_payload: List[AttachmentMetadata] = []
 
-        try:
-            for context in contexts:
-                kind = self._attachment_kind(context.upload)
-                if kind == "image":
-                    attachments_payload.append(
-                        {
-                            "kind": "image",
-                            "image_url": self._image_data_url(context.upload),
-                        }
-                    )
-                else:
-                    file_id = await self._upload_openai_file(client, context)
-                    uploaded_records.append((file_id, False))
-                    attachments_payload.append({"kind": kind, "file_id": file_id})
+            attachments_payload.extend(
+                await self._prepare_attachments(client, contexts, uploaded_records)
+            )
 
             feature_lines = [
                 f"대분류: {major_category or '-'}",
@@ -897,6 +1045,8 @@ class AIGenerationService:
         finally:
             if uploaded_records:
                 await self._cleanup_openai_files(client, uploaded_records)
+            for buffered_upload in buffered_uploads:
+                buffered_upload.close()
 
     async def rewrite_testcase_scenarios(
         self,
@@ -1020,7 +1170,7 @@ class AIGenerationService:
 
         messages.append(OpenAIMessageBuilder.text_message("user", user_prompt))
 
-        client = self._get_client()
+        client = self._client
 
         try:
             response = await asyncio.to_thread(
@@ -1223,7 +1373,7 @@ class AIGenerationService:
 
         user_prompt = "\n".join(user_prompt_parts)
 
-        client = self._get_client()
+        client = self._client
         messages = [
             OpenAIMessageBuilder.text_message("system", TESTCASE_FINALIZE_SYSTEM_PROMPT),
             OpenAIMessageBuilder.text_message("user", user_prompt),
@@ -1273,7 +1423,7 @@ class AIGenerationService:
 
         encoded = sanitized.encode("utf-8-sig")
         timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        safe_project = re.sub(r"[^A-Za-z0-9_-]+", "_", project_id)
+        safe_project = _UNSAFE_FILENAME_PATTERN.sub("_", project_id)
         filename = f"{safe_project}_testcase_workflow_{timestamp}.csv"
 
         return GeneratedCsv(
@@ -1312,18 +1462,14 @@ class AIGenerationService:
 
             if project_overview is None and row:
                 first_cell = row[0].lstrip("\ufeff").strip()
-                colon_match = re.match(
-                    r"^(?:프로젝트\s*)?개요\s*[:：\-]\s*(.+)$",
-                    first_cell,
-                    re.IGNORECASE,
-                )
+                colon_match = _OVERVIEW_COLON_PATTERN.match(first_cell)
                 if colon_match:
                     candidate = colon_match.group(1).strip()
                     if candidate:
                         project_overview = candidate
                         continue
 
-                normalized_key = re.sub(r"\s+", "", first_cell.lower())
+                normalized_key = _WHITESPACE_PATTERN.sub("", first_cell.lower())
                 if normalized_key in {"프로젝트개요", "개요"}:
                     remainder = next((cell for cell in row[1:] if cell), "").strip()
                     if remainder:
@@ -1335,10 +1481,7 @@ class AIGenerationService:
             rows_to_keep.append(raw_row)
 
         if project_overview is None:
-            fallback_match = re.search(
-                r"(?:^|\n)\s*(?:프로젝트\s*)?개요\s*(?:[:：\-]\s*)?(.+)",
-                csv_text,
-            )
+            fallback_match = _OVERVIEW_FALLBACK_PATTERN.search(csv_text)
             if fallback_match:
                 project_overview = fallback_match.group(1).strip()
 
@@ -1366,11 +1509,11 @@ class AIGenerationService:
             if not text:
                 return ""
 
-            text = re.sub(r"^(?:프로젝트|프로그램)\s*개요[:：\-]?\s*", "", text, flags=re.IGNORECASE)
+            text = _OVERVIEW_PREFIX_PATTERN.sub("", text)
             text = text.replace("\r", " ").replace("\n", " ")
-            text = re.sub(r"\s+", " ", text).strip()
-            text = re.sub(r"^이\s*(?:프로그램|프로젝트)\s*는\s*", "", text, flags=re.IGNORECASE)
-            text = re.sub(r"[.。．]+$", "", text).strip()
+            text = _WHITESPACE_PATTERN.sub(" ", text).strip()
+            text = _OVERVIEW_SUBJECT_PATTERN.sub("", text)
+            text = _TRAILING_PERIOD_PATTERN.sub("", text).strip()
 
             replacements = [
                 ("입니다", ""),
@@ -1411,7 +1554,7 @@ class AIGenerationService:
                     candidate = str(entry.get(key, "") or "").strip()
                     if not candidate:
                         continue
-                    normalized = re.sub(r"\s+", " ", candidate)
+                    normalized = _WHITESPACE_PATTERN.sub(" ", candidate)
                     if normalized and normalized not in seen:
                         seen.add(normalized)
                         ordered.append(normalized)
@@ -1423,7 +1566,7 @@ class AIGenerationService:
             return "주요 업무를 지원하는"
 
         def _compose_sentence(descriptor: str) -> str:
-            descriptor = re.sub(r"\s+", " ", descriptor).strip()
+            descriptor = _WHITESPACE_PATTERN.sub(" ", descriptor).strip()
             if not descriptor:
                 descriptor = "주요 업무를 지원하는"
 
@@ -1443,7 +1586,7 @@ class AIGenerationService:
                 body = f"{descriptor} 프로그램"
 
             sentence = f"이 프로그램은 {body}이다."
-            sentence = re.sub(r"\s+", " ", sentence).strip()
+            sentence = _WHITESPACE_PATTERN.sub(" ", sentence).strip()
             if not sentence.endswith("."):
                 sentence += "."
             return sentence
@@ -1456,7 +1599,7 @@ class AIGenerationService:
                     raw_value = entry.get(key, "")
                     if not raw_value:
                         continue
-                    candidate = re.sub(r"\s+", " ", str(raw_value).strip())
+                    candidate = _WHITESPACE_PATTERN.sub(" ", str(raw_value).strip())
                     if not candidate:
                         continue
                     if candidate in seen:
@@ -1581,7 +1724,7 @@ class AIGenerationService:
         original: BufferedUpload, rows: List[List[str]]
     ) -> BufferedUpload:
         pdf_bytes = AIGenerationService._rows_to_pdf(rows)
-        return BufferedUpload(
+        return BufferedUpload.from_bytes(
             name=AIGenerationService._pdf_file_name(original.name),
             content=pdf_bytes,
             content_type="application/pdf",
@@ -1687,58 +1830,58 @@ class AIGenerationService:
         if not uploads:
             raise HTTPException(status_code=422, detail="업로드된 자료가 없습니다. 파일을 추가해 주세요.")
 
-        buffered: List[BufferedUpload] = []
-        for upload in uploads:
-            try:
-                data = await upload.read()
-                name = upload.filename or "업로드된_파일"
-                buffered.append(
-                    BufferedUpload(
-                        name=name,
-                        content=data,
-                        content_type=upload.content_type,
-                    )
-                )
-            finally:
-                await upload.close()
-
-        metadata_entries: List[Dict[str, Any]] = []
-        if metadata:
-            metadata_entries = [
-                dict(entry) if isinstance(entry, dict) else {}
-                for entry in metadata
-            ]
+        # Spooled copies of the uploads; closed once the request is finished.
+        received: List[BufferedUpload] = []
+        uploaded_file_records: List[tuple[str, bool]] = []
 
-        buffered = self._convert_required_documents_to_pdf(
-            buffered, metadata_entries
-        )
+        try:
+            for upload in uploads:
+                try:
+                    received.append(
+                        await BufferedUpload.from_upload_file(
+                            upload, name=upload.filename or "업로드된_파일"
+                        )
+                    )
+                finally:
+                    await upload.close()
+
+            metadata_entries: List[Dict[str, Any]] = []
+            if metadata:
+                metadata_entries = [
+                    dict(entry) if isinstance(entry, dict) else {}
+                    for entry in metadata
+                ]
+
+            buffered = self._convert_required_documents_to_pdf(
+                received, metadata_entries
+            )
 
-        defect_prompt_section: str | None = None
-        defect_summary_entries: List[DefectSummaryEntry] | None = None
-        defect_image_map: Dict[int, List[BufferedUpload]] = {}
+            defect_prompt_section: str | None = None
+            defect_summary_entries: List[DefectSummaryEntry] | None = None
+            defect_image_map: Dict[int, List[BufferedUpload]] = {}
 
-        contexts: List[UploadContext] = []
-        for index, upload in enumerate(buffered):
-            entry = metadata_entries[index] if index < len(metadata_entries) else None
-            contexts.append(UploadContext(upload=upload, metadata=entry))
+            contexts: List[UploadContext] = []
+            for index, upload in enumerate(buffered):
+                entry = metadata_entries[index] if index < len(metadata_entries) else None
+                contexts.append(UploadContext(upload=upload, metadata=entry))
 
-        contexts.extend(
-            self._builtin_attachment_contexts(menu_id, prompt_config.builtin_contexts)
-        )
+            # Template loading parses XLSX and renders PDFs; keep it off the event loop.
+            builtin_contexts = await asyncio.to_thread(
+                self._builtin_attachment_contexts, menu_id, prompt_config.builtin_contexts
+            )
+            contexts.extend(builtin_contexts)
 
-        if menu_id == "defect-report":
-            (
-                contexts,
-                defect_prompt_section,
-                defect_summary_entries,
-                defect_image_map,
-            ) = self._prepare_defect_report_contexts(contexts, prompt_config)
+            if menu_id == "defect-report":
+                (
+                    contexts,
+                    defect_prompt_section,
+                    defect_summary_entries,
+                    defect_image_map,
+                ) = self._prepare_defect_report_contexts(contexts, prompt_config)
 
-        client = self._get_client()
-        uploaded_file_records: List[tuple[str, bool]] = []
-        uploaded_attachments: List[AttachmentMetadata] = []
+            client = self._client
+            uploaded_attachments: List[AttachmentMetadata] = []
 
-        try:
             context_previews = self._build_context_previews(contexts)
             context_summary = self._context_summary(menu_id, context_previews)
 
@@ -1764,25 +1907,9 @@ class AIGenerationService:
                 line for line in descriptor_lines if line.strip()
             )
 
-            for context in contexts:
-                kind = self._attachment_kind(context.upload)
-                if kind == "image":
-                    image_url = self._image_data_url(context.upload)
-                    uploaded_attachments.append(
-                        {
-                            "kind": "image",
-                            "image_url": image_url,
-                        }
-                    )
-                    continue
-
-                file_id = await self._upload_openai_file(client, context)
-                metadata_entry = context.metadata or {}
-                skip_cleanup = bool(metadata_entry.get("skip_cleanup"))
-                uploaded_file_records.append((file_id, skip_cleanup))
-                uploaded_attachments.append(
-                    {"file_id": file_id, "kind": kind}
-                )
+            uploaded_attachments.extend(
+                await self._prepare_attachments(client, contexts, uploaded_file_records)
+            )
 
             user_prompt_parts: List[str] = []
 
@@ -1965,7 +2092,7 @@ class AIGenerationService:
 
             encoded = sanitized.encode("utf-8-sig")
             timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-            safe_project = re.sub(r"[^A-Za-z0-9_-]+", "_", project_id)
+            safe_project = _UNSAFE_FILENAME_PATTERN.sub("_", project_id)
             filename = f"{safe_project}_{menu_id}_{timestamp}.csv"
 
             return GeneratedCsv(
@@ -1973,12 +2100,21 @@ class AIGenerationService:
                 content=encoded,
                 csv_text=sanitized,
                 defect_summary=defect_summary_entries,
-                defect_images=dict(defect_image_map) if defect_image_map else None,
+                defect_images=(
+                    {
+                        index: [image.in_memory() for image in images]
+                        for index, images in defect_image_map.items()
+                    }
+                    if defect_image_map
+                    else None
+                ),
                 project_overview=project_overview,
             )
         finally:
             if uploaded_file_records:
                 await self._cleanup_openai_files(client, uploaded_file_records)
+            for upload in received:
+                upload.close()
 
     @staticmethod
     def _format_openai_error(exc: OpenAIError) -> str:
@@ -2091,20 +2227,6 @@ class AIGenerationService:
 
         return None
 
-    @staticmethod
-    def _image_data_url(upload: BufferedUpload) -> str:
-        media_type = (upload.content_type or "").split(";")[0].strip()
-        if not media_type:
-            guessed, _ = mimetypes.guess_type(upload.name)
-            if guessed:
-                media_type = guessed
-
-        if not media_type:
-            media_type = "application/octet-stream"
-
-        encoded = base64.b64encode(upload.content).decode("ascii")
-        return f"data:{media_type};base64,{encoded}"
-
     def _prepare_defect_report_contexts(
         self, contexts: List[UploadContext], prompt_config: PromptConfig
     ) -> tuple[
@@ -2119,9 +2241,9 @@ class AIGenerationService:
         filtered_contexts: List[UploadContext] = []
 
         for context in contexts:
-            metadata = context.metadata or {}
+            ctx_metadata = context.metadata or {}
             upload = context.upload
-            defect_index_value = metadata.get("defect_index")
+            defect_index_value = ctx_metadata.get("defect_index")
             if defect_index_value is not None:
                 try:
                     defect_index = int(defect_index_value)
@@ -2498,7 +2620,9 @@ class AIGenerationService:
             return self._load_xlsx_as_pdf(menu_id, source_path, builtin.label)
 
         try:
-            content = source_path.read_bytes()
+            content = self._builtin_file_bytes(
+                str(source_path), source_path.stat().st_mtime_ns
+            )
         except FileNotFoundError as exc:
             logger.error(
                 "내장 컨텍스트 파일을 찾을 수 없습니다.",
@@ -2535,16 +2659,37 @@ class AIGenerationService:
         else:
             content_type = guessed_type or "application/octet-stream"
 
-        return BufferedUpload(
+        return BufferedUpload.from_bytes(
             name=source_path.name,
             content=content,
             content_type=content_type,
         )
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _builtin_file_bytes(path: str, mtime_ns: int) -> bytes:
+        """Read a built-in attachment once per file version."""
+
+        return Path(path).read_bytes()
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _xlsx_template_pdf_bytes(path: str, mtime_ns: int) -> bytes:
+        """Render a built-in XLSX template to PDF, memoized per file version.
+
+        ``mtime_ns`` is only part of the cache key so an edited template is
+        picked up without a restart.
+        """
+
+        rows = AIGenerationService._parse_xlsx_rows(Path(path).read_bytes())
+        return AIGenerationService._rows_to_pdf(rows)
+
     @staticmethod
     def _load_xlsx_as_pdf(menu_id: str, template_path: Path, label: str) -> BufferedUpload:
         try:
-            content = template_path.read_bytes()
+            pdf_bytes = AIGenerationService._xlsx_template_pdf_bytes(
+                str(template_path), template_path.stat().st_mtime_ns
+            )
         except FileNotFoundError as exc:
             logger.error(
                 "내장 XLSX 템플릿을 찾을 수 없습니다.",
@@ -2572,9 +2717,6 @@ class AIGenerationService:
                 status_code=500,
                 detail="내장 XLSX 템플릿을 읽는 중 오류가 발생했습니다.",
             ) from exc
-
-        try:
-            rows = AIGenerationService._parse_xlsx_rows(content)
         except ValueError as exc:
             logger.error(
                 "내장 XLSX 템플릿을 PDF로 변환하는 중 오류가 발생했습니다.",
@@ -2590,9 +2732,8 @@ class AIGenerationService:
                 detail="내장 XLSX 템플릿을 PDF로 변환하는 중 오류가 발생했습니다.",
             ) from exc
 
-        pdf_bytes = AIGenerationService._rows_to_pdf(rows)
-
-        return BufferedUpload(
+        # Each caller gets its own BytesIO over the shared immutable bytes.
+        return BufferedUpload.from_bytes(
             name=template_path.with_suffix(".pdf").name,
             content=pdf_bytes,
             content_type="application/pdf",
@@ -2615,23 +2756,22 @@ class AIGenerationService:
         if not lines:
             lines = [""]
 
-        def _escape(text: str) -> str:
-            encoded = ("\ufeff" + text).encode("utf-16-be")
-            return "".join(f"\\{byte:03o}" for byte in encoded)
+        def _hex(text: str) -> bytes:
+            # PDF hex strings take two digits per byte and need no escaping.
+            return ("\ufeff" + text).encode("utf-16-be").hex().upper().encode("ascii")
 
-        content_lines = [
-            "BT",
-            "/F1 11 Tf",
-            "1 0 0 1 72 770 Tm",
-            "14 TL",
+        content_lines: List[bytes] = [
+            b"BT",
+            b"/F1 11 Tf",
+            b"1 0 0 1 72 770 Tm",
+            b"14 TL",
         ]
         for line in lines:
-            escaped = _escape(line)
-            content_lines.append(f"({escaped}) Tj")
-            content_lines.append("T*")
-        content_lines.append("ET")
+            content_lines.append(b"<" + _hex(line) + b"> Tj")
+            content_lines.append(b"T*")
+        content_lines.append(b"ET")
 
-        content_stream = "\n".join(content_lines).encode("utf-8")
+        content_stream = b"\n".join(content_lines)
 
         objects: List[bytes] = [
             b"<< /Type /Catalog /Pages 2 0 R >>",
@@ -2671,68 +2811,130 @@ class AIGenerationService:
 
     @staticmethod
     def _parse_xlsx_rows(content: bytes) -> List[List[str]]:
+        if load_workbook is None:
+            return AIGenerationService._parse_xlsx_rows_from_xml(content)
+
+        try:
+            workbook = load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+        except Exception as exc:
+            raise ValueError("잘못된 XLSX 형식입니다.") from exc
+
+        try:
+            if not workbook.worksheets:
+                raise ValueError("기본 시트를 찾을 수 없습니다.")
+            epoch = workbook.epoch
+            rows: List[List[str]] = []
+            for values in workbook.worksheets[0].iter_rows(values_only=True):
+                row_values = [
+                    AIGenerationService._xlsx_cell_text(value, epoch) for value in values
+                ]
+                while row_values and not row_values[-1]:
+                    row_values.pop()
+                # Rows without any value have no ``<row>`` element in the sheet XML.
+                if row_values:
+                    rows.append(row_values)
+            return rows
+        except ValueError:
+            raise
+        except Exception as exc:
+            raise ValueError("시트 XML을 해석할 수 없습니다.") from exc
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _xlsx_cell_text(value: Any, epoch: datetime) -> str:
+        """Render an openpyxl value as the text stored in the sheet XML.
+
+        Dates become Excel serial numbers and booleans ``1``/``0``, matching
+        :meth:`_parse_xlsx_rows_from_xml`.
+        """
+
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        if isinstance(value, (datetime, date, time, timedelta)):
+            value = to_excel(value, epoch)
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    @staticmethod
+    def _parse_xlsx_rows_from_xml(content: bytes) -> List[List[str]]:
         try:
             archive = zipfile.ZipFile(io.BytesIO(content))
         except zipfile.BadZipFile as exc:
             raise ValueError("잘못된 XLSX 형식입니다.") from exc
 
+        namespace = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+        row_tag = f"{{{namespace['main']}}}row"
+        cell_tag = f"{{{namespace['main']}}}c"
+
         with archive:
             shared_strings = AIGenerationService._read_shared_strings(archive)
+            rows: List[List[str]] = []
             try:
                 with archive.open("xl/worksheets/sheet1.xml") as sheet_file:
-                    tree = ET.parse(sheet_file)
+                    # Stream the sheet row by row and drop each row once read,
+                    # so large sheets never materialise as a full DOM.
+                    for _, row_elem in ET.iterparse(sheet_file, events=("end",)):
+                        if row_elem.tag != row_tag:
+                            continue
+                        row_values: List[str] = []
+                        for cell_elem in row_elem.iter(cell_tag):
+                            column_index = AIGenerationService._column_index_from_ref(cell_elem.get("r"))
+                            value = AIGenerationService._extract_cell_value(cell_elem, shared_strings, namespace)
+                            # Cells are stored in column order, so the common case is a
+                            # plain append; only sparse rows need padding.
+                            if column_index is None or column_index == len(row_values):
+                                row_values.append(value)
+                                continue
+                            while len(row_values) <= column_index:
+                                row_values.append("")
+                            row_values[column_index] = value
+                        rows.append(row_values)
+                        row_elem.clear()
             except KeyError as exc:
                 raise ValueError("기본 시트를 찾을 수 없습니다.") from exc
             except ET.ParseError as exc:
                 raise ValueError("시트 XML을 해석할 수 없습니다.") from exc
 
-            namespace = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-            root = tree.getroot()
-            sheet_data = root.find("main:sheetData", namespace)
-            if sheet_data is None:
-                return []
-
-            rows: List[List[str]] = []
-            for row_elem in sheet_data.findall("main:row", namespace):
-                row_values: List[str] = []
-                for cell_elem in row_elem.findall("main:c", namespace):
-                    column_index = AIGenerationService._column_index_from_ref(cell_elem.get("r"))
-                    value = AIGenerationService._extract_cell_value(cell_elem, shared_strings, namespace)
-                    if column_index is None:
-                        column_index = len(row_values)
-                    while len(row_values) <= column_index:
-                        row_values.append("")
-                    row_values[column_index] = value
-                rows.append(row_values)
-
             return rows
 
     @staticmethod
     def _read_shared_strings(archive: zipfile.ZipFile) -> List[str]:
+        main_ns = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+        si_tag = f"{main_ns}si"
+        text_tag = f"{main_ns}t"
+
+        strings: List[str] = []
         try:
             with archive.open("xl/sharedStrings.xml") as handle:
-                tree = ET.parse(handle)
+                for _, elem in ET.iterparse(handle, events=("end",)):
+                    if elem.tag != si_tag:
+                        continue
+                    # Intern so repeated categorical values share one object
+                    # across sheets and cached template renders.
+                    strings.append(
+                        sys.intern("".join(node.text or "" for node in elem.iter(text_tag)))
+                    )
+                    elem.clear()
         except KeyError:
             return []
         except ET.ParseError as exc:
             raise ValueError("공유 문자열 XML을 해석할 수 없습니다.") from exc
-
-        namespace = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-        strings: List[str] = []
-        root = tree.getroot()
-        for si in root.findall("main:si", namespace):
-            text_parts = [node.text or "" for node in si.findall(".//main:t", namespace)]
-            strings.append("".join(text_parts))
         return strings
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _column_index_from_ref(ref: str | None) -> int | None:
+        # Cell refs repeat the same few columns on every row, so the cache
+        # hit rate is close to 100% on real sheets.
         if not ref:
             return None
-        match = re.match(r"([A-Z]+)", ref)
-        if not match:
+        letters = ref.rstrip("0123456789")
+        if not letters or not letters.isascii() or not letters.isalpha() or not letters.isupper():
             return None
-        letters = match.group(1)
         index = 0
         for letter in letters:
             index = index * 26 + (ord(letter) - ord("A") + 1)
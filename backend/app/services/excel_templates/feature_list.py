@@ -4,6 +4,7 @@ import csv
 import io
 import re
 import zipfile
+from functools import lru_cache
 from typing import Dict, List, Mapping, Sequence, Tuple
 from xml.etree import ElementTree as ET
 
@@ -77,6 +78,7 @@ for canonical, variants in _FEATURE_LIST_HEADER_ALIASES.items():
             _FEATURE_LIST_NORMALIZED_HEADERS[normalized] = canonical
 
 
+@lru_cache(maxsize=256)
 def match_feature_list_header(value: str) -> str | None:
     normalized = _normalize_feature_header_token(value)
     if not normalized:
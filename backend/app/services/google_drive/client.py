@@ -1,26 +1,183 @@
 """Low level Google Drive HTTP client with token management."""
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+import random
+import secrets
+import time
+from collections import OrderedDict
+from email.parser import BytesParser
+from urllib.parse import quote
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import httpx
+import orjson
 from fastapi import HTTPException
 
 from ...config import Settings
 from ...token_store import StoredTokens, TokenStorage
 from ..oauth import GOOGLE_TOKEN_ENDPOINT
+from .concurrency import run_concurrently
 
 logger = logging.getLogger(__name__)
 
 DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
 DRIVE_FILES_ENDPOINT = "/files"
 DRIVE_UPLOAD_BASE = "https://www.googleapis.com/upload/drive/v3"
+DRIVE_BATCH_ENDPOINT = "https://www.googleapis.com/batch/drive/v3"
+# Drive rejects batch requests with more than 100 parts.
+DRIVE_BATCH_MAX_REQUESTS = 100
 DRIVE_FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
 GOOGLE_SHEETS_MIME_TYPE = "application/vnd.google-apps.spreadsheet"
 XLSX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Separate budgets so a slow handshake cannot eat a transfer's read/write time.
+DRIVE_REQUEST_TIMEOUT = httpx.Timeout(10.0, connect=5.0, pool=5.0)
+DRIVE_TRANSFER_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=60.0, pool=5.0)
+# Drive's maximum page size for files.list; fewer pages means fewer round trips.
+DRIVE_LIST_PAGE_SIZE = 1000
+# Transient Drive failures (rate limits, 5xx) are retried with exponential
+# backoff plus jitter, honouring ``Retry-After`` up to the cap.
+DRIVE_MAX_ATTEMPTS = 4
+DRIVE_RETRY_BASE_DELAY = 0.5
+DRIVE_RETRY_MAX_DELAY = 10.0
+_TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+# Parallel transfers per bulk call; keeps one user under Drive's write quota.
+DRIVE_TRANSFER_CONCURRENCY = 4
+# Child folder listings are reused for a short while; folders created or
+# deleted through this client invalidate them immediately.
+CHILD_FOLDER_CACHE_TTL_SECONDS = 60.0
+CHILD_FOLDER_CACHE_SIZE = 256
+# Drive search query templates, filled with ``str.format_map``.
+_ROOT_FOLDER_QUERY = f"name = '{{name}}' and mimeType = '{DRIVE_FOLDER_MIME_TYPE}' and trashed = false"
+_CHILD_FOLDERS_QUERY = f"'{{parent_id}}' in parents and mimeType = '{DRIVE_FOLDER_MIME_TYPE}' and trashed = false"
+_CHILD_FILES_QUERY = "'{parent_id}' in parents and trashed = false"
+_MIME_TYPE_CLAUSE = " and mimeType = '{mime_type}'"
+_QUERY_ESCAPES = str.maketrans({"\\": "\\\\", "'": "\\'"})
+# Refresh slightly ahead of the real expiry so in-flight requests don't race it.
+TOKEN_EXPIRY_MARGIN_SECONDS = 60.0
+
+
+def _wall_time() -> float:
+    return time.time()
+
+
+async def _retry_sleep(delay: float) -> None:
+    await asyncio.sleep(delay)
+
+
+_RATE_LIMIT_REASONS = frozenset({"userRateLimitExceeded", "rateLimitExceeded"})
+
+
+def _is_rate_limited(response: httpx.Response) -> bool:
+    return _is_rate_limited_reply(response.status_code, response.content)
+
+
+def _is_rate_limited_reply(status_code: int, content: bytes) -> bool:
+    if status_code == 429:
+        return True
+    if status_code != 403:
+        return False
+
+    # Drive reports per-user quota as 403 with ``error.errors[*].reason``.
+    try:
+        payload = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return False
+    error = payload.get("error") if isinstance(payload, dict) else None
+    errors = error.get("errors") if isinstance(error, dict) else None
+    if not isinstance(errors, list):
+        return False
+    return any(
+        isinstance(item, dict) and item.get("reason") in _RATE_LIMIT_REASONS
+        for item in errors
+    )
+
+
+def _escape_query_value(value: str) -> str:
+    """Escape a string literal for a Drive ``q`` search expression."""
+
+    return value.translate(_QUERY_ESCAPES)
+
+
+def _retry_delay(
+    response: httpx.Response, attempt: int, *, rate_limit_only: bool = False
+) -> Optional[float]:
+    """Seconds to wait before retrying ``response``, or ``None`` if it is final.
+
+    ``rate_limit_only`` restricts retries to responses Drive rejected before
+    doing any work, for requests that are not safe to repeat after a 5xx.
+    """
+
+    if not _is_rate_limited(response) and (
+        rate_limit_only or response.status_code not in _TRANSIENT_STATUS_CODES
+    ):
+        return None
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), DRIVE_RETRY_MAX_DELAY)
+    return _backoff_delay(attempt)
+
+
+def _backoff_delay(attempt: int) -> float:
+    delay = DRIVE_RETRY_BASE_DELAY * 2**attempt + random.uniform(0, DRIVE_RETRY_BASE_DELAY)
+    return min(delay, DRIVE_RETRY_MAX_DELAY)
+
+
+def _file_content_request(file_id: str, mime_type: Optional[str]) -> Tuple[str, Dict[str, str]]:
+    """Return the URL and params that download ``file_id``'s content.
+
+    Google Sheets have no binary content of their own and are exported as XLSX.
+    """
+
+    if mime_type == GOOGLE_SHEETS_MIME_TYPE:
+        return f"{DRIVE_API_BASE}{DRIVE_FILES_ENDPOINT}/{file_id}/export", {"mimeType": XLSX_MIME_TYPE}
+    return f"{DRIVE_API_BASE}{DRIVE_FILES_ENDPOINT}/{file_id}", {"alt": "media"}
+
+
+def _multipart_related_body(
+    metadata: Dict[str, Any], content: bytes, content_type: str
+) -> Tuple[bytes, str]:
+    """Encode a Drive ``uploadType=multipart`` body once, outside any retry loop.
+
+    Returns the body and the matching ``Content-Type`` header value.
+    """
+
+    boundary = f"upload_{secrets.token_hex(16)}"
+    delimiter = f"--{boundary}\r\n".encode("ascii")
+    body = b"".join(
+        (
+            delimiter,
+            b"Content-Type: application/json; charset=UTF-8\r\n\r\n",
+            orjson.dumps(metadata),
+            b"\r\n",
+            delimiter,
+            f"Content-Type: {content_type}\r\n\r\n".encode("latin-1"),
+            content,
+            f"\r\n--{boundary}--\r\n".encode("ascii"),
+        )
+    )
+    return body, f"multipart/related; boundary={boundary}"
+
+
+class DriveNotFoundError(HTTPException):
+    """Drive answered 404: the file, or the parent folder a request targets, is gone."""
+
+    def __init__(self, detail: str = "Google Drive에서 요청한 폴더나 파일을 찾을 수 없습니다.") -> None:
+        super().__init__(status_code=404, detail=detail)
 
 
 class GoogleDriveClient:
@@ -28,9 +185,24 @@ class GoogleDriveClient:
         self,
         settings: Settings,
         token_storage: TokenStorage,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self._settings = settings
         self._token_storage = token_storage
+        # Pooled client owned by the application lifespan and shared by every
+        # Drive call; when absent (scripts, tests) one is opened lazily and
+        # kept for the running event loop until ``aclose``.
+        self._http_client = http_client
+        self._owned_client: Optional[httpx.AsyncClient] = None
+        self._owned_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_lock = asyncio.Lock()
+        self._latest_tokens: Dict[str, StoredTokens] = {}
+        # google_id -> (access_token, monotonic expiry deadline); recomputed
+        # whenever the account's token changes, so there is one entry per account.
+        self._token_deadlines: Dict[str, Tuple[str, float]] = {}
+        # (google_id, parent_id) -> (folders, monotonic expiry), least recently
+        # used first and capped at CHILD_FOLDER_CACHE_SIZE entries.
+        self._child_folder_cache: OrderedDict[Tuple[str, str], Tuple[List[Dict[str, Any]], float]] = OrderedDict()
 
     # Token helpers -----------------------------------------------------
     def load_tokens(self, google_id: Optional[str]) -> StoredTokens:
@@ -55,9 +227,14 @@ class GoogleDriveClient:
         if tokens.expires_in <= 0:
             return False
 
-        expires_at = tokens.saved_at + timedelta(seconds=tokens.expires_in)
-        now = datetime.now(timezone.utc)
-        return now >= expires_at - timedelta(minutes=1)
+        cached = self._token_deadlines.get(tokens.google_id)
+        if cached is not None and cached[0] == tokens.access_token:
+            deadline = cached[1]
+        else:
+            remaining = tokens.expires_at_ts - _wall_time() - TOKEN_EXPIRY_MARGIN_SECONDS
+            deadline = time.monotonic() + remaining
+            self._token_deadlines[tokens.google_id] = (tokens.access_token, deadline)
+        return time.monotonic() >= deadline
 
     async def refresh_access_token(self, tokens: StoredTokens) -> StoredTokens:
         if not tokens.refresh_token:
@@ -70,14 +247,15 @@ class GoogleDriveClient:
             "grant_type": "refresh_token",
         }
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(GOOGLE_TOKEN_ENDPOINT, data=data)
+        response = await self._send(
+            "POST", GOOGLE_TOKEN_ENDPOINT, timeout=DRIVE_REQUEST_TIMEOUT, data=data
+        )
 
         if response.is_error:
             logger.error("Google token refresh failed: %s", response.text)
             raise HTTPException(status_code=502, detail="Google 토큰을 새로고침하지 못했습니다. 다시 로그인해주세요.")
 
-        payload = response.json()
+        payload = orjson.loads(response.content)
         access_token = payload.get("access_token")
         if not isinstance(access_token, str) or not access_token:
             logger.error("Google token refresh response missing access_token: %s", payload)
@@ -102,12 +280,56 @@ class GoogleDriveClient:
             payload=merged_payload,
         )
 
+    async def _refresh_shared(self, tokens: StoredTokens) -> StoredTokens:
+        """Refresh ``tokens`` once even when concurrent calls all need it.
+
+        Callers queued behind an in-flight refresh reuse its result instead of
+        spending another round trip to the token endpoint.
+        """
+
+        async with self._refresh_lock:
+            latest = self._latest_tokens.get(tokens.google_id)
+            if (
+                latest is not None
+                and latest.access_token != tokens.access_token
+                and not self._is_token_expired(latest)
+            ):
+                return latest
+            refreshed = await self.refresh_access_token(tokens)
+            self._latest_tokens[tokens.google_id] = refreshed
+            return refreshed
+
     async def ensure_valid_tokens(self, tokens: StoredTokens) -> StoredTokens:
         if self._is_token_expired(tokens):
-            return await self.refresh_access_token(tokens)
+            return await self._refresh_shared(tokens)
         return tokens
 
     # HTTP plumbing -----------------------------------------------------
+    async def _send(
+        self, method: str, url: str, *, timeout: httpx.Timeout, **kwargs: Any
+    ) -> httpx.Response:
+        """Send one request on the injected pooled client or the fallback one."""
+
+        client = self._http_client or self._fallback_client()
+        return await client.request(method, url, timeout=timeout, **kwargs)
+
+    def _fallback_client(self) -> httpx.AsyncClient:
+        # Pooled connections are bound to the loop that opened them, so a new
+        # loop (e.g. a second ``asyncio.run``) gets a fresh client.
+        loop = asyncio.get_running_loop()
+        if self._owned_client is None or self._owned_loop is not loop:
+            self._owned_client = httpx.AsyncClient(timeout=DRIVE_REQUEST_TIMEOUT, http2=True)
+            self._owned_loop = loop
+        return self._owned_client
+
+    async def aclose(self) -> None:
+        """Close the fallback client; an injected client is left to its owner."""
+
+        if self._owned_client is not None:
+            await self._owned_client.aclose()
+            self._owned_client = None
+            self._owned_loop = None
+
     async def drive_request(
         self,
         tokens: StoredTokens,
@@ -120,36 +342,58 @@ class GoogleDriveClient:
         headers: Optional[Dict[str, str]] = None,
         base_url: str = DRIVE_API_BASE,
     ) -> Tuple[Dict[str, Any], StoredTokens]:
-        active_tokens = tokens
-        for attempt in range(2):
-            auth_headers = {
-                "Authorization": f"Bearer {active_tokens.access_token}",
-                "Accept": "application/json",
-            }
-            if headers:
-                auth_headers.update(headers)
-
-            async with httpx.AsyncClient(timeout=10.0, base_url=base_url) as client:
-                response = await client.request(
+        active_tokens = await self.ensure_valid_tokens(tokens)
+        url = f"{base_url}{path}"
+        auth_headers = {"Accept": "application/json"}
+        # Serialize the JSON body once rather than on every retry attempt.
+        content: Optional[bytes] = None
+        if json_data is not None:
+            content = orjson.dumps(json_data)
+            auth_headers["Content-Type"] = "application/json"
+        if headers:
+            auth_headers.update(headers)
+        retry_transient = method.upper() in _IDEMPOTENT_METHODS
+        refreshed = False
+        for attempt in range(DRIVE_MAX_ATTEMPTS):
+            auth_headers["Authorization"] = f"Bearer {active_tokens.access_token}"
+            response = await self._send(
+                method,
+                url,
+                timeout=DRIVE_REQUEST_TIMEOUT,
+                params=params,
+                content=content,
+                data=data,
+                headers=auth_headers,
+            )
+
+            if response.status_code == 401 and not refreshed:
+                refreshed = True
+                active_tokens = await self._refresh_shared(active_tokens)
+                continue
+
+            delay = _retry_delay(response, attempt, rate_limit_only=not retry_transient)
+            if delay is not None and attempt + 1 < DRIVE_MAX_ATTEMPTS:
+                logger.warning(
+                    "Google Drive request %s %s returned %s; retrying in %.2fs",
                     method,
                     path,
-                    params=params,
-                    json=json_data,
-                    data=data,
-                    headers=auth_headers,
+                    response.status_code,
+                    delay,
                 )
-
-            if response.status_code == 401 and attempt == 0:
-                active_tokens = await self.refresh_access_token(active_tokens)
+                await _retry_sleep(delay)
                 continue
 
+            if response.status_code == 404:
+                logger.warning("Google Drive request %s %s returned 404: %s", method, path, response.text)
+                raise DriveNotFoundError()
+
             if response.is_error:
                 logger.error(
                     "Google Drive request failed: %s %s -> %s", method, path, response.text
                 )
                 raise HTTPException(status_code=502, detail="Google Drive 요청이 실패했습니다. 잠시 후 다시 시도해주세요.")
 
-            payload = response.json() if response.text else {}
+            payload = orjson.loads(response.content) if response.content else {}
             if not isinstance(payload, dict):
                 logger.error("Unexpected Google Drive response type for %s %s: %s", method, path, payload)
                 raise HTTPException(status_code=502, detail="Google Drive 응답을 해석하지 못했습니다.")
@@ -161,10 +405,7 @@ class GoogleDriveClient:
         self, tokens: StoredTokens, *, folder_name: str
     ) -> Tuple[Optional[Dict[str, Any]], StoredTokens]:
         params = {
-            "q": (
-                f"name = '{folder_name}' and mimeType = '{DRIVE_FOLDER_MIME_TYPE}' "
-                "and trashed = false"
-            ),
+            "q": _ROOT_FOLDER_QUERY.format_map({"name": _escape_query_value(folder_name)}),
             "fields": "files(id,name)",
             "pageSize": 1,
             "supportsAllDrives": "true",
@@ -178,7 +419,7 @@ class GoogleDriveClient:
             params=params,
         )
         files = data.get("files")
-        if isinstance(files, Sequence) and files:
+        if isinstance(files, list) and files:
             first = files[0]
             if isinstance(first, dict):
                 return first, updated_tokens
@@ -217,8 +458,205 @@ class GoogleDriveClient:
             path=DRIVE_FILES_ENDPOINT,
             json_data=payload,
         )
+        self._forget_child_folders(parent_id)
         return data, updated_tokens
 
+    async def create_child_folders(
+        self,
+        tokens: StoredTokens,
+        *,
+        names: Sequence[str],
+        parent_id: str,
+    ) -> Tuple[List[Dict[str, Any]], StoredTokens]:
+        """Create sibling folders under ``parent_id`` with one Drive batch request.
+
+        Results are returned in the same order as ``names``.
+        """
+
+        return await self.create_folders(
+            tokens, folders=[(name, parent_id) for name in names]
+        )
+
+    async def create_folders(
+        self,
+        tokens: StoredTokens,
+        *,
+        folders: Sequence[Tuple[str, str]],
+    ) -> Tuple[List[Dict[str, Any]], StoredTokens]:
+        """Create ``(name, parent_id)`` folders using as few batch requests as possible.
+
+        Results are returned in the same order as ``folders``.
+        """
+
+        if len(folders) <= 1:
+            created: List[Dict[str, Any]] = []
+            active_tokens = tokens
+            for name, parent_id in folders:
+                folder, active_tokens = await self.create_child_folder(
+                    active_tokens, name=name, parent_id=parent_id
+                )
+                created.append(folder)
+            return created, active_tokens
+
+        created = []
+        active_tokens = tokens
+        for start in range(0, len(folders), DRIVE_BATCH_MAX_REQUESTS):
+            chunk = folders[start : start + DRIVE_BATCH_MAX_REQUESTS]
+            batch, active_tokens = await self._create_folder_batch(active_tokens, chunk)
+            created.extend(batch)
+        return created, active_tokens
+
+    async def _create_folder_batch(
+        self,
+        tokens: StoredTokens,
+        folders: Sequence[Tuple[str, str]],
+    ) -> Tuple[List[Dict[str, Any]], StoredTokens]:
+        requests = [
+            b"POST /drive/v3/files?fields=id,name,parents\r\n"
+            b"Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            + orjson.dumps(
+                {"name": name, "mimeType": DRIVE_FOLDER_MIME_TYPE, "parents": [parent_id]}
+            )
+            + b"\r\n"
+            for name, parent_id in folders
+        ]
+        responses, active_tokens = await self._send_batch(
+            tokens, requests, description="folder creation"
+        )
+        for _, parent_id in folders:
+            self._forget_child_folders(parent_id)
+
+        created: List[Dict[str, Any]] = []
+        for status, payload in responses:
+            if not 200 <= status < 300:
+                logger.error("Google Drive batch item failed: %s %s", status, payload[:500])
+                raise HTTPException(status_code=502, detail="Google Drive 요청이 실패했습니다. 잠시 후 다시 시도해주세요.")
+            data = orjson.loads(payload or b"{}")
+            if not isinstance(data, dict) or "id" not in data:
+                raise HTTPException(status_code=502, detail="Google Drive 응답을 해석하지 못했습니다.")
+            created.append(data)
+        return created, active_tokens
+
+    async def _send_batch(
+        self,
+        tokens: StoredTokens,
+        requests: Sequence[bytes],
+        *,
+        description: str,
+    ) -> Tuple[List[Tuple[int, bytes]], StoredTokens]:
+        """POST ``requests`` as one ``multipart/mixed`` batch call.
+
+        Each request is the raw HTTP bytes of one part (request line, headers and
+        optional body). Returns ``(status, body)`` per request, in order. Drive
+        rate-limits items individually, so only those items are sent again.
+        """
+
+        results: List[Tuple[int, bytes]] = [(0, b"")] * len(requests)
+        pending = list(range(len(requests)))
+        active_tokens = tokens
+        for attempt in range(DRIVE_MAX_ATTEMPTS):
+            responses, active_tokens = await self._post_batch(
+                active_tokens, [requests[index] for index in pending], description=description
+            )
+            limited: List[int] = []
+            for index, (status, payload) in zip(pending, responses):
+                results[index] = (status, payload)
+                if _is_rate_limited_reply(status, payload):
+                    limited.append(index)
+            if not limited or attempt + 1 == DRIVE_MAX_ATTEMPTS:
+                break
+            delay = _backoff_delay(attempt)
+            logger.warning(
+                "Google Drive batch %s rate limited %s of %s items; retrying in %.2fs",
+                description,
+                len(limited),
+                len(pending),
+                delay,
+            )
+            await _retry_sleep(delay)
+            pending = limited
+        return results, active_tokens
+
+    async def _post_batch(
+        self,
+        tokens: StoredTokens,
+        requests: Sequence[bytes],
+        *,
+        description: str,
+    ) -> Tuple[List[Tuple[int, bytes]], StoredTokens]:
+        boundary = f"batch_{secrets.token_hex(8)}"
+        parts: List[bytes] = []
+        for index, request in enumerate(requests):
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <item{index}>\r\n\r\n".encode("ascii")
+            )
+            parts.append(request)
+        parts.append(f"--{boundary}--\r\n".encode("ascii"))
+        body = b"".join(parts)
+
+        active_tokens = await self.ensure_valid_tokens(tokens)
+        refreshed = False
+        for attempt in range(DRIVE_MAX_ATTEMPTS):
+            response = await self._send(
+                "POST",
+                DRIVE_BATCH_ENDPOINT,
+                timeout=DRIVE_TRANSFER_TIMEOUT,
+                content=body,
+                headers={
+                    "Authorization": f"Bearer {active_tokens.access_token}",
+                    "Content-Type": f"multipart/mixed; boundary={boundary}",
+                },
+            )
+
+            if response.status_code == 401 and not refreshed:
+                refreshed = True
+                active_tokens = await self._refresh_shared(active_tokens)
+                continue
+
+            delay = _retry_delay(response, attempt)
+            if delay is not None and attempt + 1 < DRIVE_MAX_ATTEMPTS:
+                logger.warning(
+                    "Google Drive batch %s returned %s; retrying in %.2fs",
+                    description,
+                    response.status_code,
+                    delay,
+                )
+                await _retry_sleep(delay)
+                continue
+
+            if response.is_error:
+                logger.error("Google Drive batch %s failed: %s", description, response.text)
+                raise HTTPException(status_code=502, detail="Google Drive 요청이 실패했습니다. 잠시 후 다시 시도해주세요.")
+
+            return self._parse_batch_response(response, len(requests)), active_tokens
+
+        raise HTTPException(status_code=401, detail="Google Drive 인증이 만료되었습니다. 다시 로그인해주세요.")
+
+    @staticmethod
+    def _parse_batch_response(response: httpx.Response, expected: int) -> List[Tuple[int, bytes]]:
+        header = f"Content-Type: {response.headers.get('content-type', '')}\r\n\r\n"
+        message = BytesParser().parsebytes(header.encode("latin-1") + response.content)
+        results: Dict[int, Tuple[int, bytes]] = {}
+        for part in message.get_payload() if message.is_multipart() else ():
+            content_id = str(part.get("Content-ID", "")).strip("<>")
+            index_text = content_id.rpartition("item")[2]
+            raw = part.get_payload(decode=True) or b""
+            status_line, _, rest = raw.partition(b"\r\n")
+            _, _, payload = rest.partition(b"\r\n\r\n")
+            status_fields = status_line.split()
+            status = int(status_fields[1]) if len(status_fields) > 1 and status_fields[1].isdigit() else 0
+            if not index_text.isdigit():
+                logger.error("Google Drive batch item without a usable Content-ID: %s", raw[:500])
+                raise HTTPException(status_code=502, detail="Google Drive 응답을 해석하지 못했습니다.")
+            results[int(index_text)] = (status, payload.strip())
+
+        if len(results) != expected:
+            logger.error("Google Drive batch returned %s of %s responses", len(results), expected)
+            raise HTTPException(status_code=502, detail="Google Drive 응답을 해석하지 못했습니다.")
+        return [results[index] for index in range(expected)]
+
     async def upload_file_to_folder(
         self,
         tokens: StoredTokens,
@@ -228,39 +666,44 @@ class GoogleDriveClient:
         content: bytes,
         content_type: Optional[str],
     ) -> Tuple[Dict[str, Any], StoredTokens]:
-        active_tokens = tokens
-        for attempt in range(2):
-            headers = {
-                "Authorization": f"Bearer {active_tokens.access_token}",
-            }
-            metadata = {
-                "name": file_name,
-                "parents": [parent_id],
-            }
-            files = {
-                "metadata": (
-                    "metadata",
-                    json.dumps(metadata),
-                    "application/json; charset=UTF-8",
-                ),
-                "file": (
-                    file_name,
-                    content,
-                    content_type or "application/pdf",
-                ),
-            }
-
-            async with httpx.AsyncClient(timeout=30.0, base_url=DRIVE_UPLOAD_BASE) as client:
-                response = await client.post(
-                    f"{DRIVE_FILES_ENDPOINT}?uploadType=multipart&fields=id,name,parents",
-                    headers=headers,
-                    files=files,
-                )
+        body, body_type = _multipart_related_body(
+            {"name": file_name, "parents": [parent_id]},
+            content,
+            content_type or "application/pdf",
+        )
+        active_tokens = await self.ensure_valid_tokens(tokens)
+        refreshed = False
+        for attempt in range(DRIVE_MAX_ATTEMPTS):
+            response = await self._send(
+                "POST",
+                f"{DRIVE_UPLOAD_BASE}{DRIVE_FILES_ENDPOINT}?uploadType=multipart&fields=id,name,parents",
+                timeout=DRIVE_TRANSFER_TIMEOUT,
+                headers={
+                    "Authorization": f"Bearer {active_tokens.access_token}",
+                    "Content-Type": body_type,
+                },
+                content=body,
+            )
 
-            if response.status_code == 401 and attempt == 0:
-                active_tokens = await self.refresh_access_token(active_tokens)
+            if response.status_code == 401 and not refreshed:
+                refreshed = True
+                active_tokens = await self._refresh_shared(active_tokens)
                 continue
 
+            # A 5xx may already have created the file, so only quota
+            # rejections are retried here.
+            delay = _retry_delay(response, attempt, rate_limit_only=True)
+            if delay is not None and attempt + 1 < DRIVE_MAX_ATTEMPTS:
+                logger.warning(
+                    "Google Drive upload of %s was rate limited; retrying in %.2fs", file_name, delay
+                )
+                await _retry_sleep(delay)
+                continue
+
+            if response.status_code == 404:
+                logger.warning("Google Drive upload target for %s not found: %s", file_name, response.text)
+                raise DriveNotFoundError()
+
             if response.is_error:
                 logger.error("Google Drive file upload failed for %s: %s", file_name, response.text)
                 raise HTTPException(
@@ -268,7 +711,7 @@ class GoogleDriveClient:
                     detail="파일을 Google Drive에 업로드하지 못했습니다. 잠시 후 다시 시도해주세요.",
                 )
 
-            data = response.json()
+            data = orjson.loads(response.content)
             if not isinstance(data, dict) or "id" not in data:
                 logger.error("Google Drive file upload response missing id: %s", data)
                 raise HTTPException(status_code=502, detail="업로드한 파일의 ID를 확인하지 못했습니다. 다시 시도해주세요.")
@@ -277,6 +720,135 @@ class GoogleDriveClient:
 
         raise HTTPException(status_code=401, detail="Google Drive 인증이 만료되었습니다. 다시 로그인해주세요.")
 
+    async def upload_files(
+        self,
+        tokens: StoredTokens,
+        *,
+        parent_id: str,
+        files: Sequence[Tuple[str, bytes, Optional[str]]],
+    ) -> Tuple[List[Dict[str, Any]], StoredTokens]:
+        """Upload ``(file_name, content, content_type)`` entries side by side.
+
+        At most ``DRIVE_TRANSFER_CONCURRENCY`` uploads run at once and results
+        follow the order of ``files``.
+        """
+
+        active_tokens = await self.ensure_valid_tokens(tokens)
+        semaphore = asyncio.Semaphore(DRIVE_TRANSFER_CONCURRENCY)
+
+        async def upload(file_name: str, content: bytes, content_type: Optional[str]) -> Dict[str, Any]:
+            nonlocal active_tokens
+            async with semaphore:
+                data, active_tokens = await self.upload_file_to_folder(
+                    active_tokens,
+                    file_name=file_name,
+                    parent_id=parent_id,
+                    content=content,
+                    content_type=content_type,
+                )
+            return data
+
+        uploaded = await run_concurrently(*(upload(*entry) for entry in files))
+        return uploaded, active_tokens
+
+    async def upload_stream_to_folder(
+        self,
+        tokens: StoredTokens,
+        *,
+        file_name: str,
+        parent_id: str,
+        chunks: AsyncIterable[bytes],
+        size: int,
+        content_type: Optional[str],
+    ) -> Tuple[Dict[str, Any], StoredTokens]:
+        """Upload ``chunks`` through a resumable session without buffering the file."""
+
+        resolved_type = content_type or "application/octet-stream"
+        metadata = {
+            "name": file_name,
+            "parents": [parent_id],
+        }
+        session_body = orjson.dumps(metadata)
+        active_tokens = await self.ensure_valid_tokens(tokens)
+        session_url: Optional[str] = None
+        refreshed = False
+        # Opening a session stores nothing until bytes are sent, so transient
+        # failures here are safe to retry. The PUT itself streams a one-shot
+        # iterator and cannot be replayed.
+        for attempt in range(DRIVE_MAX_ATTEMPTS):
+            response = await self._send(
+                "POST",
+                f"{DRIVE_UPLOAD_BASE}{DRIVE_FILES_ENDPOINT}?uploadType=resumable&fields=id,name,parents",
+                timeout=DRIVE_TRANSFER_TIMEOUT,
+                headers={
+                    "Authorization": f"Bearer {active_tokens.access_token}",
+                    "Content-Type": "application/json; charset=UTF-8",
+                    "X-Upload-Content-Type": resolved_type,
+                    "X-Upload-Content-Length": str(size),
+                },
+                content=session_body,
+            )
+
+            if response.status_code == 401 and not refreshed:
+                refreshed = True
+                active_tokens = await self._refresh_shared(active_tokens)
+                continue
+
+            delay = _retry_delay(response, attempt)
+            if delay is not None and attempt + 1 < DRIVE_MAX_ATTEMPTS:
+                logger.warning(
+                    "Google Drive upload session for %s returned %s; retrying in %.2fs",
+                    file_name,
+                    response.status_code,
+                    delay,
+                )
+                await _retry_sleep(delay)
+                continue
+
+            if response.is_error:
+                logger.error(
+                    "Google Drive upload session failed for %s: %s", file_name, response.text
+                )
+                raise HTTPException(
+                    status_code=502,
+                    detail="파일을 Google Drive에 업로드하지 못했습니다. 잠시 후 다시 시도해주세요.",
+                )
+
+            session_url = response.headers.get("Location")
+            break
+
+        if not session_url:
+            logger.error("Google Drive upload session for %s returned no Location", file_name)
+            raise HTTPException(
+                status_code=502,
+                detail="파일을 Google Drive에 업로드하지 못했습니다. 잠시 후 다시 시도해주세요.",
+            )
+
+        response = await self._send(
+            "PUT",
+            session_url,
+            timeout=DRIVE_TRANSFER_TIMEOUT,
+            headers={
+                "Content-Length": str(size),
+                "Content-Type": resolved_type,
+            },
+            content=chunks,
+        )
+
+        if response.is_error:
+            logger.error("Google Drive file upload failed for %s: %s", file_name, response.text)
+            raise HTTPException(
+                status_code=502,
+                detail="파일을 Google Drive에 업로드하지 못했습니다. 잠시 후 다시 시도해주세요.",
+            )
+
+        data = orjson.loads(response.content)
+        if not isinstance(data, dict) or "id" not in data:
+            logger.error("Google Drive file upload response missing id: %s", data)
+            raise HTTPException(status_code=502, detail="업로드한 파일의 ID를 확인하지 못했습니다. 다시 시도해주세요.")
+
+        return data, active_tokens
+
     async def download_file_content(
         self,
         tokens: StoredTokens,
@@ -284,27 +856,19 @@ class GoogleDriveClient:
         file_id: str,
         mime_type: Optional[str] = None,
     ) -> Tuple[bytes, StoredTokens]:
-        active_tokens = tokens
+        active_tokens = await self.ensure_valid_tokens(tokens)
+        url, params = _file_content_request(file_id, mime_type)
         for attempt in range(2):
-            headers = {
-                "Authorization": f"Bearer {active_tokens.access_token}",
-            }
-            if mime_type == GOOGLE_SHEETS_MIME_TYPE:
-                path = f"{DRIVE_FILES_ENDPOINT}/{file_id}/export"
-                params = {"mimeType": XLSX_MIME_TYPE}
-            else:
-                path = f"{DRIVE_FILES_ENDPOINT}/{file_id}"
-                params = {"alt": "media"}
-
-            async with httpx.AsyncClient(timeout=30.0, base_url=DRIVE_API_BASE) as client:
-                response = await client.get(
-                    path,
-                    params=params,
-                    headers=headers,
-                )
+            response = await self._send(
+                "GET",
+                url,
+                timeout=DRIVE_TRANSFER_TIMEOUT,
+                params=params,
+                headers={"Authorization": f"Bearer {active_tokens.access_token}"},
+            )
 
             if response.status_code == 401 and attempt == 0:
-                active_tokens = await self.refresh_access_token(active_tokens)
+                active_tokens = await self._refresh_shared(active_tokens)
                 continue
 
             if response.is_error:
@@ -318,6 +882,60 @@ class GoogleDriveClient:
 
         raise HTTPException(status_code=401, detail="Google Drive 인증이 만료되었습니다. 다시 로그인해주세요.")
 
+    async def open_file_stream(
+        self,
+        tokens: StoredTokens,
+        *,
+        file_id: str,
+        mime_type: Optional[str] = None,
+    ) -> Tuple[AsyncIterator[bytes], StoredTokens]:
+        """Start downloading ``file_id`` and return an iterator over its body.
+
+        Errors are raised before anything is returned, so callers can still
+        answer with a proper status code. The body is read in
+        ``UPLOAD_CHUNK_SIZE`` pieces and the connection is released when the
+        iterator finishes or is closed; callers that may stop early must close
+        it (``contextlib.aclosing``) rather than leave that to the collector.
+        """
+
+        active_tokens = await self.ensure_valid_tokens(tokens)
+        url, params = _file_content_request(file_id, mime_type)
+        client = self._http_client or self._fallback_client()
+        for attempt in range(2):
+            request = client.build_request(
+                "GET",
+                url,
+                params=params,
+                headers={"Authorization": f"Bearer {active_tokens.access_token}"},
+                timeout=DRIVE_TRANSFER_TIMEOUT,
+            )
+            response = await client.send(request, stream=True)
+
+            if response.status_code == 401 and attempt == 0:
+                await response.aclose()
+                active_tokens = await self._refresh_shared(active_tokens)
+                continue
+
+            if response.is_error:
+                await response.aread()
+                await response.aclose()
+                logger.error("Google Drive file download failed for %s: %s", file_id, response.text)
+                raise HTTPException(
+                    status_code=502,
+                    detail="Google Drive에서 파일을 다운로드하지 못했습니다. 잠시 후 다시 시도해주세요.",
+                )
+
+            async def body(response: httpx.Response = response) -> AsyncIterator[bytes]:
+                try:
+                    async for chunk in response.aiter_bytes(UPLOAD_CHUNK_SIZE):
+                        yield chunk
+                finally:
+                    await response.aclose()
+
+            return body(), active_tokens
+
+        raise HTTPException(status_code=401, detail="Google Drive 인증이 만료되었습니다. 다시 로그인해주세요.")
+
     async def update_file_content(
         self,
         tokens: StoredTokens,
@@ -327,34 +945,23 @@ class GoogleDriveClient:
         content: bytes,
         content_type: str,
     ) -> Tuple[Dict[str, Any], StoredTokens]:
-        active_tokens = tokens
+        body, body_type = _multipart_related_body({"name": file_name}, content, content_type)
+        active_tokens = await self.ensure_valid_tokens(tokens)
         for attempt in range(2):
-            headers = {
-                "Authorization": f"Bearer {active_tokens.access_token}",
-            }
-            metadata = {"name": file_name}
-            files = {
-                "metadata": (
-                    "metadata",
-                    json.dumps(metadata),
-                    "application/json; charset=UTF-8",
-                ),
-                "file": (
-                    file_name,
-                    content,
-                    content_type,
-                ),
-            }
-
-            async with httpx.AsyncClient(timeout=30.0, base_url=DRIVE_UPLOAD_BASE) as client:
-                response = await client.patch(
-                    f"{DRIVE_FILES_ENDPOINT}/{file_id}?uploadType=multipart&fields=id,name,modifiedTime",
-                    headers=headers,
-                    files=files,
-                )
+            response = await self._send(
+                "PATCH",
+                f"{DRIVE_UPLOAD_BASE}{DRIVE_FILES_ENDPOINT}/{file_id}"
+                "?uploadType=multipart&fields=id,name,modifiedTime",
+                timeout=DRIVE_TRANSFER_TIMEOUT,
+                headers={
+                    "Authorization": f"Bearer {active_tokens.access_token}",
+                    "Content-Type": body_type,
+                },
+                content=body,
+            )
 
             if response.status_code == 401 and attempt == 0:
-                active_tokens = await self.refresh_access_token(active_tokens)
+                active_tokens = await self._refresh_shared(active_tokens)
                 continue
 
             if response.is_error:
@@ -364,7 +971,7 @@ class GoogleDriveClient:
                     detail="Google Drive 파일을 업데이트하지 못했습니다. 잠시 후 다시 시도해주세요.",
                 )
 
-            data = response.json()
+            data = orjson.loads(response.content)
             if not isinstance(data, dict) or "id" not in data:
                 logger.error("Google Drive file update response missing id: %s", data)
                 raise HTTPException(status_code=502, detail="업데이트된 파일 정보를 확인하지 못했습니다. 다시 시도해주세요.")
@@ -373,38 +980,92 @@ class GoogleDriveClient:
 
         raise HTTPException(status_code=401, detail="Google Drive 인증이 만료되었습니다. 다시 로그인해주세요.")
 
+    async def _list_files(
+        self,
+        tokens: StoredTokens,
+        *,
+        params: Dict[str, Any],
+    ) -> Tuple[List[Dict[str, Any]], StoredTokens]:
+        """Collect every page of a ``files.list`` query.
+
+        The request for the next page is started as soon as its token is known,
+        so Drive's per-page latency overlaps with processing the current page.
+        """
+
+        async def fetch_page(
+            page_tokens: StoredTokens, page_token: Optional[str]
+        ) -> Tuple[Dict[str, Any], StoredTokens]:
+            page_params = dict(params, pageToken=page_token) if page_token else params
+            return await self.drive_request(
+                page_tokens,
+                method="GET",
+                path=DRIVE_FILES_ENDPOINT,
+                params=page_params,
+            )
+
+        collected: List[Dict[str, Any]] = []
+        active_tokens = await self.ensure_valid_tokens(tokens)
+        pending: Optional[asyncio.Task[Tuple[Dict[str, Any], StoredTokens]]] = asyncio.create_task(
+            fetch_page(active_tokens, None)
+        )
+        try:
+            while pending is not None:
+                data, active_tokens = await pending
+                pending = None
+                next_page_token = data.get("nextPageToken")
+                if isinstance(next_page_token, str) and next_page_token:
+                    pending = asyncio.create_task(fetch_page(active_tokens, next_page_token))
+
+                files = data.get("files")
+                if isinstance(files, list):
+                    collected.extend(item for item in files if isinstance(item, dict))
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        return collected, active_tokens
+
     async def list_child_folders(
         self,
         tokens: StoredTokens,
         *,
         parent_id: str,
     ) -> Tuple[Sequence[Dict[str, Any]], StoredTokens]:
-        query = (
-            f"'{parent_id}' in parents and "
-            f"mimeType = '{DRIVE_FOLDER_MIME_TYPE}' and trashed = false"
-        )
         params = {
-            "q": query,
-            "fields": "files(id,name,createdTime,modifiedTime)",
+            "q": _CHILD_FOLDERS_QUERY.format_map({"parent_id": parent_id}),
+            "fields": "nextPageToken,files(id,name,createdTime,modifiedTime)",
             "orderBy": "name_natural",
             "spaces": "drive",
-            "pageSize": 100,
+            "pageSize": DRIVE_LIST_PAGE_SIZE,
             "supportsAllDrives": "true",
             "includeItemsFromAllDrives": "true",
         }
 
-        data, updated_tokens = await self.drive_request(
-            tokens,
-            method="GET",
-            path=DRIVE_FILES_ENDPOINT,
-            params=params,
+        key = (tokens.google_id, parent_id)
+        cached = self._child_folder_cache.get(key)
+        if cached is not None:
+            if cached[1] > time.monotonic():
+                self._child_folder_cache.move_to_end(key)
+                return [dict(folder) for folder in cached[0]], tokens
+            self._child_folder_cache.pop(key, None)
+
+        folders, updated_tokens = await self._list_files(tokens, params=params)
+        self._child_folder_cache[key] = (
+            [dict(folder) for folder in folders],
+            time.monotonic() + CHILD_FOLDER_CACHE_TTL_SECONDS,
         )
+        while len(self._child_folder_cache) > CHILD_FOLDER_CACHE_SIZE:
+            self._child_folder_cache.popitem(last=False)
+        return folders, updated_tokens
 
-        files = data.get("files")
-        if isinstance(files, Sequence):
-            return files, updated_tokens
+    def _forget_child_folders(self, parent_id: Optional[str] = None) -> None:
+        """Drop cached listings of ``parent_id``, or every listing when omitted."""
 
-        return [], updated_tokens
+        if parent_id is None:
+            self._child_folder_cache.clear()
+            return
+        for key in [key for key in self._child_folder_cache if key[1] == parent_id]:
+            del self._child_folder_cache[key]
 
     async def list_child_files(
         self,
@@ -413,31 +1074,20 @@ class GoogleDriveClient:
         parent_id: str,
         mime_type: Optional[str] = None,
     ) -> Tuple[Sequence[Dict[str, Any]], StoredTokens]:
-        clauses = [f"'{parent_id}' in parents", "trashed = false"]
+        query = _CHILD_FILES_QUERY.format_map({"parent_id": parent_id})
         if mime_type:
-            clauses.append(f"mimeType = '{mime_type}'")
+            query += _MIME_TYPE_CLAUSE.format_map({"mime_type": mime_type})
         params = {
-            "q": " and ".join(clauses),
-            "fields": "files(id,name,mimeType,modifiedTime)",
+            "q": query,
+            "fields": "nextPageToken,files(id,name,mimeType,modifiedTime)",
             "orderBy": "name_natural",
             "spaces": "drive",
-            "pageSize": 100,
+            "pageSize": DRIVE_LIST_PAGE_SIZE,
             "supportsAllDrives": "true",
             "includeItemsFromAllDrives": "true",
         }
 
-        data, updated_tokens = await self.drive_request(
-            tokens,
-            method="GET",
-            path=DRIVE_FILES_ENDPOINT,
-            params=params,
-        )
-
-        files = data.get("files")
-        if isinstance(files, Sequence):
-            return files, updated_tokens
-
-        return [], updated_tokens
+        return await self._list_files(tokens, params=params)
 
     async def find_child_folder_by_name(
         self,
@@ -445,10 +1095,10 @@ class GoogleDriveClient:
         *,
         parent_id: str,
         name: str,
-        matcher: Callable[[str], Tuple[str, ...]],
+        matcher: Callable[[str], FrozenSet[str]],
     ) -> Tuple[Optional[Dict[str, Any]], StoredTokens]:
         folders, updated_tokens = await self.list_child_folders(tokens, parent_id=parent_id)
-        target_variants = set(matcher(name))
+        target_variants = frozenset(matcher(name))
         for folder in folders:
             if not isinstance(folder, dict):
                 continue
@@ -457,7 +1107,7 @@ class GoogleDriveClient:
                 continue
             if folder_name == name:
                 return folder, updated_tokens
-            if target_variants and set(matcher(folder_name)) & target_variants:
+            if target_variants and not target_variants.isdisjoint(matcher(folder_name)):
                 return folder, updated_tokens
         return None, updated_tokens
 
@@ -476,6 +1126,7 @@ class GoogleDriveClient:
         else:
             search_mime_types = (None,)
 
+        stripped_suffix = suffix.strip()
         updated_tokens = tokens
         for candidate_mime in search_mime_types:
             files, updated_tokens = await self.list_child_files(
@@ -488,7 +1139,7 @@ class GoogleDriveClient:
                     continue
                 name = entry.get("name")
                 if isinstance(name, str):
-                    if name.endswith(suffix.strip()) or matcher(name, suffix):
+                    if name.endswith(stripped_suffix) or matcher(name, suffix):
                         return entry, updated_tokens
         return None, updated_tokens
 
@@ -497,27 +1148,27 @@ class GoogleDriveClient:
         tokens: StoredTokens,
         *,
         file_id: str,
+        fields: str = "id,name,mimeType,modifiedTime,parents",
     ) -> Tuple[Optional[Dict[str, Any]], StoredTokens]:
-        active_tokens = tokens
+        active_tokens = await self.ensure_valid_tokens(tokens)
         params = {
-            "fields": "id,name,mimeType,modifiedTime,parents",
+            "fields": fields,
             "supportsAllDrives": "true",
         }
+        url = f"{DRIVE_API_BASE}{DRIVE_FILES_ENDPOINT}/{file_id}"
+        headers = {"Accept": "application/json"}
         for attempt in range(2):
-            headers = {
-                "Authorization": f"Bearer {active_tokens.access_token}",
-                "Accept": "application/json",
-            }
-
-            async with httpx.AsyncClient(timeout=10.0, base_url=DRIVE_API_BASE) as client:
-                response = await client.get(
-                    f"{DRIVE_FILES_ENDPOINT}/{file_id}",
-                    params=params,
-                    headers=headers,
-                )
+            headers["Authorization"] = f"Bearer {active_tokens.access_token}"
+            response = await self._send(
+                "GET",
+                url,
+                timeout=DRIVE_REQUEST_TIMEOUT,
+                params=params,
+                headers=headers,
+            )
 
             if response.status_code == 401 and attempt == 0:
-                active_tokens = await self.refresh_access_token(active_tokens)
+                active_tokens = await self._refresh_shared(active_tokens)
                 continue
 
             if response.status_code == 404:
@@ -530,7 +1181,7 @@ class GoogleDriveClient:
                     detail="Google Drive에서 파일 정보를 불러오지 못했습니다. 잠시 후 다시 시도해주세요.",
                 )
 
-            data = response.json() if response.text else {}
+            data = orjson.loads(response.content) if response.content else {}
             if not isinstance(data, dict):
                 logger.error("Google Drive metadata response malformed for %s: %s", file_id, data)
                 raise HTTPException(
@@ -542,6 +1193,51 @@ class GoogleDriveClient:
 
         raise HTTPException(status_code=401, detail="Google Drive 인증이 만료되었습니다. 다시 로그인해주세요.")
 
+    async def get_file_metadata_many(
+        self,
+        tokens: StoredTokens,
+        *,
+        file_ids: Sequence[str],
+    ) -> Tuple[List[Optional[Dict[str, Any]]], StoredTokens]:
+        """Fetch metadata for ``file_ids`` with batch calls of up to 100 files.
+
+        Results follow ``file_ids``; files Drive cannot find come back as ``None``.
+        """
+
+        if len(file_ids) <= 1:
+            results: List[Optional[Dict[str, Any]]] = []
+            active_tokens = tokens
+            for file_id in file_ids:
+                metadata, active_tokens = await self.get_file_metadata(active_tokens, file_id=file_id)
+                results.append(metadata)
+            return results, active_tokens
+
+        results = []
+        active_tokens = tokens
+        for start in range(0, len(file_ids), DRIVE_BATCH_MAX_REQUESTS):
+            chunk = file_ids[start : start + DRIVE_BATCH_MAX_REQUESTS]
+            requests = [
+                f"GET /drive/v3/files/{quote(file_id, safe='')}"
+                "?fields=id,name,mimeType,modifiedTime,parents&supportsAllDrives=true\r\n\r\n".encode("ascii")
+                for file_id in chunk
+            ]
+            responses, active_tokens = await self._send_batch(
+                active_tokens, requests, description="metadata fetch"
+            )
+            for file_id, (status, payload) in zip(chunk, responses):
+                if status == 404:
+                    results.append(None)
+                    continue
+                data = orjson.loads(payload) if 200 <= status < 300 and payload else None
+                if not isinstance(data, dict):
+                    logger.error("Google Drive metadata fetch failed for %s: %s %s", file_id, status, payload[:500])
+                    raise HTTPException(
+                        status_code=502,
+                        detail="Google Drive에서 파일 정보를 불러오지 못했습니다. 잠시 후 다시 시도해주세요.",
+                    )
+                results.append(data)
+        return results, active_tokens
+
     async def delete_file(
         self,
         tokens: StoredTokens,
@@ -557,24 +1253,6 @@ class GoogleDriveClient:
             path=f"{DRIVE_FILES_ENDPOINT}/{file_id}",
             params=params,
         )
+        # The parent is unknown here and the file may have been a folder.
+        self._forget_child_folders()
         return updated_tokens
-
-    async def find_file_by_name(
-        self,
-        tokens: StoredTokens,
-        *,
-        parent_id: str,
-        name: str,
-        mime_type: Optional[str] = None,
-    ) -> Tuple[Optional[Dict[str, Any]], StoredTokens]:
-        files, updated_tokens = await self.list_child_files(
-            tokens, parent_id=parent_id, mime_type=mime_type
-        )
-        normalized_name = name.strip()
-        for entry in files:
-            if not isinstance(entry, dict):
-                continue
-            file_name = entry.get("name")
-            if isinstance(file_name, str) and file_name.strip() == normalized_name:
-                return entry, updated_tokens
-        return None, updated_tokens
@@ -0,0 +1,24 @@
+"""Structured concurrency helpers shared by the Drive client and services."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, List
+
+__all__ = ["run_concurrently"]
+
+
+async def run_concurrently(*coroutines: Awaitable[Any]) -> List[Any]:
+    """Await ``coroutines`` together and return their results in order.
+
+    Unlike ``asyncio.gather``, a failure or cancellation of the caller cancels
+    the remaining work (e.g. in-flight uploads) instead of letting it finish in
+    the background. The first failure is re-raised as-is so ``HTTPException``
+    still reaches FastAPI.
+    """
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coroutine) for coroutine in coroutines]
+    except ExceptionGroup as errors:
+        raise errors.exceptions[0] from None
+    return [task.result() for task in tasks]
@@ -17,7 +17,7 @@ from ..excel_templates.models import (
     DefectReportImage,
 )
 from ..excel_templates.utils import AI_CSV_DELIMITER
-from .naming import drive_name_matches, looks_like_header_row
+from .naming import find_matching_name, looks_like_header_row, prewarm_drive_name_variants
 
 __all__ = [
     "DEFECT_REPORT_EXPECTED_HEADERS",
@@ -36,6 +36,7 @@ _DEFECT_SHEET_CANDIDATES: Tuple[str, ...] = (
     "defect report",
     "defect_report",
 )
+prewarm_drive_name_variants(_DEFECT_SHEET_CANDIDATES)
 
 _FIELD_KEY_MAP: Dict[str, str] = {
     "순번": "order",
@@ -310,20 +311,12 @@ def parse_defect_report_workbook(workbook_bytes: bytes) -> Tuple[str, int, List[
     start_row = DEFECT_REPORT_START_ROW
     try:
         sheet = workbook.active
-        selected_title = sheet.title
         for candidate in _DEFECT_SHEET_CANDIDATES:
-            matched = False
-            for title in workbook.sheetnames:
-                if drive_name_matches(title, candidate):
-                    try:
-                        sheet = workbook[title]
-                        selected_title = sheet.title
-                        matched = True
-                        break
-                    except KeyError:
-                        continue
-            if matched:
+            title = find_matching_name(workbook.sheetnames, candidate)
+            if title is not None:
+                sheet = workbook[title]
                 break
+        selected_title = sheet.title
 
         sheet_title = selected_title or ""
         max_col = max(len(headers), sheet.max_column or len(headers))
@@ -335,7 +328,7 @@ def parse_defect_report_workbook(workbook_bytes: bytes) -> Tuple[str, int, List[
             sheet.iter_rows(min_row=1, max_col=max_col, values_only=True),
             start=1,
         ):
-            row_values: Sequence[Any] = row if isinstance(row, Sequence) else tuple()
+            row_values: Sequence[Any] = row if isinstance(row, (tuple, list)) else tuple()
             if not any(value is not None for value in row_values):
                 continue
 
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import csv
 import io
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from fastapi import HTTPException
 
@@ -11,9 +12,13 @@ try:  # pragma: no cover - optional dependency
     from openpyxl import load_workbook
 except ImportError:  # pragma: no cover
     load_workbook = None  # type: ignore[assignment]
+try:  # pragma: no cover - optional dependency
+    from python_calamine import CalamineWorkbook
+except ImportError:  # pragma: no cover
+    CalamineWorkbook = None  # type: ignore[assignment]
 from ..excel_templates.models import FEATURE_LIST_EXPECTED_HEADERS
 from ..excel_templates.utils import AI_CSV_DELIMITER
-from .naming import drive_name_matches, looks_like_header_row
+from .naming import find_matching_name, looks_like_header_row, prewarm_drive_name_variants
 from .templates import FEATURE_LIST_SHEET_CANDIDATES, FEATURE_LIST_START_ROW
 
 __all__ = [
@@ -22,112 +27,144 @@ __all__ = [
     "prepare_feature_list_response",
 ]
 
+prewarm_drive_name_variants(FEATURE_LIST_SHEET_CANDIDATES)
 
-def parse_feature_list_workbook(workbook_bytes: bytes) -> Tuple[str, int, List[str], List[Dict[str, str]]]:
-    if load_workbook is None:  # pragma: no cover
-        raise HTTPException(status_code=500, detail="openpyxl 패키지가 필요합니다.")
-    buffer = io.BytesIO(workbook_bytes)
-    try:
-        workbook = load_workbook(buffer, data_only=True)
-    except Exception as exc:  # pragma: no cover - 안전망
-        raise HTTPException(status_code=500, detail="엑셀 파일을 읽는 중 오류가 발생했습니다.") from exc
 
-    headers = list(FEATURE_LIST_EXPECTED_HEADERS)
+def _cell_text(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def _calamine_cell(value: Any) -> Any:
+    # Match openpyxl's values: blank cells are None, whole numbers are ints and
+    # date-formatted cells are datetimes (calamine yields bare dates).
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if type(value) is date:
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def _select_sheet_title(sheet_names: Sequence[str], default: str) -> str:
+    for candidate in FEATURE_LIST_SHEET_CANDIDATES:
+        title = find_matching_name(sheet_names, candidate)
+        if title is not None:
+            return title
+    return default
+
+
+def _extract_feature_rows(
+    rows: Iterable[Sequence[Any]], headers: Sequence[str]
+) -> Tuple[int, List[Dict[str, str]]]:
     extracted_rows: List[Dict[str, str]] = []
-    sheet_title = ""
     start_row = FEATURE_LIST_START_ROW
     header_row_values: Optional[Sequence[Any]] = None
-    column_map: Dict[str, int] = {}
-    try:
-        sheet = workbook.active
-        selected_title = sheet.title
-        for candidate in FEATURE_LIST_SHEET_CANDIDATES:
-            matched = False
-            for title in workbook.sheetnames:
-                if drive_name_matches(title, candidate):
-                    try:
-                        sheet = workbook[title]
-                        selected_title = sheet.title
-                        matched = True
-                        break
-                    except KeyError:
-                        continue
-            if matched:
-                break
-
-        sheet_title = selected_title or ""
-        max_col = max(len(headers), sheet.max_column or len(headers))
-        header_row_index: Optional[int] = None
-        first_data_row_index: Optional[int] = None
-        for idx, row in enumerate(
-            sheet.iter_rows(min_row=1, max_col=max_col, values_only=True),
-            start=1,
-        ):
-            row_values: Sequence[Any] = row if isinstance(row, Sequence) else tuple()
-            if not any(value is not None for value in row_values):
-                continue
+    column_indices: Optional[Tuple[int, ...]] = None
+    # Where each output field sits in ``headers``; resolved once so the row loop
+    # only indexes into lists.
+    field_positions = tuple(
+        headers.index(name) if name in headers else None
+        for name in ("대분류", "중분류", "소분류", "기능 설명", "기능 개요")
+    )
+    header_row_index: Optional[int] = None
+    first_data_row_index: Optional[int] = None
+    for idx, row in enumerate(rows, start=1):
+        row_values: Sequence[Any] = row if isinstance(row, (tuple, list)) else tuple()
+        if not any(value is not None for value in row_values):
+            continue
 
-            if header_row_values is None:
-                normalized = [
-                    str(value).strip() if value is not None else ""
-                    for value in row_values
-                ]
-                if looks_like_header_row(normalized, headers):
-                    header_row_values = normalized
-                    header_row_index = idx
-                    continue
-
-            if header_row_values is None:
+        if header_row_values is None:
+            normalized = [
+                str(value).strip() if value is not None else ""
+                for value in row_values
+            ]
+            if looks_like_header_row(normalized, headers):
+                header_row_values = normalized
+                header_row_index = idx
                 continue
 
-            if first_data_row_index is None:
-                first_data_row_index = idx
+        if header_row_values is None:
+            continue
 
-            if not column_map and header_row_values:
-                for header_name in headers:
-                    try:
-                        column_index = header_row_values.index(header_name)
-                        column_map[header_name] = column_index
-                    except ValueError:
-                        column_map[header_name] = headers.index(header_name)
+        if first_data_row_index is None:
+            first_data_row_index = idx
 
-            if looks_like_header_row(row_values, headers):
-                continue
+        if column_indices is None:
+            column_indices = tuple(
+                header_row_values.index(header_name)
+                if header_name in header_row_values
+                else position
+                for position, header_name in enumerate(headers)
+            )
 
-            row_data: Dict[str, str] = {}
-            has_values = False
-            for header_name in headers:
-                column_index = column_map.get(header_name)
-                cell_value = (
-                    row_values[column_index]
-                    if column_index is not None and column_index < len(row_values)
-                    else None
-                )
-                text = "" if cell_value is None else str(cell_value).strip()
-                if text:
-                    has_values = True
-                row_data[header_name] = text
-
-            if not has_values:
-                continue
+        if looks_like_header_row(row_values, headers):
+            continue
 
-            description = row_data.get("기능 설명", "")
-            if not description:
-                description = row_data.get("기능 개요", "")
-
-            extracted_rows.append(
-                {
-                    "majorCategory": row_data.get("대분류", ""),
-                    "middleCategory": row_data.get("중분류", ""),
-                    "minorCategory": row_data.get("소분류", ""),
-                    "featureDescription": description,
-                }
-            )
+        row_length = len(row_values)
+        texts = [
+            _cell_text(row_values[column_index]) if column_index < row_length else ""
+            for column_index in column_indices
+        ]
+        if not any(texts):
+            continue
+
+        major, middle, minor, description, overview = (
+            texts[position] if position is not None else "" for position in field_positions
+        )
+        extracted_rows.append(
+            {
+                "majorCategory": major,
+                "middleCategory": middle,
+                "minorCategory": minor,
+                "featureDescription": description or overview,
+            }
+        )
+
+    if header_row_index is not None:
+        start_row = header_row_index + 1
+    if first_data_row_index is not None:
+        start_row = first_data_row_index
+    return start_row, extracted_rows
+
+
+def parse_feature_list_workbook(workbook_bytes: bytes) -> Tuple[str, int, List[str], List[Dict[str, str]]]:
+    headers = list(FEATURE_LIST_EXPECTED_HEADERS)
+
+    if CalamineWorkbook is not None:
+        # The Rust reader is much faster than openpyxl for this read-only scan.
+        try:
+            calamine_book = CalamineWorkbook.from_filelike(io.BytesIO(workbook_bytes))
+            sheet_names = list(calamine_book.sheet_names)
+            sheet_title = _select_sheet_title(sheet_names, sheet_names[0] if sheet_names else "")
+            sheet_rows = calamine_book.get_sheet_by_name(sheet_title).to_python(skip_empty_area=False)
+        except Exception as exc:  # pragma: no cover - 안전망
+            raise HTTPException(status_code=500, detail="엑셀 파일을 읽는 중 오류가 발생했습니다.") from exc
+        start_row, extracted_rows = _extract_feature_rows(
+            ([_calamine_cell(value) for value in row] for row in sheet_rows), headers
+        )
+        return sheet_title or "기능리스트", start_row, headers, extracted_rows
+
+    if load_workbook is None:  # pragma: no cover
+        raise HTTPException(status_code=500, detail="openpyxl 패키지가 필요합니다.")
+    buffer = io.BytesIO(workbook_bytes)
+    try:
+        # read_only streams rows from the sheet XML instead of building the
+        # whole cell grid; the single iter_rows pass below fits that mode.
+        workbook = load_workbook(buffer, data_only=True, read_only=True)
+    except Exception as exc:  # pragma: no cover - 안전망
+        raise HTTPException(status_code=500, detail="엑셀 파일을 읽는 중 오류가 발생했습니다.") from exc
 
-        if header_row_index is not None:
-            start_row = header_row_index + 1
-        if first_data_row_index is not None:
-            start_row = first_data_row_index
+    try:
+        sheet = workbook.active
+        selected_title = _select_sheet_title(workbook.sheetnames, sheet.title)
+        if selected_title in workbook.sheetnames:
+            sheet = workbook[selected_title]
+        sheet_title = sheet.title or ""
+        max_col = max(len(headers), sheet.max_column or len(headers))
+        start_row, extracted_rows = _extract_feature_rows(
+            sheet.iter_rows(min_row=1, max_col=max_col, values_only=True), headers
+        )
     finally:
         workbook.close()
 
@@ -139,35 +176,24 @@ def parse_feature_list_workbook(workbook_bytes: bytes) -> Tuple[str, int, List[s
 
 def build_feature_list_rows_csv(rows: Sequence[Dict[str, str]]) -> str:
     output = io.StringIO()
-    writer = csv.DictWriter(
-        output,
-        fieldnames=list(FEATURE_LIST_EXPECTED_HEADERS),
-        lineterminator="\n",
-        delimiter=AI_CSV_DELIMITER,
-    )
-    writer.writeheader()
+    writer = csv.writer(output, lineterminator="\n", delimiter=AI_CSV_DELIMITER)
+    writer.writerow(FEATURE_LIST_EXPECTED_HEADERS)
 
-    has_overview_column = "기능 개요" in FEATURE_LIST_EXPECTED_HEADERS
+    # Columns without a source field (e.g. "기능 개요") are written empty.
+    field_index = {"대분류": 0, "중분류": 1, "소분류": 2, "기능 설명": 3}
+    positions = [field_index.get(header) for header in FEATURE_LIST_EXPECTED_HEADERS]
 
     for row in rows:
-        major = str(row.get("majorCategory", "") or "").strip()
-        middle = str(row.get("middleCategory", "") or "").strip()
-        minor = str(row.get("minorCategory", "") or "").strip()
-        description = str(row.get("featureDescription", "") or "").strip()
-
-        if not any([major, middle, minor, description]):
+        values = (
+            str(row.get("majorCategory", "") or "").strip(),
+            str(row.get("middleCategory", "") or "").strip(),
+            str(row.get("minorCategory", "") or "").strip(),
+            str(row.get("featureDescription", "") or "").strip(),
+        )
+        if not any(values):
             continue
 
-        entry = {
-            "대분류": major,
-            "중분류": middle,
-            "소분류": minor,
-            "기능 설명": description,
-        }
-        if has_overview_column:
-            entry["기능 개요"] = ""
-
-        writer.writerow(entry)
+        writer.writerow([values[position] if position is not None else "" for position in positions])
 
     return output.getvalue()
 
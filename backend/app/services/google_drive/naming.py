@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import re
 import unicodedata
-from typing import Any, Sequence, Tuple
+from functools import lru_cache
+from typing import Any, FrozenSet, Iterable, Optional, Sequence, Tuple
 
 __all__ = [
     "normalize_drive_text",
@@ -11,39 +12,60 @@ __all__ = [
     "strip_drive_extension",
     "strip_drive_version_suffix",
     "drive_name_variants",
+    "prewarm_drive_name_variants",
     "drive_name_matches",
+    "find_matching_name",
     "drive_suffix_matches",
     "looks_like_header_row",
 ]
 
+_MULTISPACE_PATTERN = re.compile(" {2,}")
+# Maps every character ``str.isspace`` (and therefore ``re``'s ``\s``) accepts
+# to a plain space; the last Unicode whitespace code point is U+3000.
+_WHITESPACE_TRANSLATION = {
+    code: " " for code in range(0x3001) if chr(code).isspace() and code != 0x20
+}
+_SQUASH_PATTERN = re.compile(r"[\s._\-()]+")
+_VERSION_SUFFIX_PATTERN = re.compile(r"v\s*\d+(?:[._\-]\d+)*$")
 
+
+# The helpers below are pure and see the same sheet titles, file names and
+# header labels over and over, so their results are memoized.
+@lru_cache(maxsize=2048)
 def normalize_drive_text(value: str) -> str:
-    normalized = unicodedata.normalize("NFKC", value or "")
-    normalized = normalized.replace("\xa0", " ")
-    normalized = normalized.strip().lower()
-    return re.sub(r"\s+", " ", normalized)
+    if not value:
+        return ""
+    # NFKC leaves pure ASCII untouched, which covers most Drive names.
+    normalized = value if value.isascii() else unicodedata.normalize("NFKC", value)
+    normalized = normalized.translate(_WHITESPACE_TRANSLATION).strip()
+    if not normalized.islower():
+        normalized = normalized.lower()
+    if "  " in normalized:
+        normalized = _MULTISPACE_PATTERN.sub(" ", normalized)
+    return normalized
 
 
+@lru_cache(maxsize=2048)
 def squash_drive_text(value: str) -> str:
     if not value:
         return ""
-    return re.sub(r"[\s._\-()]+", "", value)
+    return _SQUASH_PATTERN.sub("", value)
 
 
 def strip_drive_extension(value: str) -> str:
-    if "." in value:
-        return value.rsplit(".", 1)[0]
-    return value
+    head, separator, _ = value.rpartition(".")
+    return head if separator else value
 
 
 def strip_drive_version_suffix(value: str) -> str:
-    return re.sub(r"v\s*\d+(?:[._\-]\d+)*$", "", value).strip()
+    return _VERSION_SUFFIX_PATTERN.sub("", value).strip()
 
 
-def drive_name_variants(value: str) -> Tuple[str, ...]:
+@lru_cache(maxsize=4096)
+def drive_name_variants(value: str) -> FrozenSet[str]:
     normalized = normalize_drive_text(value)
     if not normalized:
-        return tuple()
+        return frozenset()
 
     variants = {normalized}
 
@@ -65,33 +87,64 @@ def drive_name_variants(value: str) -> Tuple[str, ...]:
         if squashed_versionless:
             variants.add(squashed_versionless)
 
-    return tuple(variant for variant in variants if len(variant) >= 2)
+    return frozenset(variant for variant in variants if len(variant) >= 2)
+
+
+def prewarm_drive_name_variants(values: Iterable[str]) -> None:
+    """Populate the variant cache for names known at import time."""
+
+    for value in values:
+        drive_name_variants(value)
+
+
+@lru_cache(maxsize=64)
+def _expected_header_forms(expected: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    normalized = tuple(normalize_drive_text(name) for name in expected)
+    return normalized, tuple(squash_drive_text(name) for name in normalized)
 
 
 def drive_name_matches(value: str, expected: str) -> bool:
-    actual_tokens = set(drive_name_variants(value))
-    expected_tokens = set(drive_name_variants(expected))
+    normalized = normalize_drive_text(value)
+    # Identical names always share their normalized variant (once it is long
+    # enough to count), so skip building the variant sets.
+    if len(normalized) >= 2 and normalized == normalize_drive_text(expected):
+        return True
+
+    actual_tokens = drive_name_variants(value)
+    expected_tokens = drive_name_variants(expected)
     if not actual_tokens or not expected_tokens:
         return False
-    return bool(actual_tokens & expected_tokens)
+    return not expected_tokens.isdisjoint(actual_tokens)
+
+
+def find_matching_name(names: Iterable[str], expected: str) -> Optional[str]:
+    """Return the first of ``names`` that ``drive_name_matches`` ``expected``."""
+
+    expected_tokens = drive_name_variants(expected)
+    if not expected_tokens:
+        return None
+    for name in names:
+        if not expected_tokens.isdisjoint(drive_name_variants(name)):
+            return name
+    return None
 
 
 def drive_suffix_matches(name: str, suffix: str) -> bool:
     if not suffix:
         return False
-    suffix_tokens = set(drive_name_variants(suffix))
+    suffix_tokens = drive_name_variants(suffix)
     if not suffix_tokens:
         return False
 
-    name_tokens = set(drive_name_variants(name))
+    name_tokens = drive_name_variants(name)
     if not name_tokens:
         return False
 
-    for token in name_tokens:
-        for suffix_token in suffix_tokens:
-            if suffix_token and (token.endswith(suffix_token) or suffix_token in token):
-                return True
-    return False
+    # A suffix match is also a substring match, so one containment check per
+    # suffix token against all name variants (joined on a character variants
+    # never contain) covers every pair.
+    joined_tokens = "\x1f".join(name_tokens)
+    return any(suffix_token in joined_tokens for suffix_token in suffix_tokens)
 
 
 def looks_like_header_row(values: Sequence[Any], expected: Sequence[str]) -> bool:
@@ -103,39 +156,36 @@ def looks_like_header_row(values: Sequence[Any], expected: Sequence[str]) -> boo
         for value in values
     ]
     squashed_values = [squash_drive_text(value) for value in normalized_values]
-    normalized_expected = [normalize_drive_text(name) for name in expected]
-    squashed_expected = [squash_drive_text(name) for name in normalized_expected]
+    # Callers pass the same sheet schema for every row.
+    normalized_expected, squashed_expected = _expected_header_forms(tuple(expected))
+    # Exact cell matches are the common case and need no pairwise scan.
+    value_set = frozenset(normalized_values)
+    # Squashed text never contains whitespace, so joining on U+001F lets one
+    # substring search stand in for checking every squashed cell.
+    joined_squashed = "\x1f".join(squashed_values)
 
+    threshold = max(1, len(normalized_expected) - 1)
+    remaining = len(normalized_expected)
     matches = 0
     for expected_value, expected_squashed in zip(normalized_expected, squashed_expected):
-        if not expected_value and not expected_squashed:
-            continue
-
-        for actual_value, actual_squashed in zip(normalized_values, squashed_values):
-            if not actual_value and not actual_squashed:
-                continue
-
-            normalized_match = (
-                bool(expected_value)
-                and bool(actual_value)
-                and (
-                    actual_value == expected_value
-                    or expected_value in actual_value
-                    or actual_value in expected_value
-                )
-            )
-            squashed_match = (
-                bool(expected_squashed)
-                and bool(actual_squashed)
-                and expected_squashed in actual_squashed
+        remaining -= 1
+        if expected_value and expected_value in value_set:
+            matched = True
+        elif expected_squashed and expected_squashed in joined_squashed:
+            matched = True
+        elif expected_value:
+            matched = any(
+                actual_value and (expected_value in actual_value or actual_value in expected_value)
+                for actual_value in normalized_values
             )
+        else:
+            matched = False
 
-            if normalized_match or squashed_match:
-                matches += 1
-                break
-
-    if not matches:
-        return False
+        if matched:
+            matches += 1
+            if matches >= threshold:
+                return True
+        elif matches + remaining < threshold:
+            return False
 
-    threshold = max(1, len(normalized_expected) - 1)
-    return matches >= threshold
+    return False
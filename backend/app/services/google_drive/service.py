@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import re
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
+import httpx
 from fastapi import HTTPException, UploadFile
 
 from ...config import Settings
@@ -12,9 +29,12 @@ from ...token_store import StoredTokens, TokenStorage
 from .client import (
     DRIVE_FILES_ENDPOINT,
     DRIVE_FOLDER_MIME_TYPE,
+    UPLOAD_CHUNK_SIZE,
     XLSX_MIME_TYPE,
+    DriveNotFoundError,
     GoogleDriveClient,
 )
+from .concurrency import run_concurrently
 from .metadata import EXAM_NUMBER_PATTERN, build_project_folder_name, extract_project_metadata
 from .naming import drive_name_variants, drive_suffix_matches
 from .templates import (
@@ -27,6 +47,15 @@ from ..excel_templates.feature_list import extract_feature_list_overview
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on simultaneous Drive uploads for one project creation request.
+DRIVE_UPLOAD_CONCURRENCY = 5
+# How long the "gs" root folder id is trusted before Drive is searched again.
+ROOT_FOLDER_CACHE_TTL_SECONDS = 600.0
+ROOT_FOLDER_NAME = "gs"
+DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+_T = TypeVar("_T")
+
 
 @dataclass
 class _ResolvedSpreadsheet:
@@ -40,6 +69,42 @@ class _ResolvedSpreadsheet:
     content: Optional[bytes] = None
 
 
+async def _iter_upload_chunks(upload: UploadFile) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _upload_size(upload: UploadFile) -> int:
+    if upload.size is not None:
+        return upload.size
+    handle = upload.file
+    position = handle.tell()
+    handle.seek(0, os.SEEK_END)
+    size = handle.tell() - position
+    handle.seek(position)
+    return size
+
+
+def _unique_folder_name(base: str, existing_names: Set[str]) -> str:
+    """Return ``base`` or ``"base (N)"`` with N one past the highest taken suffix."""
+
+    if base not in existing_names:
+        return base
+    suffix_pattern = re.compile(rf"{re.escape(base)} \((\d+)\)")
+    max_suffix = max(
+        (
+            int(match.group(1))
+            for name in existing_names
+            if (match := suffix_pattern.fullmatch(name))
+        ),
+        default=1,
+    )
+    return f"{base} ({max_suffix + 1})"
+
+
 class GoogleDriveService:
     """High level operations for interacting with Google Drive."""
 
@@ -54,17 +119,92 @@ class GoogleDriveService:
         settings: Settings,
         token_storage: TokenStorage,
         oauth_service: Any,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self._settings = settings
         self._token_storage = token_storage
         self._oauth_service = oauth_service
-        self._client = GoogleDriveClient(settings, token_storage)
+        self._client = GoogleDriveClient(settings, token_storage, http_client=http_client)
+        self._root_folder_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
 
     async def _get_active_tokens(self, google_id: Optional[str]) -> StoredTokens:
         self._oauth_service.ensure_credentials()
         stored_tokens = self._client.load_tokens(google_id)
         return await self._client.ensure_valid_tokens(stored_tokens)
 
+    async def _get_root_folder(
+        self, tokens: StoredTokens
+    ) -> Tuple[Dict[str, Any], StoredTokens, bool]:
+        """Return the account's "gs" root folder, creating it when missing.
+
+        The folder id is stable per account, so it is cached for
+        ``ROOT_FOLDER_CACHE_TTL_SECONDS`` to skip the Drive search. The third
+        element reports whether the folder was created by this call.
+        """
+
+        cached = self._root_folder_cache.get(tokens.google_id)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0], tokens, False
+
+        folder, active_tokens = await self._client.find_root_folder(
+            tokens, folder_name=ROOT_FOLDER_NAME
+        )
+        created = False
+        if folder is None:
+            folder, active_tokens = await self._client.create_root_folder(
+                active_tokens, folder_name=ROOT_FOLDER_NAME
+            )
+            created = True
+
+        self._root_folder_cache[tokens.google_id] = (
+            folder,
+            time.monotonic() + ROOT_FOLDER_CACHE_TTL_SECONDS,
+        )
+        return folder, active_tokens, created
+
+    def _forget_root_folder(self, tokens: StoredTokens) -> None:
+        self._root_folder_cache.pop(tokens.google_id, None)
+
+    async def _ensure_root_folder_live(self, tokens: StoredTokens, folder_id: str) -> None:
+        metadata, _ = await self._client.get_file_metadata(tokens, file_id=folder_id, fields="id,trashed")
+        if metadata is None or metadata.get("trashed"):
+            raise DriveNotFoundError()
+
+    async def _use_root_folder(
+        self,
+        tokens: StoredTokens,
+        operation: Callable[[str, StoredTokens], Awaitable[_T]],
+    ) -> Tuple[Dict[str, Any], StoredTokens, bool, _T]:
+        """Run ``operation(root_id, tokens)`` against the account's "gs" folder.
+
+        A cached folder is checked for deletion or trash alongside
+        ``operation``; when Drive reports it gone, the cache entry is dropped and
+        ``operation`` runs once more against a freshly found or created folder.
+        Returns the folder, tokens, whether it was created, and the result.
+        """
+
+        cached = self._root_folder_cache.get(tokens.google_id)
+        if cached is not None and cached[1] > time.monotonic():
+            folder = cached[0]
+            folder_id = str(folder["id"])
+            try:
+                _, result = await run_concurrently(
+                    self._ensure_root_folder_live(tokens, folder_id),
+                    operation(folder_id, tokens),
+                )
+            except DriveNotFoundError:
+                self._forget_root_folder(tokens)
+            else:
+                return folder, tokens, False, result
+
+        folder, active_tokens, created = await self._get_root_folder(tokens)
+        try:
+            result = await operation(str(folder["id"]), active_tokens)
+        except DriveNotFoundError:
+            self._forget_root_folder(active_tokens)
+            raise
+        return folder, active_tokens, created, result
+
     async def _ensure_configuration_folder(
         self,
         *,
@@ -166,7 +306,7 @@ class GoogleDriveService:
                 raise HTTPException(status_code=404, detail=f"프로젝트에 '{rule['file_suffix']}' 파일을 찾을 수 없습니다.")
 
             parents = file_entry.get("parents")
-            if isinstance(parents, Sequence) and parents:
+            if isinstance(parents, list) and parents:
                 parent_ids = {
                     parent.decode("utf-8") if isinstance(parent, bytes) else str(parent)
                     for parent in parents
@@ -241,7 +381,7 @@ class GoogleDriveService:
     @staticmethod
     def _normalize_parent_ids(parents: Any) -> List[str]:
         normalized: List[str] = []
-        if isinstance(parents, Sequence):
+        if isinstance(parents, list):
             for parent in parents:
                 if isinstance(parent, bytes):
                     normalized.append(parent.decode("utf-8", errors="ignore"))
@@ -264,8 +404,7 @@ class GoogleDriveService:
             project_id=project_id, google_id=google_id
         )
 
-        uploaded: List[Dict[str, Any]] = []
-        tokens = active_tokens
+        image_files: List[Tuple[str, bytes, str]] = []
         for entry in images:
             name = str(entry.get("name") or "capture.png")
             content = entry.get("content")
@@ -276,26 +415,21 @@ class GoogleDriveService:
             else:
                 raise HTTPException(status_code=422, detail="이미지 데이터 형식이 올바르지 않습니다.")
 
-            content_type = str(entry.get("contentType") or "image/png")
-
-            file_info, tokens = await self._client.upload_file_to_folder(
-                tokens,
-                file_name=name,
-                parent_id=folder_id,
-                content=payload,
-                content_type=content_type,
-            )
+            image_files.append((name, payload, str(entry.get("contentType") or "image/png")))
 
-            file_id = str(file_info.get("id"))
-            uploaded.append(
-                {
-                    "id": file_id,
-                    "name": file_info.get("name", name),
-                    "mimeType": content_type,
-                    "timeSec": entry.get("timeSec"),
-                    "isStart": bool(entry.get("isStart")),
-                }
-            )
+        infos, tokens = await self._client.upload_files(
+            active_tokens, parent_id=folder_id, files=image_files
+        )
+        uploaded: List[Dict[str, Any]] = [
+            {
+                "id": str(file_info.get("id")),
+                "name": file_info.get("name", name),
+                "mimeType": content_type,
+                "timeSec": entry.get("timeSec"),
+                "isStart": bool(entry.get("isStart")),
+            }
+            for entry, (name, _, content_type), file_info in zip(images, image_files, infos)
+        ]
 
         events_info: Optional[Dict[str, Any]] = None
         if events_file and events_file.get("content"):
@@ -399,9 +533,10 @@ class GoogleDriveService:
         )
 
         removed = 0
-        tokens = active_tokens
-        for file_id in normalized:
-            metadata, tokens = await self._client.get_file_metadata(tokens, file_id=file_id)
+        metadata_list, tokens = await self._client.get_file_metadata_many(
+            active_tokens, file_ids=normalized
+        )
+        for file_id, metadata in zip(normalized, metadata_list):
             if not metadata:
                 continue
             parents = self._normalize_parent_ids(metadata.get("parents"))
@@ -432,7 +567,8 @@ class GoogleDriveService:
             raise HTTPException(status_code=404, detail="형상 이미지 폴더에서 파일을 찾을 수 없습니다.")
 
         mime_type = metadata.get("mimeType") if isinstance(metadata.get("mimeType"), str) else None
-        content, _ = await self._client.download_file_content(
+        # Relay the image as it arrives instead of buffering the whole file.
+        stream, _ = await self._client.open_file_stream(
             active_tokens, file_id=file_id, mime_type=mime_type
         )
 
@@ -440,7 +576,7 @@ class GoogleDriveService:
         if not isinstance(file_name, str) or not file_name:
             file_name = file_id
 
-        return {"fileName": file_name, "content": content, "mimeType": mime_type or "application/octet-stream"}
+        return {"fileName": file_name, "stream": stream, "mimeType": mime_type or "application/octet-stream"}
 
     async def apply_csv_to_spreadsheet(
         self,
@@ -524,10 +660,15 @@ class GoogleDriveService:
         if workbook_bytes is None:
             raise HTTPException(status_code=500, detail="기능리스트 파일을 불러오지 못했습니다. 다시 시도해 주세요.")
 
-        _, project_overview = extract_feature_list_overview(workbook_bytes)
-        sheet_title, start_row, headers, extracted_rows = feature_lists.parse_feature_list_workbook(
-            workbook_bytes
-        )
+        def parse_workbook() -> Tuple[str, Tuple[str, int, List[str], List[Dict[str, str]]]]:
+            # The overview reader needs the raw sheet XML (merged cells) while the
+            # rows come from the workbook reader, so both parses run in one worker
+            # thread instead of blocking the event loop back to back.
+            _, overview = extract_feature_list_overview(workbook_bytes)
+            return overview, feature_lists.parse_feature_list_workbook(workbook_bytes)
+
+        project_overview, parsed = await asyncio.to_thread(parse_workbook)
+        sheet_title, start_row, headers, extracted_rows = parsed
 
         return feature_lists.prepare_feature_list_response(
             file_id=resolved.file_id,
@@ -855,48 +996,40 @@ class GoogleDriveService:
     async def ensure_drive_setup(self, google_id: Optional[str]) -> Dict[str, Any]:
         active_tokens = await self._get_active_tokens(google_id)
 
-        folder, active_tokens = await self._client.find_root_folder(active_tokens, folder_name="gs")
-        folder_created = False
-
-        if folder is None:
-            folder, active_tokens = await self._client.create_root_folder(
-                active_tokens, folder_name="gs"
+        async def load_root_contents(gs_folder_id: str, tokens: StoredTokens):
+            # Both only need the root id, so check the shared criteria file and
+            # list the projects concurrently.
+            return await run_concurrently(
+                security_reports.ensure_shared_criteria_file(
+                    self._client,
+                    tokens,
+                    parent_id=gs_folder_id,
+                ),
+                self._client.list_child_folders(tokens, parent_id=gs_folder_id),
             )
-            folder_created = True
 
-        gs_folder_id = str(folder["id"])
-
-        criteria_sheet, active_tokens, criteria_created = await security_reports.ensure_shared_criteria_file(
-            self._client,
-            active_tokens,
-            parent_id=gs_folder_id,
+        folder, active_tokens, folder_created, contents = await self._use_root_folder(
+            active_tokens, load_root_contents
         )
+        (criteria_sheet, active_tokens, criteria_created), (projects, _) = contents
 
-        projects, active_tokens = await self._client.list_child_folders(
-            active_tokens, parent_id=str(folder["id"])
-        )
-
-        normalized_projects = []
-        for item in projects:
-            if not isinstance(item, dict):
-                continue
-            project_id = item.get("id")
-            name = item.get("name")
-            if not isinstance(project_id, str) or not isinstance(name, str):
-                continue
-            normalized_projects.append(
-                {
-                    "id": project_id,
-                    "name": name,
-                    "createdTime": item.get("createdTime"),
-                    "modifiedTime": item.get("modifiedTime"),
-                }
-            )
+        normalized_projects = [
+            {
+                "id": item["id"],
+                "name": item["name"],
+                "createdTime": item.get("createdTime"),
+                "modifiedTime": item.get("modifiedTime"),
+            }
+            for item in projects
+            if isinstance(item, dict)
+            and isinstance(item.get("id"), str)
+            and isinstance(item.get("name"), str)
+        ]
 
         return {
             "folderCreated": folder_created,
             "folderId": folder["id"],
-            "folderName": folder.get("name", "gs"),
+            "folderName": folder.get("name", ROOT_FOLDER_NAME),
             "criteria": {
                 "created": criteria_created,
                 "fileId": criteria_sheet.get("id"),
@@ -919,17 +1052,15 @@ class GoogleDriveService:
     ) -> bytes:
         active_tokens = await self._get_active_tokens(google_id)
 
-        folder, active_tokens = await self._client.find_root_folder(active_tokens, folder_name="gs")
-        if folder is None:
-            folder, active_tokens = await self._client.create_root_folder(active_tokens, folder_name="gs")
-        gs_folder_id = str(folder["id"])
+        async def download(gs_folder_id: str, tokens: StoredTokens):
+            return await security_reports.download_shared_security_criteria(
+                self._client,
+                tokens,
+                parent_id=gs_folder_id,
+                file_name=file_name,
+            )
 
-        content, _ = await security_reports.download_shared_security_criteria(
-            self._client,
-            active_tokens,
-            parent_id=gs_folder_id,
-            file_name=file_name,
-        )
+        _, _, _, (content, _) = await self._use_root_folder(active_tokens, download)
         return content
 
     async def create_project(
@@ -941,13 +1072,6 @@ class GoogleDriveService:
     ) -> Dict[str, Any]:
         active_tokens = await self._get_active_tokens(google_id)
 
-        parent_folder_id = folder_id
-        if not parent_folder_id:
-            folder, active_tokens = await self._client.find_root_folder(active_tokens, folder_name="gs")
-            if folder is None:
-                folder, active_tokens = await self._client.create_root_folder(active_tokens, folder_name="gs")
-            parent_folder_id = str(folder["id"])
-
         if not files:
             raise HTTPException(status_code=422, detail="업로드할 파일이 필요합니다.")
 
@@ -961,24 +1085,37 @@ class GoogleDriveService:
         if not project_name:
             raise HTTPException(status_code=422, detail="생성할 프로젝트 이름을 결정할 수 없습니다.")
 
-        siblings, active_tokens = await self._client.list_child_folders(active_tokens, parent_id=parent_folder_id)
+        async def list_siblings(parent_id: str, tokens: StoredTokens):
+            return await self._client.list_child_folders(tokens, parent_id=parent_id)
+
+        if folder_id:
+            parent_folder_id = folder_id
+            siblings, active_tokens = await list_siblings(parent_folder_id, active_tokens)
+        else:
+            # The root id may come from the cache; _use_root_folder confirms it
+            # still exists before the project folder is written under it.
+            folder, _, _, (siblings, active_tokens) = await self._use_root_folder(
+                active_tokens, list_siblings
+            )
+            parent_folder_id = str(folder["id"])
         existing_names = {
-            str(item.get("name"))
+            item["name"]
             for item in siblings
             if isinstance(item, dict) and isinstance(item.get("name"), str)
         }
 
-        unique_name = project_name
-        suffix = 1
-        while unique_name in existing_names:
-            suffix += 1
-            unique_name = f"{project_name} ({suffix})"
+        unique_name = _unique_folder_name(project_name, existing_names)
 
-        project_folder, active_tokens = await self._client.create_child_folder(
-            active_tokens,
-            name=unique_name,
-            parent_id=parent_folder_id,
-        )
+        try:
+            project_folder, active_tokens = await self._client.create_child_folder(
+                active_tokens,
+                name=unique_name,
+                parent_id=parent_folder_id,
+            )
+        except DriveNotFoundError:
+            if not folder_id:
+                self._forget_root_folder(active_tokens)
+            raise
         project_id = str(project_folder["id"])
 
         active_tokens = await templates.copy_template_to_drive(
@@ -988,48 +1125,62 @@ class GoogleDriveService:
             exam_number=metadata["exam_number"],
         )
 
-        uploaded_files: List[Dict[str, Any]] = []
-
         agreement_name = agreement_file.filename or "시험 합의서.docx"
         agreement_name = replace_placeholders(agreement_name, metadata["exam_number"])
-        file_info, active_tokens = await self._client.upload_file_to_folder(
-            active_tokens,
-            file_name=agreement_name,
-            parent_id=project_id,
-            content=agreement_bytes,
-            content_type=agreement_file.content_type
-            or "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        )
-        uploaded_files.append(
-            {
+        agreement_type = agreement_file.content_type or DOCX_MIME_TYPE
+        upload_tokens = active_tokens
+        semaphore = asyncio.Semaphore(DRIVE_UPLOAD_CONCURRENCY)
+
+        async def upload_agreement() -> Dict[str, Any]:
+            nonlocal upload_tokens
+            # Stream the spooled upload again rather than re-encoding the bytes
+            # already read for metadata into a multipart body.
+            await agreement_file.seek(0)
+            async with semaphore:
+                file_info, upload_tokens = await self._client.upload_stream_to_folder(
+                    upload_tokens,
+                    file_name=agreement_name,
+                    parent_id=project_id,
+                    chunks=_iter_upload_chunks(agreement_file),
+                    size=len(agreement_bytes),
+                    content_type=agreement_type,
+                )
+            await agreement_file.close()
+            return {
                 "id": file_info.get("id"),
                 "name": file_info.get("name", agreement_name),
                 "size": len(agreement_bytes),
-                "contentType": agreement_file.content_type
-                or "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                "contentType": agreement_type,
             }
-        )
-        await agreement_file.close()
 
-        for upload in files[1:]:
+        async def upload_attachment(upload: UploadFile) -> Dict[str, Any]:
+            nonlocal upload_tokens
             filename = upload.filename or "업로드된 파일.docx"
-            content = await upload.read()
-            file_info, active_tokens = await self._client.upload_file_to_folder(
-                active_tokens,
-                file_name=filename,
-                parent_id=project_id,
-                content=content,
-                content_type=upload.content_type,
-            )
-            uploaded_files.append(
-                {
-                    "id": file_info.get("id"),
-                    "name": file_info.get("name", filename),
-                    "size": len(content),
-                    "contentType": upload.content_type or "application/octet-stream",
-                }
-            )
+            content_type = upload.content_type or "application/octet-stream"
+            size = _upload_size(upload)
+            async with semaphore:
+                file_info, upload_tokens = await self._client.upload_stream_to_folder(
+                    upload_tokens,
+                    file_name=filename,
+                    parent_id=project_id,
+                    chunks=_iter_upload_chunks(upload),
+                    size=size,
+                    content_type=content_type,
+                )
             await upload.close()
+            return {
+                "id": file_info.get("id"),
+                "name": file_info.get("name", filename),
+                "size": size,
+                "contentType": content_type,
+            }
+
+        # Tokens were validated up front, so the uploads can share them and run
+        # side by side; results keep the request order.
+        uploaded_files: List[Dict[str, Any]] = await run_concurrently(
+            upload_agreement(),
+            *(upload_attachment(upload) for upload in files[1:]),
+        )
 
         logger.info(
             "Created Drive project '%s' (%s) with metadata %s",
@@ -1084,7 +1235,7 @@ class GoogleDriveService:
 
         parent_id: Optional[str] = None
         parents = metadata.get("parents")
-        if isinstance(parents, Sequence) and parents:
+        if isinstance(parents, list) and parents:
             parent_candidate = parents[0]
             if isinstance(parent_candidate, bytes):
                 parent_id = parent_candidate.decode("utf-8", errors="ignore")
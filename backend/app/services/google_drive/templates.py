@@ -1,13 +1,14 @@
 """Template and spreadsheet helpers for Google Drive operations."""
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 import os
 import re
 import zipfile
 from pathlib import Path
-from typing import Dict, Mapping, Tuple, TYPE_CHECKING
+from typing import Dict, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
 from fastapi import HTTPException
 
@@ -18,12 +19,16 @@ except ImportError:  # pragma: no cover
 
 from ..excel_templates import defect_report, feature_list, security_report, testcases
 from ...token_store import StoredTokens
+from .concurrency import run_concurrently
 
 if TYPE_CHECKING:  # pragma: no cover - type hints only
     from .client import GoogleDriveClient
 
 logger = logging.getLogger(__name__)
 
+# Template files uploaded to Drive at the same time while copying a project.
+TEMPLATE_UPLOAD_CONCURRENCY = 4
+
 __all__ = [
     "TEMPLATE_ROOT",
     "PLACEHOLDER_PATTERNS",
@@ -189,31 +194,69 @@ async def copy_template_to_drive(
     if not TEMPLATE_ROOT.exists():
         raise HTTPException(status_code=500, detail="template 폴더를 찾을 수 없습니다.")
 
-    path_to_folder_id: Dict[Path, str] = {TEMPLATE_ROOT: parent_id}
-    active_tokens = tokens
+    # Walk the template tree first so every folder at the same depth, across
+    # all parents, can be created with a single batch request.
+    directories_by_depth: Dict[int, List[Path]] = {}
+    files_by_directory: List[Tuple[Path, List[str]]] = []
     for root_dir, dirnames, filenames in os.walk(TEMPLATE_ROOT):
         current_path = Path(root_dir)
-        drive_parent_id = path_to_folder_id[current_path]
+        depth = len(current_path.relative_to(TEMPLATE_ROOT).parts)
+        directories_by_depth.setdefault(depth + 1, []).extend(
+            current_path / dirname for dirname in sorted(dirnames)
+        )
+        files_by_directory.append((current_path, sorted(filenames)))
 
-        for dirname in sorted(dirnames):
-            local_dir = current_path / dirname
-            folder_name = replace_placeholders(dirname, exam_number)
-            folder, active_tokens = await client.create_child_folder(
-                active_tokens,
-                name=folder_name,
-                parent_id=drive_parent_id,
-            )
-            path_to_folder_id[local_dir] = str(folder["id"])
-
-        for filename in sorted(filenames):
-            if is_shared_criteria_candidate(filename):
-                logger.info("Skip copying shared criteria into project: %s", filename)
-                continue
+    path_to_folder_id: Dict[Path, str] = {TEMPLATE_ROOT: parent_id}
+    active_tokens = tokens
+    for depth in sorted(directories_by_depth):
+        directories = directories_by_depth[depth]
+        if not directories:
+            continue
+        folders, active_tokens = await client.create_folders(
+            active_tokens,
+            folders=[
+                (replace_placeholders(directory.name, exam_number), path_to_folder_id[directory.parent])
+                for directory in directories
+            ],
+        )
+        for directory, folder in zip(directories, folders):
+            path_to_folder_id[directory] = str(folder["id"])
+
+    # Preparing a template (placeholder rewriting inside the Office zip) and
+    # uploading it are independent, so a producer prepares files in a worker
+    # thread while a few consumers upload them. The bounded queue caps how
+    # many prepared files are held in memory at once.
+    queue: asyncio.Queue[Optional[Tuple[str, str, bytes, str]]] = asyncio.Queue(
+        maxsize=TEMPLATE_UPLOAD_CONCURRENCY
+    )
+
+    async def produce() -> None:
+        for current_path, filenames in files_by_directory:
+            drive_parent_id = path_to_folder_id[current_path]
+            for filename in filenames:
+                if is_shared_criteria_candidate(filename):
+                    logger.info("Skip copying shared criteria into project: %s", filename)
+                    continue
 
-            local_file = current_path / filename
-            target_name = replace_placeholders(filename, exam_number)
-            content = prepare_template_file_content(local_file, exam_number)
-            mime_type = guess_mime_type(local_file)
+                local_file = current_path / filename
+                content = await asyncio.to_thread(
+                    prepare_template_file_content, local_file, exam_number
+                )
+                await queue.put(
+                    (
+                        replace_placeholders(filename, exam_number),
+                        drive_parent_id,
+                        content,
+                        guess_mime_type(local_file),
+                    )
+                )
+        for _ in range(TEMPLATE_UPLOAD_CONCURRENCY):
+            await queue.put(None)
+
+    async def consume() -> None:
+        nonlocal active_tokens
+        while (item := await queue.get()) is not None:
+            target_name, drive_parent_id, content, mime_type = item
             _, active_tokens = await client.upload_file_to_folder(
                 active_tokens,
                 file_name=target_name,
@@ -222,4 +265,9 @@ async def copy_template_to_drive(
                 content_type=mime_type,
             )
 
+    # A failed upload cancels the producer and the remaining uploads.
+    await run_concurrently(
+        produce(), *(consume() for _ in range(TEMPLATE_UPLOAD_CONCURRENCY))
+    )
+
     return active_tokens
@@ -14,7 +14,14 @@ except ImportError:  # pragma: no cover
 
 from ..excel_templates.models import TESTCASE_EXPECTED_HEADERS, TESTCASE_START_ROW
 from ..excel_templates.utils import AI_CSV_DELIMITER
-from .naming import drive_name_matches, looks_like_header_row, normalize_drive_text, squash_drive_text
+from .naming import (
+    drive_name_variants,
+    find_matching_name,
+    looks_like_header_row,
+    normalize_drive_text,
+    prewarm_drive_name_variants,
+    squash_drive_text,
+)
 
 __all__ = [
     "parse_testcase_workbook",
@@ -28,6 +35,7 @@ _TESTCASE_SHEET_CANDIDATES: Tuple[str, ...] = (
     "testcase",
     "test cases",
 )
+prewarm_drive_name_variants(_TESTCASE_SHEET_CANDIDATES)
 
 _HEADER_KEY_MAP = {
     "대분류": "majorCategory",
@@ -113,11 +121,11 @@ def _resolve_column_index(header_row: Sequence[Any], expected_header: str) -> Op
     if not header_row:
         return None
 
+    expected_tokens = drive_name_variants(expected_header)
     for index, value in enumerate(header_row):
         if value is None:
             continue
-        text = str(value)
-        if drive_name_matches(text, expected_header):
+        if expected_tokens and not expected_tokens.isdisjoint(drive_name_variants(str(value))):
             return index
 
     try:
@@ -146,25 +154,17 @@ def parse_testcase_workbook(workbook_bytes: bytes) -> Tuple[str, int, List[str],
 
     try:
         sheet = workbook.active
-        selected_title = sheet.title
         for candidate in _TESTCASE_SHEET_CANDIDATES:
-            matched = False
-            for title in workbook.sheetnames:
-                if drive_name_matches(title, candidate):
-                    try:
-                        sheet = workbook[title]
-                        selected_title = sheet.title
-                        matched = True
-                        break
-                    except KeyError:
-                        continue
-            if matched:
+            title = find_matching_name(workbook.sheetnames, candidate)
+            if title is not None:
+                sheet = workbook[title]
                 break
+        selected_title = sheet.title
 
         sheet_title = selected_title or ""
         max_col = max(len(headers), sheet.max_column or len(headers))
         rows_snapshot: List[Tuple[int, Sequence[Any]]] = [
-            (idx, row if isinstance(row, Sequence) else tuple())
+            (idx, row if isinstance(row, (tuple, list)) else tuple())
             for idx, row in enumerate(
                 sheet.iter_rows(min_row=1, max_col=max_col, values_only=True),
                 start=1,
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import logging
 import secrets
+import time
+from itertools import islice
 from typing import Dict, Optional
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import httpx
+import orjson
 from fastapi import HTTPException
 
 from ..config import Settings
@@ -22,6 +25,48 @@ GOOGLE_SCOPES = (
     "https://www.googleapis.com/auth/drive",
     "https://www.googleapis.com/auth/drive.file",
 )
+GOOGLE_SCOPE_STRING = " ".join(GOOGLE_SCOPES)
+
+OAUTH_STATE_TTL_SECONDS = 600.0
+_STATE_SWEEP_BATCH = 32
+
+
+class OAuthStateStore:
+    """Track issued OAuth ``state`` values until they are consumed or expire.
+
+    States live in process memory, which matches the single-worker uvicorn
+    deployment (see the Dockerfile). Running several workers would need a shared
+    store such as Redis, since the callback may land on a different process.
+    """
+
+    def __init__(self, ttl_seconds: float = OAUTH_STATE_TTL_SECONDS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._expires_at: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def add(self, state: str) -> None:
+        now = time.monotonic()
+        self._sweep(now)
+        self._expires_at[state] = now + self._ttl_seconds
+
+    def consume(self, state: str) -> bool:
+        # A single ``dict.pop`` checks and removes the state with no await in
+        # between, so two concurrent callbacks cannot both accept it.
+        expires_at = self._expires_at.pop(state, None)
+        return expires_at is not None and expires_at > time.monotonic()
+
+    def _sweep(self, now: float) -> None:
+        # Entries share one TTL, so insertion order is expiry order and only the
+        # oldest few need to be inspected on each insert.
+        expired = [
+            state
+            for state, expires_at in islice(self._expires_at.items(), _STATE_SWEEP_BATCH)
+            if expires_at <= now
+        ]
+        for state in expired:
+            del self._expires_at[state]
 
 
 class GoogleOAuthService:
@@ -30,10 +75,30 @@ class GoogleOAuthService:
     def __init__(self, settings: Settings, token_storage: TokenStorage) -> None:
         self._settings = settings
         self._token_storage = token_storage
-        self._state_store: set[str] = set()
+        self._state_store = OAuthStateStore()
+        # Settings are frozen, so the credential check only needs to run once.
+        self._has_credentials = settings.has_oauth_credentials
+        # Everything but ``state`` is fixed for the process lifetime.
+        self._authorization_url_prefix = GOOGLE_AUTH_ENDPOINT + "?" + urlencode(
+            {
+                "client_id": settings.client_id,
+                "redirect_uri": settings.redirect_uri,
+                "response_type": "code",
+                "scope": GOOGLE_SCOPE_STRING,
+                "access_type": "offline",
+                "prompt": "consent",
+                "include_granted_scopes": "true",
+            }
+        )
+        self._token_exchange_base = {
+            "client_id": settings.client_id,
+            "client_secret": settings.client_secret,
+            "redirect_uri": settings.redirect_uri,
+            "grant_type": "authorization_code",
+        }
 
     def ensure_credentials(self) -> None:
-        if not self._settings.has_oauth_credentials:
+        if not self._has_credentials:
             raise HTTPException(
                 status_code=500,
                 detail="Google OAuth 환경 변수가 올바르게 설정되지 않았습니다.",
@@ -48,33 +113,30 @@ class GoogleOAuthService:
         parsed[4] = urlencode(query, doseq=True)
         return urlunparse(parsed)
 
+    def build_authorization_url(self, state: str) -> str:
+        return f"{self._authorization_url_prefix}&state={state}"
+
     def create_state(self) -> str:
-        state = secrets.token_urlsafe(32)
+        state = secrets.token_urlsafe(16)
         self._state_store.add(state)
         return state
 
     def validate_state(self, state: Optional[str]) -> None:
-        if not state or state not in self._state_store:
+        if not state or not self._state_store.consume(state):
             raise HTTPException(status_code=400, detail="유효하지 않은 state 값입니다.")
-        self._state_store.discard(state)
-
-    async def exchange_code_for_tokens(self, code: str) -> Dict[str, str]:
-        data = {
-            "code": code,
-            "client_id": self._settings.client_id,
-            "client_secret": self._settings.client_secret,
-            "redirect_uri": self._settings.redirect_uri,
-            "grant_type": "authorization_code",
-        }
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(GOOGLE_TOKEN_ENDPOINT, data=data)
+    async def exchange_code_for_tokens(
+        self, code: str, *, client: httpx.AsyncClient
+    ) -> Dict[str, str]:
+        data = {**self._token_exchange_base, "code": code}
+
+        response = await client.post(GOOGLE_TOKEN_ENDPOINT, data=data)
 
         if response.is_error:
             logger.error("Google token exchange failed: %s", response.text)
             raise HTTPException(status_code=502, detail="Google 토큰 발급에 실패했습니다.")
 
-        payload = response.json()
+        payload = orjson.loads(response.content)
         access_token = payload.get("access_token")
         if not isinstance(access_token, str) or not access_token:
             logger.error("Google token exchange response missing access_token: %s", payload)
@@ -82,12 +144,13 @@ class GoogleOAuthService:
 
         return payload
 
-    async def fetch_userinfo(self, access_token: str) -> Dict[str, str]:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                "https://openidconnect.googleapis.com/v1/userinfo",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
+    async def fetch_userinfo(
+        self, access_token: str, *, client: httpx.AsyncClient
+    ) -> Dict[str, str]:
+        response = await client.get(
+            "https://openidconnect.googleapis.com/v1/userinfo",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
 
         if response.is_error:
             logger.error("Failed to fetch Google user info: %s", response.text)
@@ -96,7 +159,7 @@ class GoogleOAuthService:
                 detail="Google 사용자 정보를 불러오지 못했습니다. 다시 시도해주세요.",
             )
 
-        data = response.json()
+        data = orjson.loads(response.content)
         if not isinstance(data, dict):
             raise HTTPException(status_code=502, detail="Google 사용자 정보를 확인할 수 없습니다.")
         return data
@@ -0,0 +1,57 @@
+"""Construction of the OpenAI SDK client used by the generation services."""
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import httpx
+import orjson
+from openai import DefaultHttpxClient, OpenAI
+
+__all__ = ["create_openai_client"]
+
+# Concurrent file uploads and response calls share multiplexed HTTP/2
+# connections, so a small keep-alive pool is enough.
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=30)
+
+
+class _OrjsonHttpxClient(DefaultHttpxClient):
+    """SDK transport that serializes JSON request bodies with orjson.
+
+    Response payloads can carry megabytes of base64 image data; orjson encodes
+    those strings several times faster than the stdlib encoder httpx uses.
+    """
+
+    def build_request(  # type: ignore[override]
+        self,
+        method: str,
+        url: Any,
+        *,
+        json: Any = None,
+        content: Any = None,
+        headers: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        if json is not None and content is None:
+            try:
+                content = orjson.dumps(json)
+            except TypeError:
+                # Leave anything orjson cannot encode to the default encoder.
+                content = None
+            else:
+                merged_headers = dict(headers or {})
+                if not any(key.lower() == "content-type" for key in merged_headers):
+                    merged_headers["Content-Type"] = "application/json"
+                headers = merged_headers
+                json = None
+        return super().build_request(
+            method, url, json=json, content=content, headers=headers, **kwargs
+        )
+
+
+def create_openai_client(api_key: Optional[str] = None) -> OpenAI:
+    """Create an OpenAI client; ``api_key`` falls back to ``OPENAI_API_KEY``."""
+
+    return OpenAI(
+        api_key=api_key or None,
+        http_client=_OrjsonHttpxClient(http2=True, limits=OPENAI_HTTP_LIMITS),
+    )
@@ -40,6 +40,13 @@ class InputImageFileContent(TypedDict):
     image: ImageFileReference
 
 
+class InputImageFileIdContent(TypedDict):
+    """Response API image content that references an uploaded ``vision`` file."""
+
+    type: _ImageContentType
+    file_id: str
+
+
 class InputImageURLContent(TypedDict):
     """Response API image content that references an external URL."""
 
@@ -55,7 +62,11 @@ class TextContent(TypedDict):
 
 
 ContentPart = (
-    TextContent | InputFileContent | InputImageURLContent | InputImageFileContent
+    TextContent
+    | InputFileContent
+    | InputImageURLContent
+    | InputImageFileContent
+    | InputImageFileIdContent
 )
 
 
@@ -250,13 +261,18 @@ class OpenAIMessageBuilder:
                     )
                     continue
 
+                file_id = attachment.get("file_id")
+                if isinstance(file_id, str) and file_id.strip():
+                    parts.append({"type": "input_image", "file_id": file_id})
+                    continue
+
                 cls._log_invalid_attachment(
                     role,
                     text,
-                    "image 첨부에는 image_url이 필요합니다.",
+                    "image 첨부에는 image_url 또는 file_id가 필요합니다.",
                     attachment,
                 )
-                raise ValueError("image 첨부에는 image_url이 필요합니다.")
+                raise ValueError("image 첨부에는 image_url 또는 file_id가 필요합니다.")
             else:  # pragma: no cover - typing guard
                 cls._log_invalid_attachment(
                     role,
@@ -343,10 +359,11 @@ class OpenAIMessageBuilder:
     @classmethod
     def _normalize_image_part(
         cls, item: MutableMapping[str, object]
-    ) -> InputImageURLContent | InputImageFileContent:
+    ) -> InputImageURLContent | InputImageFileContent | InputImageFileIdContent:
         image: object | None = item.get("image")
         image_url: object | None = item.get("image_url")
         image_id: object | None = item.get("image_id")
+        file_id: object | None = item.get("file_id")
 
         if image is not None:
             cls._log_invalid_image_part(
@@ -368,11 +385,14 @@ class OpenAIMessageBuilder:
             )
             return {"type": "input_image", "image_url": external_url}
 
+        if isinstance(file_id, str) and file_id.strip():
+            return {"type": "input_image", "file_id": file_id.strip()}
+
         cls._log_invalid_image_part(
-            "input_image 항목에는 image_url이 필요합니다.",
+            "input_image 항목에는 image_url 또는 file_id가 필요합니다.",
             item,
         )
-        raise ValueError("input_image 항목에는 image_url이 필요합니다.")
+        raise ValueError("input_image 항목에는 image_url 또는 file_id가 필요합니다.")
 
     @classmethod
     def _normalize_external_image_url(
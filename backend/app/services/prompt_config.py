@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Mapping
 
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -107,11 +108,10 @@ class PromptConfigStore:
 
     def load_all(self) -> Dict[str, Any]:
         try:
-            with self._path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            data = orjson.loads(self._path.read_bytes())
         except FileNotFoundError:
             return {}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {}
 
         if not isinstance(data, dict):
@@ -119,9 +119,9 @@ class PromptConfigStore:
         return data
 
     def save_all(self, payload: Mapping[str, Any]) -> None:
-        serialized = json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
+        serialized = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
         temp_path = self._path.with_suffix(".tmp")
-        temp_path.write_text(serialized, encoding="utf-8")
+        temp_path.write_bytes(serialized)
         temp_path.replace(self._path)
 
     def save(self, menu_id: str, config: Mapping[str, Any]) -> None:
@@ -564,6 +564,16 @@ _DEFAULT_PROMPTS: Dict[str, PromptConfig] = {
 }
 
 
+@lru_cache(maxsize=1)
+def _default_payloads() -> Dict[str, Dict[str, Any]]:
+    """Serialized built-in defaults; shared between calls, so treat as read-only."""
+
+    return {
+        key: config.model_dump(mode="json", by_alias=True)
+        for key, config in _DEFAULT_PROMPTS.items()
+    }
+
+
 class PromptConfigService:
     """Load and persist prompt configuration for runtime use."""
 
@@ -574,10 +584,7 @@ class PromptConfigService:
         return {key: value.model_copy(deep=True) for key, value in _DEFAULT_PROMPTS.items()}
 
     def get_defaults(self) -> Dict[str, Dict[str, Any]]:
-        return {
-            key: config.model_dump(mode="json", by_alias=True)
-            for key, config in self._default_configs().items()
-        }
+        return _default_payloads()
 
     def list_configs(self) -> Dict[str, PromptConfig]:
         stored = self._store.load_all()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
@@ -8,6 +7,8 @@ from pathlib import Path
 from threading import Lock
 from typing import List
 
+import orjson
+
 
 @dataclass(frozen=True)
 class PromptRequestLogEntry:
@@ -80,10 +81,10 @@ class PromptRequestLogService:
             context_summary=context_summary or "",
             response_text=(response_text or ""),
         )
-        payload = json.dumps(entry.to_dict(), ensure_ascii=False)
+        payload = orjson.dumps(entry.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
         with self._lock:
-            with self._storage_path.open("a", encoding="utf-8") as file:
-                file.write(payload + "\n")
+            with self._storage_path.open("ab") as file:
+                file.write(payload)
         return entry
 
     def list_recent(self, limit: int = 5) -> List[PromptRequestLogEntry]:
@@ -92,7 +93,7 @@ class PromptRequestLogService:
 
         with self._lock:
             try:
-                lines = self._storage_path.read_text(encoding="utf-8").splitlines()
+                lines = self._storage_path.read_bytes().splitlines()
             except FileNotFoundError:
                 return []
 
@@ -101,8 +102,8 @@ class PromptRequestLogService:
             if not raw.strip():
                 continue
             try:
-                payload = json.loads(raw)
-            except json.JSONDecodeError:
+                payload = orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 continue
             entry = PromptRequestLogEntry.from_dict(payload if isinstance(payload, dict) else {})
             if entry is not None:
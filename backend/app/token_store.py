@@ -8,6 +8,27 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
 
+# Single-statement upsert shared by ``save`` and the legacy JSON migration so a
+# callback save never needs a separate lookup round trip.
+_UPSERT_TOKENS_SQL = """
+INSERT INTO google_tokens (
+    google_id, display_name, email, access_token, refresh_token, id_token,
+    scope, token_type, expires_in, saved_at
+) VALUES (:google_id, :display_name, :email, :access_token, :refresh_token, :id_token,
+          :scope, :token_type, :expires_in, :saved_at)
+ON CONFLICT(google_id) DO UPDATE SET
+    display_name=excluded.display_name,
+    email=excluded.email,
+    access_token=excluded.access_token,
+    refresh_token=excluded.refresh_token,
+    id_token=excluded.id_token,
+    scope=excluded.scope,
+    token_type=excluded.token_type,
+    expires_in=excluded.expires_in,
+    saved_at=excluded.saved_at
+"""
+
+
 @dataclass
 class StoredTokens:
     """Representation of the Google OAuth tokens saved in the database."""
@@ -38,6 +59,12 @@ class StoredTokens:
             id_token=row["id_token"] if "id_token" in row.keys() else None,
         )
 
+    @property
+    def expires_at_ts(self) -> float:
+        """Absolute expiry as a POSIX timestamp, comparable with ``time.time()``."""
+
+        return self.saved_at.timestamp() + self.expires_in
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "google_id": self.google_id,
@@ -174,23 +201,7 @@ class TokenStorage:
 
         with self._get_connection() as conn:
             conn.executemany(
-                """
-                INSERT INTO google_tokens (
-                    google_id, display_name, email, access_token, refresh_token, id_token,
-                    scope, token_type, expires_in, saved_at
-                ) VALUES (:google_id, :display_name, :email, :access_token, :refresh_token, :id_token,
-                          :scope, :token_type, :expires_in, :saved_at)
-                ON CONFLICT(google_id) DO UPDATE SET
-                    display_name=excluded.display_name,
-                    email=excluded.email,
-                    access_token=excluded.access_token,
-                    refresh_token=excluded.refresh_token,
-                    id_token=excluded.id_token,
-                    scope=excluded.scope,
-                    token_type=excluded.token_type,
-                    expires_in=excluded.expires_in,
-                    saved_at=excluded.saved_at
-                """,
+                _UPSERT_TOKENS_SQL,
                 rows,
             )
 
@@ -226,36 +237,7 @@ class TokenStorage:
         )
 
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO google_tokens (
-                    google_id, display_name, email, access_token, refresh_token, id_token,
-                    scope, token_type, expires_in, saved_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(google_id) DO UPDATE SET
-                    display_name=excluded.display_name,
-                    email=excluded.email,
-                    access_token=excluded.access_token,
-                    refresh_token=excluded.refresh_token,
-                    id_token=excluded.id_token,
-                    scope=excluded.scope,
-                    token_type=excluded.token_type,
-                    expires_in=excluded.expires_in,
-                    saved_at=excluded.saved_at
-                """,
-                (
-                    tokens.google_id,
-                    tokens.display_name,
-                    tokens.email,
-                    tokens.access_token,
-                    tokens.refresh_token,
-                    tokens.id_token,
-                    tokens.scope,
-                    tokens.token_type,
-                    tokens.expires_in,
-                    tokens.saved_at.isoformat(),
-                ),
-            )
+            conn.execute(_UPSERT_TOKENS_SQL, tokens.to_dict())
 
         return tokens
 
@@ -287,6 +269,30 @@ class TokenStorage:
 
         return StoredTokens.from_row(row) if row else None
 
+    def load_by_google_id_or_email(
+        self, google_id: Optional[str], email: Optional[str]
+    ) -> Optional[StoredTokens]:
+        """Load tokens matching ``google_id``, falling back to ``email``, in one query."""
+
+        normalized_google_id = (google_id or "").strip() or None
+        normalized_email = (email or "").strip() or None
+        if normalized_google_id is None and normalized_email is None:
+            return None
+
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT * FROM google_tokens
+                WHERE google_id = :google_id OR email = :email
+                ORDER BY google_id = :google_id DESC
+                LIMIT 1
+                """,
+                {"google_id": normalized_google_id, "email": normalized_email},
+            )
+            row = cursor.fetchone()
+
+        return StoredTokens.from_row(row) if row else None
+
     def list_accounts(self) -> List[StoredAccount]:
         with self._get_connection() as conn:
             cursor = conn.execute(
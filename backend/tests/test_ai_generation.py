@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import sys
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 from types import MethodType, SimpleNamespace
 from typing import Any
@@ -18,6 +22,7 @@ if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from app.config import Settings
+from app.services import ai_generation
 from app.services.ai_generation import AIGenerationService
 from app.services.openai_payload import OpenAIMessageBuilder
 from openai import BadRequestError, OpenAIError, RateLimitError
@@ -27,17 +32,34 @@ class _StubFiles:
     def __init__(self) -> None:
         self.created: list[dict[str, object]] = []
         self.deleted: list[str] = []
+        # Uploads run concurrently in worker threads.
+        self._lock = threading.Lock()
 
     def create(self, *, file: tuple[str, io.BytesIO], purpose: str) -> SimpleNamespace:
         name, handle = file
         # Read the content to verify what would be sent to OpenAI.
         content = handle.read()
-        self.created.append({"name": name, "content": content, "purpose": purpose})
-        return SimpleNamespace(id=f"file-{len(self.created)}")
+        with self._lock:
+            file_id = f"file-{len(self.created) + 1}"
+            self.created.append(
+                {"name": name, "content": content, "purpose": purpose, "id": file_id}
+            )
+        return SimpleNamespace(id=file_id)
+
+    def entry_for(self, name: str) -> dict[str, object]:
+        return next(entry for entry in self.created if entry["name"] == name)
+
+    def id_for(self, name: str) -> str:
+        return str(self.entry_for(name)["id"])
 
     def delete(self, *, file_id: str) -> None:
         self.deleted.append(file_id)
 
+    def retrieve(self, file_id: str) -> SimpleNamespace:
+        if file_id in self.deleted:
+            raise OpenAIError(f"{file_id} not found")
+        return SimpleNamespace(id=file_id)
+
 
 class _StubResponses:
     def __init__(self) -> None:
@@ -129,7 +151,9 @@ def test_locate_builtin_source_uses_override_directory(tmp_path: Path) -> None:
     target_file = target_dir / "override-only.xlsx"
     target_file.write_bytes(b"dummy")
 
-    service = AIGenerationService(_settings(builtin_template_root=template_root))
+    service = AIGenerationService(
+        _settings(builtin_template_root=template_root), openai_client=_StubClient()  # type: ignore[arg-type]
+    )
 
     resolved, attempted = service._locate_builtin_source(
         "template/가.계획/override-only.xlsx"
@@ -143,7 +167,9 @@ def test_locate_builtin_source_accepts_direct_file_override(tmp_path: Path) -> N
     target_file = tmp_path / "override-only.xlsx"
     target_file.write_bytes(b"dummy")
 
-    service = AIGenerationService(_settings(builtin_template_root=target_file))
+    service = AIGenerationService(
+        _settings(builtin_template_root=target_file), openai_client=_StubClient()  # type: ignore[arg-type]
+    )
 
     resolved, attempted = service._locate_builtin_source("template/override-only.xlsx")
 
@@ -153,9 +179,8 @@ def test_locate_builtin_source_accepts_direct_file_override(tmp_path: Path) -> N
 
 @pytest.mark.anyio
 async def test_generate_csv_attaches_files_and_cleans_up() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     uploads = [
         (
@@ -188,18 +213,17 @@ async def test_generate_csv_attaches_files_and_cleans_up() -> None:
         metadata=metadata,
     )
 
-    # Ensure each upload (including the built-in template) was transmitted as a file
-    # to OpenAI with the assistants purpose.
-    assert [entry["purpose"] for entry in stub_client.files.created] == [
-        "assistants",
-        "assistants",
-    ]
-    assert [entry["name"] for entry in stub_client.files.created] == [
-        "사용자_매뉴얼.pdf",
-        "GS-B-XX-XXXX 기능리스트 v1.0.pdf",
-    ]
+    # Every upload, including the image and the built-in template, is sent to
+    # OpenAI as a file; images use the vision purpose.
+    assert {
+        str(entry["name"]): entry["purpose"] for entry in stub_client.files.created
+    } == {
+        "사용자_매뉴얼.pdf": "assistants",
+        "설계_이미지.png": "vision",
+        "GS-B-XX-XXXX 기능리스트 v1.0.pdf": "assistants",
+    }
 
-    template_upload = stub_client.files.created[1]
+    template_upload = stub_client.files.entry_for("GS-B-XX-XXXX 기능리스트 v1.0.pdf")
     assert isinstance(template_upload["content"], bytes)
     assert template_upload["content"].startswith(b"%PDF")
 
@@ -221,13 +245,13 @@ async def test_generate_csv_attaches_files_and_cleans_up() -> None:
         for part in user_message["content"]
         if part["type"] in {"input_file", "input_image"}
     ]
+    manual_id = stub_client.files.id_for("사용자_매뉴얼.pdf")
+    image_id = stub_client.files.id_for("설계_이미지.png")
+    template_id = stub_client.files.id_for("GS-B-XX-XXXX 기능리스트 v1.0.pdf")
     assert file_parts == [
-        {"type": "input_file", "file_id": "file-1"},
-        {
-            "type": "input_image",
-            "image_url": "data:image/png;base64,SW1hZ2UgYnl0ZXM=",
-        },
-        {"type": "input_file", "file_id": "file-2"},
+        {"type": "input_file", "file_id": manual_id},
+        {"type": "input_image", "file_id": image_id},
+        {"type": "input_file", "file_id": template_id},
     ]
 
     # The text portions should not include the raw upload bodies.
@@ -237,7 +261,7 @@ async def test_generate_csv_attaches_files_and_cleans_up() -> None:
     assert "Image bytes" not in combined_text
 
     # Temporary files should be cleaned up after the request completes.
-    assert stub_client.files.deleted == ["file-1"]
+    assert sorted(stub_client.files.deleted) == sorted([manual_id, image_id])
 
     assert result.csv_text == "col1|col2\nvalue1|value2"
     assert result.project_overview == (
@@ -245,11 +269,44 @@ async def test_generate_csv_attaches_files_and_cleans_up() -> None:
     )
 
 
+@pytest.mark.anyio
+async def test_generate_csv_closes_spooled_uploads(monkeypatch: pytest.MonkeyPatch) -> None:
+    stub_client = _StubClient()
+    stub_client.responses.output_text = "순번|결함 요약\n1|로그인 실패"
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
+
+    spools: list[Any] = []
+    spooled_file = ai_generation.tempfile.SpooledTemporaryFile
+
+    def recording_spool(*args: Any, **kwargs: Any) -> Any:
+        spool = spooled_file(*args, **kwargs)
+        spools.append(spool)
+        return spool
+
+    monkeypatch.setattr(ai_generation.tempfile, "SpooledTemporaryFile", recording_spool)
+
+    upload = UploadFile(
+        file=io.BytesIO(b"Image bytes"),
+        filename="결함_화면.png",
+        headers=Headers({"content-type": "image/png"}),
+    )
+    result = await service.generate_csv(
+        project_id="proj-123",
+        menu_id="defect-report",
+        uploads=[upload],
+        metadata=[{"role": "additional", "defect_index": 1}],
+    )
+
+    assert len(spools) == 1
+    assert spools[0].closed
+    assert result.defect_images is not None
+    assert [image.content for image in result.defect_images[1]] == [b"Image bytes"]
+
+
 @pytest.mark.anyio
 async def test_generate_csv_extracts_project_overview_from_csv_row() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     stub_client.responses.output_text = (
         "프로젝트 개요|이 프로젝트는 테스트입니다.\n"
@@ -280,9 +337,8 @@ async def test_generate_csv_extracts_project_overview_from_csv_row() -> None:
 
 @pytest.mark.anyio
 async def test_generate_csv_extracts_project_overview_with_colon_notation() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     stub_client.responses.output_text = (
         "프로젝트 개요:이 프로젝트는 콜론 형식을 따릅니다.\n"
@@ -313,9 +369,8 @@ async def test_generate_csv_extracts_project_overview_with_colon_notation() -> N
 
 @pytest.mark.anyio
 async def test_generate_csv_extracts_project_overview_from_followup_row() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     stub_client.responses.output_text = (
         "프로젝트 개요\n"
@@ -347,9 +402,8 @@ async def test_generate_csv_extracts_project_overview_from_followup_row() -> Non
 
 @pytest.mark.anyio
 async def test_generate_csv_converts_required_csv_documents_to_pdf() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     upload = UploadFile(
         file=io.BytesIO("제목,내용\n항목1,값1".encode("utf-8")),
@@ -368,19 +422,18 @@ async def test_generate_csv_converts_required_csv_documents_to_pdf() -> None:
 
     assert result.csv_text == "col1|col2\nvalue1|value2"
 
-    assert [entry["name"] for entry in stub_client.files.created] == [
-        "사용자_매뉴얼.pdf",
-        "GS-B-XX-XXXX 기능리스트 v1.0.pdf",
-    ]
-    assert stub_client.files.created[0]["content"].startswith(b"%PDF")
+    # Uploads run concurrently, so compare names without relying on order.
+    assert sorted(entry["name"] for entry in stub_client.files.created) == sorted(
+        ["사용자_매뉴얼.pdf", "GS-B-XX-XXXX 기능리스트 v1.0.pdf"]
+    )
+    assert stub_client.files.entry_for("사용자_매뉴얼.pdf")["content"].startswith(b"%PDF")
 
 
 
 @pytest.mark.anyio
 async def test_generate_csv_includes_testcase_template() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     upload = UploadFile(
         file=io.BytesIO(b"Requirement body"),
@@ -395,12 +448,11 @@ async def test_generate_csv_includes_testcase_template() -> None:
         metadata=[{"role": "required", "id": "user-manual", "label": "사용자 설명서"}],
     )
 
-    assert [entry["name"] for entry in stub_client.files.created] == [
-        "요구사항.pdf",
-        "GS-B-XX-XXXX 테스트케이스.pdf",
-    ]
+    assert sorted(entry["name"] for entry in stub_client.files.created) == sorted(
+        ["요구사항.pdf", "GS-B-XX-XXXX 테스트케이스.pdf"]
+    )
 
-    template_upload = stub_client.files.created[1]
+    template_upload = stub_client.files.entry_for("GS-B-XX-XXXX 테스트케이스.pdf")
     assert isinstance(template_upload["content"], bytes)
     assert template_upload["content"].startswith(b"%PDF")
 
@@ -409,9 +461,8 @@ async def test_generate_csv_includes_testcase_template() -> None:
 
 @pytest.mark.anyio
 async def test_generate_csv_supports_modern_response_payload() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     def _modern_response(**kwargs: object) -> SimpleNamespace:
         stub_client.responses.calls.append(kwargs)
@@ -448,9 +499,8 @@ async def test_generate_csv_supports_modern_response_payload() -> None:
 
 @pytest.mark.anyio
 async def test_generate_csv_normalizes_image_url_content(monkeypatch: pytest.MonkeyPatch) -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     original_text_message = OpenAIMessageBuilder.text_message
 
@@ -507,9 +557,8 @@ async def test_generate_csv_normalizes_image_url_content(monkeypatch: pytest.Mon
 
 @pytest.mark.anyio
 async def test_generate_csv_surfaces_openai_response_error() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     def _raise_response_error(**kwargs: object) -> None:
         raise OpenAIError("temporary overload")
@@ -537,9 +586,8 @@ async def test_generate_csv_surfaces_openai_response_error() -> None:
 
 @pytest.mark.anyio
 async def test_generate_csv_surfaces_rate_limit_error() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     def _raise_rate_limit(**kwargs: object) -> None:
         raise _build_rate_limit_error(
@@ -569,9 +617,8 @@ async def test_generate_csv_surfaces_rate_limit_error() -> None:
 
 @pytest.mark.anyio
 async def test_generate_csv_includes_message_for_unexpected_error() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     def _raise_type_error(**kwargs: object) -> None:
         raise TypeError("Object of type bytes is not JSON serializable")
@@ -599,9 +646,8 @@ async def test_generate_csv_includes_message_for_unexpected_error() -> None:
 
 @pytest.mark.anyio
 async def test_generate_csv_surfaces_bad_request_error_detail() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     def _raise_bad_request(**kwargs: object) -> None:
         raise _build_bad_request_error("Invalid prompt format")
@@ -628,9 +674,8 @@ async def test_generate_csv_surfaces_bad_request_error_detail() -> None:
 
 @pytest.mark.anyio
 async def test_generate_csv_logs_response_when_csv_invalid() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     def _empty_csv_response(**kwargs: object) -> SimpleNamespace:
         stub_client.responses.calls.append(kwargs)
@@ -666,9 +711,8 @@ async def test_generate_csv_logs_response_when_csv_invalid() -> None:
 
 @pytest.mark.anyio
 async def test_generate_csv_surfaces_openai_file_upload_error() -> None:
-    service = AIGenerationService(_settings())
     stub_client = _StubClient()
-    service._client = stub_client  # type: ignore[attr-defined]
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
 
     def _raise_file_error(
         self, *, file: tuple[str, io.BytesIO], purpose: str
@@ -695,3 +739,171 @@ async def test_generate_csv_surfaces_openai_file_upload_error() -> None:
     assert "OpenAI 파일 업로드 중 오류가 발생했습니다" in excinfo.value.detail
     assert "file quota reached" in excinfo.value.detail
 
+
+
+@pytest.mark.anyio
+async def test_generate_csv_uploads_files_concurrently_in_order() -> None:
+    stub_client = _StubClient()
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _create_in_parallel(
+        self, *, file: tuple[str, io.BytesIO], purpose: str
+    ) -> SimpleNamespace:
+        name, _ = file
+        if name.endswith(".txt"):
+            # Both user uploads must be in flight at once for the barrier to release.
+            barrier.wait()
+        if name.startswith("첫번째"):
+            time.sleep(0.05)
+        self.created.append({"name": name, "content": b"", "purpose": purpose})
+        return SimpleNamespace(id=f"file-{name}")
+
+    stub_client.files.create = MethodType(_create_in_parallel, stub_client.files)
+
+    uploads = [
+        UploadFile(
+            file=io.BytesIO(body),
+            filename=name,
+            headers=Headers({"content-type": "text/plain"}),
+        )
+        for name, body in (("첫번째.txt", b"first"), ("두번째.txt", b"second"))
+    ]
+
+    await service.generate_csv(
+        project_id="proj-parallel",
+        menu_id="testcase-generation",
+        uploads=uploads,
+        metadata=[{"role": "additional"}, {"role": "additional"}],
+    )
+
+    user_message = stub_client.responses.calls[0]["input"][1]
+    file_ids = [
+        part["file_id"] for part in user_message["content"] if part["type"] == "input_file"
+    ]
+    assert file_ids[:2] == ["file-첫번째.txt", "file-두번째.txt"]
+    created_txt = [
+        entry["name"]
+        for entry in stub_client.files.created
+        if str(entry["name"]).endswith(".txt")
+    ]
+    assert created_txt == ["두번째.txt", "첫번째.txt"]
+
+
+def test_parse_xlsx_rows_matches_xml_fallback() -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["대분류", "중분류", None, "비고"])
+    sheet.append(["로그인", None, 3, 2.5])
+    sheet.append([])
+    sheet.append(["결제", "환불", "카드", None])
+    sheet.append([datetime(2024, 1, 2), datetime(2024, 1, 2, 12), True, False])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    content = buffer.getvalue()
+
+    rows = AIGenerationService._parse_xlsx_rows(content)
+
+    assert rows == [
+        ["대분류", "중분류", "", "비고"],
+        ["로그인", "", "3", "2.5"],
+        ["결제", "환불", "카드"],
+        ["45293", "45293.5", "1", "0"],
+    ]
+    assert rows == AIGenerationService._parse_xlsx_rows_from_xml(content)
+
+
+def test_parse_xlsx_rows_rejects_invalid_content() -> None:
+    with pytest.raises(ValueError):
+        AIGenerationService._parse_xlsx_rows(b"not a workbook")
+
+
+def test_load_xlsx_as_pdf_reuses_rendered_template(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+
+    template_path = tmp_path / "template.xlsx"
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["기능", "설명"])
+    workbook.save(template_path)
+
+    calls: list[bytes] = []
+    original = AIGenerationService._parse_xlsx_rows
+
+    def _counting_parse(content: bytes) -> list[list[str]]:
+        calls.append(content)
+        return original(content)
+
+    monkeypatch.setattr(AIGenerationService, "_parse_xlsx_rows", staticmethod(_counting_parse))
+
+    first = AIGenerationService._load_xlsx_as_pdf("feature-list", template_path, "템플릿")
+    second = AIGenerationService._load_xlsx_as_pdf("feature-list", template_path, "템플릿")
+
+    assert len(calls) == 1
+    assert first.content == second.content
+    assert first.file is not second.file
+
+
+def test_builtin_file_bytes_rereads_modified_file(tmp_path: Path) -> None:
+    source = tmp_path / "guide.txt"
+    source.write_bytes(b"first")
+    first_mtime = source.stat().st_mtime_ns
+
+    assert AIGenerationService._builtin_file_bytes(str(source), first_mtime) == b"first"
+
+    source.write_bytes(b"second")
+    os.utime(source, ns=(first_mtime + 1_000_000, first_mtime + 1_000_000))
+
+    assert AIGenerationService._builtin_file_bytes(str(source), first_mtime) == b"first"
+    assert (
+        AIGenerationService._builtin_file_bytes(str(source), source.stat().st_mtime_ns)
+        == b"second"
+    )
+
+
+def test_column_index_from_ref() -> None:
+    assert AIGenerationService._column_index_from_ref("A1") == 0
+    assert AIGenerationService._column_index_from_ref("Z12") == 25
+    assert AIGenerationService._column_index_from_ref("AB3") == 27
+    assert AIGenerationService._column_index_from_ref("12") is None
+    assert AIGenerationService._column_index_from_ref(None) is None
+
+
+def test_sanitize_csv_strips_code_fence_only_when_present() -> None:
+    assert AIGenerationService._sanitize_csv("  a,b\n1,2 \n") == "a,b\n1,2"
+    fenced = "설명\n```csv\na,b\n1,2\n```\n"
+    assert AIGenerationService._sanitize_csv(fenced) == "a,b\n1,2"
+
+
+@pytest.mark.anyio
+async def test_generate_csv_reuses_uploaded_builtin_templates() -> None:
+    stub_client = _StubClient()
+    service = AIGenerationService(_settings(), openai_client=stub_client)  # type: ignore[arg-type]
+
+    for project_id in ("proj-a", "proj-b"):
+        upload = UploadFile(
+            file=io.BytesIO(b"Requirement body"),
+            filename="요구사항.docx",
+            headers=Headers({"content-type": "application/msword"}),
+        )
+        await service.generate_csv(
+            project_id=project_id,
+            menu_id="testcase-generation",
+            uploads=[upload],
+            metadata=[{"role": "required", "id": "user-manual", "label": "사용자 설명서"}],
+        )
+
+    names = [entry["name"] for entry in stub_client.files.created]
+    assert names.count("GS-B-XX-XXXX 테스트케이스.pdf") == 1
+    assert names.count("요구사항.pdf") == 2
+
+    template_id = stub_client.files.id_for("GS-B-XX-XXXX 테스트케이스.pdf")
+    for call in stub_client.responses.calls:
+        file_ids = [
+            part["file_id"] for part in call["input"][1]["content"] if part["type"] == "input_file"
+        ]
+        assert template_id in file_ids
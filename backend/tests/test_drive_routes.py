@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator, List
+
+import pytest
+from starlette.requests import ClientDisconnect
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.routes.drive import _ClosingStreamingResponse  # noqa: E402
+
+
+def test_streaming_download_is_closed_when_client_disconnects() -> None:
+    events: List[str] = []
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            yield b"first"
+            yield b"second"
+        finally:
+            events.append("closed")
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message.get("body"):
+            raise OSError("client went away")
+
+    async def run() -> None:
+        response = _ClosingStreamingResponse(body(), media_type="image/png")
+        scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+        with pytest.raises(ClientDisconnect):
+            await response(scope, receive, send)
+        events.append("returned")
+
+    asyncio.run(run())
+
+    assert events == ["closed", "returned"]
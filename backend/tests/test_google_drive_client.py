@@ -2,15 +2,21 @@ from __future__ import annotations
 
 import asyncio
 import sys
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
+
+import httpx
+import pytest
+from fastapi import HTTPException
 
 BACKEND_ROOT = Path(__file__).resolve().parents[1]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from app.config import Settings
+from app.services.google_drive import client as client_module
 from app.services.google_drive.client import GoogleDriveClient
 from app.token_store import StoredAccount, StoredTokens
 
@@ -66,9 +72,54 @@ def _stored_token(expires_in: int = 3600) -> StoredTokens:
     )
 
 
+_Result = TypeVar("_Result")
+Handler = Callable[[httpx.Request], httpx.Response]
+# Captured before any test swaps ``httpx.AsyncClient`` out.
+_AsyncClient = httpx.AsyncClient
+
+
+def _run_with_drive_client(
+    handler: Handler,
+    scenario: Callable[[GoogleDriveClient], Awaitable[_Result]],
+    *,
+    storage: Optional[InMemoryTokenStorage] = None,
+    client_class: Type[GoogleDriveClient] = GoogleDriveClient,
+) -> _Result:
+    """Run ``scenario`` against a client whose HTTP traffic goes to ``handler``."""
+
+    async def run() -> _Result:
+        async with _AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+            client = client_class(
+                _settings(),
+                storage if storage is not None else InMemoryTokenStorage({"user": _stored_token()}),
+                http_client=http_client,
+            )
+            return await scenario(client)
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def no_sleep(monkeypatch) -> List[float]:
+    """Skip retry back-off and record the requested delays."""
+
+    delays: List[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(client_module, "_retry_sleep", fake_sleep)
+    return delays
+
+
 class RefreshTrackingClient(GoogleDriveClient):
-    def __init__(self, settings: Settings, storage: InMemoryTokenStorage) -> None:
-        super().__init__(settings, storage)
+    def __init__(
+        self,
+        settings: Settings,
+        storage: InMemoryTokenStorage,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(settings, storage, http_client=http_client)
         self.refreshed = False
 
     async def refresh_access_token(self, tokens: StoredTokens) -> StoredTokens:  # type: ignore[override]
@@ -133,3 +184,562 @@ def test_find_child_folder_by_name_uses_variants() -> None:
         )
     )
     assert folder and folder["id"] == "1"
+
+
+def test_upload_stream_to_folder_uses_resumable_session() -> None:
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(200, headers={"Location": "https://upload.example/session-1"})
+        return httpx.Response(200, json={"id": "file-1", "name": "manual.docx"})
+
+    async def chunks():
+        yield b"hello "
+        yield b"world"
+
+    async def scenario(client: GoogleDriveClient):
+        return await client.upload_stream_to_folder(
+            _stored_token(),
+            file_name="manual.docx",
+            parent_id="project",
+            chunks=chunks(),
+            size=11,
+            content_type="application/msword",
+        )
+
+    data, _ = _run_with_drive_client(handler, scenario)
+
+    assert data["id"] == "file-1"
+    session_request, upload_request = requests
+    assert "uploadType=resumable" in str(session_request.url)
+    assert session_request.headers["X-Upload-Content-Length"] == "11"
+    assert str(upload_request.url) == "https://upload.example/session-1"
+    assert upload_request.headers["Content-Length"] == "11"
+    assert upload_request.content == b"hello world"
+
+
+def test_create_child_folders_uses_single_batch_request() -> None:
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        parts = []
+        for index, name in ((1, "나.설계"), (0, "가.계획")):
+            parts.append(
+                "--batch_resp\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-item{index}>\r\n\r\n"
+                "HTTP/1.1 200 OK\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f'{{"id": "folder-{index}", "name": "{name}"}}\r\n'
+            )
+        parts.append("--batch_resp--\r\n")
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "multipart/mixed; boundary=batch_resp"},
+            content="".join(parts).encode("utf-8"),
+        )
+
+    folders, _ = _run_with_drive_client(
+        handler,
+        lambda client: client.create_child_folders(
+            _stored_token(), names=["가.계획", "나.설계"], parent_id="project"
+        ),
+    )
+
+    assert [folder["id"] for folder in folders] == ["folder-0", "folder-1"]
+    assert len(requests) == 1
+    assert str(requests[0].url) == client_module.DRIVE_BATCH_ENDPOINT
+    assert requests[0].content.count(b"POST /drive/v3/files") == 2
+
+
+def test_refresh_access_token_uses_injected_http_client() -> None:
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"access_token": "refreshed", "expires_in": 3600})
+
+    class RecordingStorage(InMemoryTokenStorage):
+        def save(self, *, google_id: str, display_name: str, email: Optional[str], payload: Dict[str, Any]) -> StoredTokens:  # type: ignore[override]
+            return StoredTokens(
+                google_id=google_id,
+                display_name=display_name,
+                email=email,
+                access_token=payload["access_token"],
+                refresh_token=payload.get("refresh_token"),
+                scope=payload.get("scope", ""),
+                token_type=payload.get("token_type", "Bearer"),
+                expires_in=int(payload.get("expires_in", 0)),
+                saved_at=datetime.now(timezone.utc),
+            )
+
+    refreshed = _run_with_drive_client(
+        handler,
+        lambda client: client.refresh_access_token(_stored_token()),
+        storage=RecordingStorage({"user": _stored_token()}),
+    )
+
+    assert refreshed.access_token == "refreshed"
+    assert len(requests) == 1
+    assert b"grant_type=refresh_token" in requests[0].content
+
+
+def test_drive_requests_reuse_injected_http_client(monkeypatch) -> None:
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"files": [{"id": "root", "name": "gs"}]})
+
+    def fail_async_client(*args: Any, **kwargs: Any) -> httpx.AsyncClient:
+        raise AssertionError("a per-call client should not be created")
+
+    async def scenario(client: GoogleDriveClient) -> Optional[Dict[str, Any]]:
+        first, tokens = await client.find_root_folder(_stored_token(), folder_name="gs")
+        await client.find_root_folder(tokens, folder_name="gs")
+        return first
+
+    monkeypatch.setattr(client_module.httpx, "AsyncClient", fail_async_client)
+    folder = _run_with_drive_client(handler, scenario)
+
+    assert folder == {"id": "root", "name": "gs"}
+    assert len(requests) == 2
+    assert str(requests[0].url).startswith(f"{client_module.DRIVE_API_BASE}/files?")
+
+
+def test_create_folders_splits_batches_at_drive_limit(monkeypatch) -> None:
+    batch_sizes: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.content.decode("utf-8")
+        count = body.count("Content-ID: <item")
+        batch_sizes.append(count)
+        boundary = "batch_resp"
+        parts = [
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <response-item{index}>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            f'{{"id": "folder-{len(batch_sizes)}-{index}"}}\r\n'
+            for index in range(count)
+        ]
+        parts.append(f"--{boundary}--\r\n")
+        return httpx.Response(
+            200,
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+            content="".join(parts).encode("utf-8"),
+        )
+
+    monkeypatch.setattr(client_module, "DRIVE_BATCH_MAX_REQUESTS", 2)
+
+    folders, _ = _run_with_drive_client(
+        handler,
+        lambda client: client.create_folders(
+            _stored_token(), folders=[("가", "parent-a"), ("나", "parent-b"), ("다", "parent-a")]
+        ),
+    )
+
+    assert batch_sizes == [2, 1]
+    assert [folder["id"] for folder in folders] == ["folder-1-0", "folder-1-1", "folder-2-0"]
+
+
+def test_folder_batch_retries_the_post_and_rate_limited_items(no_sleep: List[float]) -> None:
+    bodies: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = request.content.decode("utf-8")
+        bodies.append(body)
+        if len(bodies) == 1:
+            return httpx.Response(503)
+        parts = []
+        for index in range(body.count("Content-ID: <item")):
+            if len(bodies) == 2 and index == 1:
+                status = "403 Forbidden"
+                payload = '{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}'
+            else:
+                status = "200 OK"
+                payload = f'{{"id": "folder-{len(bodies)}-{index}"}}'
+            parts.append(
+                "--batch_resp\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-item{index}>\r\n\r\n"
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{payload}\r\n"
+            )
+        parts.append("--batch_resp--\r\n")
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "multipart/mixed; boundary=batch_resp"},
+            content="".join(parts).encode("utf-8"),
+        )
+
+    folders, _ = _run_with_drive_client(
+        handler,
+        lambda client: client.create_folders(
+            _stored_token(), folders=[("가", "parent"), ("나", "parent"), ("다", "parent")]
+        ),
+    )
+
+    assert [folder["id"] for folder in folders] == ["folder-2-0", "folder-3-0", "folder-2-2"]
+    assert len(bodies) == 3
+    assert bodies[2].count("Content-ID: <item") == 1
+    assert '"name":"나"' in bodies[2]
+    assert len(no_sleep) == 2
+
+
+def test_concurrent_expired_calls_share_one_refresh() -> None:
+    expired = _stored_token()
+    expired.saved_at = datetime.now(timezone.utc) - timedelta(hours=2)
+    storage = InMemoryTokenStorage({"user": expired})
+
+    class CountingClient(RefreshTrackingClient):
+        refresh_count = 0
+
+        async def refresh_access_token(self, tokens: StoredTokens) -> StoredTokens:  # type: ignore[override]
+            self.refresh_count += 1
+            await asyncio.sleep(0)
+            refreshed = await super().refresh_access_token(tokens)
+            refreshed.expires_in = 3600
+            return refreshed
+
+    client = CountingClient(_settings(), storage)
+
+    async def run() -> List[StoredTokens]:
+        return list(await asyncio.gather(*(client.ensure_valid_tokens(expired) for _ in range(5))))
+
+    results = asyncio.run(run())
+
+    assert client.refresh_count == 1
+    assert {tokens.access_token for tokens in results} == {"new-token"}
+
+
+def test_multipart_related_body_round_trips() -> None:
+    from email.parser import BytesParser
+
+    body, content_type = client_module._multipart_related_body(
+        {"name": "보고서.xlsx", "parents": ["folder"]}, b"\x00binary\r\n", "application/pdf"
+    )
+
+    assert content_type.startswith("multipart/related; boundary=")
+    message = BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("ascii") + body
+    )
+    metadata_part, file_part = message.get_payload()
+    assert metadata_part.get_content_type() == "application/json"
+    assert "보고서.xlsx".encode("utf-8") in metadata_part.get_payload(decode=True)
+    assert file_part.get_content_type() == "application/pdf"
+    assert file_part.get_payload(decode=True) == b"\x00binary\r\n"
+
+
+def test_drive_responses_are_parsed_from_raw_bytes(monkeypatch) -> None:
+    body = '{"files": [{"id": "root", "name": "보안성 점검"}]}'.encode("utf-8")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    def fail_json(self: httpx.Response, **kwargs: Any) -> Any:
+        raise AssertionError("response.json() should not be used")
+
+    monkeypatch.setattr(httpx.Response, "json", fail_json)
+    folder, _ = _run_with_drive_client(
+        handler, lambda client: client.find_root_folder(_stored_token(), folder_name="보안성 점검")
+    )
+
+    assert folder == {"id": "root", "name": "보안성 점검"}
+
+
+def test_list_child_folders_follows_next_page_token() -> None:
+    page_tokens: List[Optional[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page_token = request.url.params.get("pageToken")
+        page_tokens.append(page_token)
+        assert request.url.params["pageSize"] == str(client_module.DRIVE_LIST_PAGE_SIZE)
+        if page_token is None:
+            return httpx.Response(200, json={"files": [{"id": "1", "name": "A"}], "nextPageToken": "next"})
+        return httpx.Response(200, json={"files": [{"id": "2", "name": "B"}]})
+
+    folders, _ = _run_with_drive_client(
+        handler, lambda client: client.list_child_folders(_stored_token(), parent_id="root")
+    )
+
+    assert [folder["id"] for folder in folders] == ["1", "2"]
+    assert page_tokens == [None, "next"]
+
+
+def test_drive_request_retries_transient_errors(no_sleep: List[float]) -> None:
+    statuses = iter([503, 429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status == 200:
+            return httpx.Response(200, json={"id": "file"})
+        return httpx.Response(status, headers={"Retry-After": "2"} if status == 429 else {})
+
+    payload, _ = _run_with_drive_client(
+        handler, lambda client: client.drive_request(_stored_token(), method="GET", path="/files/file")
+    )
+
+    assert payload == {"id": "file"}
+    assert len(no_sleep) == 2
+    assert client_module.DRIVE_RETRY_BASE_DELAY <= no_sleep[0] <= 2 * client_module.DRIVE_RETRY_BASE_DELAY
+    assert no_sleep[1] == 2.0
+
+
+def test_drive_request_retries_rate_limited_posts_only(no_sleep: List[float]) -> None:
+    statuses = iter([429, 200, 503])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status == 200:
+            return httpx.Response(200, json={"id": "folder"})
+        return httpx.Response(status)
+
+    async def scenario(client: GoogleDriveClient) -> Dict[str, Any]:
+        payload, tokens = await client.drive_request(
+            _stored_token(), method="POST", path="/files", json_data={"name": "a"}
+        )
+        with pytest.raises(HTTPException) as excinfo:
+            await client.drive_request(tokens, method="POST", path="/files", json_data={"name": "b"})
+        assert excinfo.value.status_code == 502
+        return payload
+
+    assert _run_with_drive_client(handler, scenario) == {"id": "folder"}
+    assert len(no_sleep) == 1
+
+
+def test_drive_request_reports_missing_targets_as_not_found() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"error": {"code": 404, "message": "File not found: gs"}})
+
+    with pytest.raises(client_module.DriveNotFoundError) as excinfo:
+        _run_with_drive_client(
+            handler,
+            lambda client: client.create_child_folder(_stored_token(), name="project", parent_id="gs"),
+        )
+
+    assert excinfo.value.status_code == 404
+
+
+def test_fallback_http_client_is_reused_until_closed(monkeypatch) -> None:
+    created: List[httpx.AsyncClient] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"files": [{"id": "root", "name": "gs"}]})
+
+    def fake_async_client(*args: Any, **kwargs: Any) -> httpx.AsyncClient:
+        assert kwargs.pop("http2") is True
+        kwargs["transport"] = httpx.MockTransport(handler)
+        client = _AsyncClient(*args, **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(client_module.httpx, "AsyncClient", fake_async_client)
+
+    async def run() -> None:
+        storage = InMemoryTokenStorage({"user": _stored_token()})
+        client = GoogleDriveClient(_settings(), storage)
+        tokens = _stored_token()
+        await client.find_root_folder(tokens, folder_name="gs")
+        await client.find_root_folder(tokens, folder_name="gs")
+        await client.aclose()
+
+    asyncio.run(run())
+
+    assert len(created) == 1
+    assert created[0].is_closed
+
+
+def test_expired_token_is_refreshed_before_the_first_request() -> None:
+    authorizations: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        authorizations.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"id": "file", "name": "a.docx"})
+
+    _run_with_drive_client(
+        handler,
+        lambda client: client.get_file_metadata(_stored_token(expires_in=1), file_id="file"),
+        storage=InMemoryTokenStorage({"user": _stored_token(expires_in=1)}),
+        client_class=RefreshTrackingClient,
+    )
+
+    assert authorizations == ["Bearer new-token"]
+
+
+def test_token_expiry_deadline_is_computed_once(monkeypatch) -> None:
+    client = GoogleDriveClient(_settings(), InMemoryTokenStorage({}))
+    tokens = _stored_token(expires_in=3600)
+
+    assert client._is_token_expired(tokens) is False
+
+    monkeypatch.setattr(client_module, "_wall_time", lambda: pytest.fail("wall clock read again"))
+    assert client._is_token_expired(tokens) is False
+
+
+def test_token_expiry_deadline_is_kept_per_account() -> None:
+    client = GoogleDriveClient(_settings(), InMemoryTokenStorage({}))
+    first = _stored_token(expires_in=3600)
+    second = replace(first, access_token="replaced-token")
+
+    assert client._is_token_expired(first) is False
+    assert client._is_token_expired(second) is False
+
+    assert client._token_deadlines.keys() == {first.google_id}
+    assert client._token_deadlines[first.google_id][0] == "replaced-token"
+
+
+def test_get_file_metadata_many_uses_one_batch_request() -> None:
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        parts = [
+            "--batch_resp\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-ID: <response-item1>\r\n\r\n"
+            "HTTP/1.1 404 Not Found\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            '{"error": {"code": 404}}\r\n',
+            "--batch_resp\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            '{"id": "a", "name": "a.png", "parents": ["folder"]}\r\n',
+            "--batch_resp--\r\n",
+        ]
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "multipart/mixed; boundary=batch_resp"},
+            content="".join(parts).encode("utf-8"),
+        )
+
+    metadata, _ = _run_with_drive_client(
+        handler, lambda client: client.get_file_metadata_many(_stored_token(), file_ids=["a", "b"])
+    )
+
+    assert metadata == [{"id": "a", "name": "a.png", "parents": ["folder"]}, None]
+    assert len(requests) == 1
+    assert str(requests[0].url) == client_module.DRIVE_BATCH_ENDPOINT
+    assert b"GET /drive/v3/files/b?" in requests[0].content
+
+
+def test_is_rate_limited_checks_drive_error_reasons() -> None:
+    def forbidden(body: Any) -> httpx.Response:
+        return httpx.Response(403, json=body)
+
+    assert client_module._is_rate_limited(httpx.Response(429))
+    assert client_module._is_rate_limited(forbidden({"error": {"errors": [{"reason": "rateLimitExceeded"}]}}))
+    assert not client_module._is_rate_limited(
+        forbidden({"error": {"errors": [{"reason": "forbidden", "message": "rateLimitExceeded"}]}})
+    )
+    assert not client_module._is_rate_limited(httpx.Response(403, content=b"userRateLimitExceeded"))
+
+
+def test_upload_files_keeps_order_and_retries_rate_limits(no_sleep: List[float]) -> None:
+    attempts: Dict[str, int] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = "a.png" if b'"name":"a.png"' in request.content else "b.png"
+        attempts[name] = attempts.get(name, 0) + 1
+        if name == "a.png" and attempts[name] == 1:
+            return httpx.Response(403, json={"error": {"errors": [{"reason": "userRateLimitExceeded"}]}})
+        return httpx.Response(200, json={"id": f"id-{name}", "name": name})
+
+    uploaded, _ = _run_with_drive_client(
+        handler,
+        lambda client: client.upload_files(
+            _stored_token(),
+            parent_id="folder",
+            files=[("a.png", b"a", "image/png"), ("b.png", b"b", "image/png")],
+        ),
+    )
+
+    assert [item["id"] for item in uploaded] == ["id-a.png", "id-b.png"]
+    assert attempts == {"a.png": 2, "b.png": 1}
+
+
+def test_open_file_stream_yields_body_in_chunks(monkeypatch) -> None:
+    body = b"x" * 10
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["alt"] == "media"
+        return httpx.Response(200, content=body)
+
+    async def scenario(client: GoogleDriveClient) -> List[bytes]:
+        stream, _ = await client.open_file_stream(_stored_token(), file_id="file")
+        return [chunk async for chunk in stream]
+
+    monkeypatch.setattr(client_module, "UPLOAD_CHUNK_SIZE", 4)
+    chunks = _run_with_drive_client(handler, scenario)
+
+    assert b"".join(chunks) == body
+    assert max(len(chunk) for chunk in chunks) <= 4
+
+
+def test_list_child_folders_is_cached_until_a_folder_is_created() -> None:
+    listings: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            listings.append(request)
+            return httpx.Response(200, json={"files": [{"id": "1", "name": "A"}]})
+        return httpx.Response(200, json={"id": "2", "name": "B"})
+
+    async def scenario(client: GoogleDriveClient) -> None:
+        tokens = _stored_token()
+        await client.list_child_folders(tokens, parent_id="root")
+        await client.list_child_folders(tokens, parent_id="root")
+        assert len(listings) == 1
+        await client.create_child_folder(tokens, name="B", parent_id="root")
+        await client.list_child_folders(tokens, parent_id="root")
+        assert len(listings) == 2
+
+    _run_with_drive_client(handler, scenario)
+
+
+def test_list_child_folders_cache_is_bounded_and_copied(monkeypatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"files": [{"id": "1", "name": "A"}]})
+
+    monkeypatch.setattr(client_module, "CHILD_FOLDER_CACHE_SIZE", 2)
+
+    async def scenario(client: GoogleDriveClient) -> None:
+        tokens = _stored_token()
+        folders, _ = await client.list_child_folders(tokens, parent_id="a")
+        folders[0]["name"] = "changed"
+        cached, _ = await client.list_child_folders(tokens, parent_id="a")
+        assert cached[0]["name"] == "A"
+
+        await client.list_child_folders(tokens, parent_id="b")
+        await client.list_child_folders(tokens, parent_id="c")
+        assert list(client._child_folder_cache) == [("user", "b"), ("user", "c")]
+
+    _run_with_drive_client(handler, scenario)
+
+
+def test_list_child_files_keeps_query_across_pages() -> None:
+    queries: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(request.url.params["q"])
+        if "pageToken" not in request.url.params:
+            return httpx.Response(200, json={"files": [{"id": "1", "name": "a.xlsx"}], "nextPageToken": "p2"})
+        return httpx.Response(200, json={"files": [{"id": "2", "name": "b.xlsx"}]})
+
+    files, _ = _run_with_drive_client(
+        handler,
+        lambda client: client.list_child_files(
+            _stored_token(), parent_id="folder", mime_type=client_module.XLSX_MIME_TYPE
+        ),
+    )
+
+    assert [entry["id"] for entry in files] == ["1", "2"]
+    assert len(queries) == 2 and queries[0] == queries[1]
+    assert client_module.XLSX_MIME_TYPE in queries[1]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services.google_drive.concurrency import run_concurrently  # noqa: E402
+
+
+def test_run_concurrently_returns_results_in_order() -> None:
+    async def value(result: int, delay: float) -> int:
+        await asyncio.sleep(delay)
+        return result
+
+    assert asyncio.run(run_concurrently(value(1, 0.02), value(2, 0))) == [1, 2]
+
+
+def test_run_concurrently_reraises_first_failure_and_cancels_the_rest() -> None:
+    cancelled = []
+
+    async def fail() -> None:
+        raise HTTPException(status_code=502, detail="boom")
+
+    async def slow() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(run_concurrently(slow(), fail()))
+
+    assert excinfo.value.status_code == 502
+    assert excinfo.value.__suppress_context__
+    assert cancelled == [True]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import io
 import sys
+from datetime import date, datetime, time
 from pathlib import Path
 
 import pytest
@@ -13,6 +14,7 @@ BACKEND_ROOT = Path(__file__).resolve().parents[1]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
+from app.services.google_drive import feature_lists  # noqa: E402
 from app.services.google_drive.feature_lists import (  # noqa: E402
     build_feature_list_rows_csv,
     parse_feature_list_workbook,
@@ -47,6 +49,31 @@ def test_parse_feature_list_workbook_extracts_rows() -> None:
     ]
 
 
+def test_parse_feature_list_workbook_readers_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("python_calamine")
+
+    workbook = Workbook()
+    workbook.active.title = "표지"
+    sheet = workbook.create_sheet("기능리스트 v1.0")
+    sheet.append([])
+    sheet.append(["대분류", "중분류", "소분류", "기능 설명", "기능 개요"])
+    sheet.append(["인증", "로그인", 1, "사용자 인증 처리", None])
+    sheet.append(["일정", date(2024, 1, 2), datetime(2024, 1, 2, 3, 4), time(9, 30), 2.5])
+    sheet.append([None, None, None, None, "개요만 있는 행"])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    workbook.close()
+    workbook_bytes = buffer.getvalue()
+
+    calamine_result = parse_feature_list_workbook(workbook_bytes)
+    monkeypatch.setattr(feature_lists, "CalamineWorkbook", None)
+    openpyxl_result = parse_feature_list_workbook(workbook_bytes)
+
+    assert calamine_result == openpyxl_result
+    assert calamine_result[0] == "기능리스트 v1.0"
+    assert calamine_result[3][1]["middleCategory"] == "2024-01-02 00:00:00"
+
+
 def test_build_feature_list_rows_csv_roundtrips_rows() -> None:
     csv_text = build_feature_list_rows_csv([
         {
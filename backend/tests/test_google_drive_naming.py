@@ -10,6 +10,7 @@ if str(BACKEND_ROOT) not in sys.path:
 from app.services.google_drive.naming import (  # noqa: E402
     drive_name_variants,
     drive_suffix_matches,
+    find_matching_name,
     looks_like_header_row,
     normalize_drive_text,
 )
@@ -30,6 +31,12 @@ def test_drive_suffix_matches_handles_partial_suffix() -> None:
     assert not drive_suffix_matches("Project_Plan.xlsx", "report final")
 
 
+def test_find_matching_name_returns_first_match() -> None:
+    names = ["Cover", "기능리스트 v1.0", "기능 리스트"]
+    assert find_matching_name(names, "기능리스트") == "기능리스트 v1.0"
+    assert find_matching_name(names, "결함리포트") is None
+
+
 def test_looks_like_header_row_demands_majority() -> None:
     headers = ["A", "B", "C"]
     assert looks_like_header_row(["a", "something", "c"], headers)
@@ -21,7 +21,7 @@ from fastapi import HTTPException
 from app.config import Settings
 from app.services.google_drive import templates as drive_templates
 from app.services.google_drive.client import DRIVE_FOLDER_MIME_TYPE
-from app.services.google_drive.service import GoogleDriveService
+from app.services.google_drive.service import GoogleDriveService, _unique_folder_name
 from app.token_store import StoredAccount, StoredTokens
 
 
@@ -283,3 +283,89 @@ def test_delete_project_missing_metadata_returns_404() -> None:
 
     assert exc.value.status_code == 404
     assert stub_client.deleted_ids == []
+
+
+def test_root_folder_lookup_is_cached_per_account() -> None:
+    tokens = _stored_tokens()
+    storage = StubTokenStorage(tokens)
+    service = GoogleDriveService(_settings(), storage, StubOAuthService())
+
+    class RootClient:
+        def __init__(self) -> None:
+            self.lookups = 0
+
+        async def find_root_folder(
+            self, tokens: StoredTokens, *, folder_name: str
+        ) -> Tuple[Optional[Dict[str, Any]], StoredTokens]:
+            self.lookups += 1
+            return {"id": "gs-root", "name": folder_name}, tokens
+
+    root_client = RootClient()
+    service._client = root_client  # type: ignore[attr-defined]
+
+    async def run() -> List[str]:
+        ids = []
+        for _ in range(2):
+            folder, _, created = await service._get_root_folder(tokens)
+            assert created is False
+            ids.append(folder["id"])
+        service._forget_root_folder(tokens)
+        folder, _, _ = await service._get_root_folder(tokens)
+        ids.append(folder["id"])
+        return ids
+
+    assert asyncio.run(run()) == ["gs-root", "gs-root", "gs-root"]
+    assert root_client.lookups == 2
+
+
+def test_cached_root_folder_is_dropped_only_when_drive_reports_it_gone() -> None:
+    tokens = _stored_tokens()
+    storage = StubTokenStorage(tokens)
+    service = GoogleDriveService(_settings(), storage, StubOAuthService())
+
+    class RootClient:
+        def __init__(self) -> None:
+            self.lookups = 0
+            self.trashed: Dict[str, bool] = {}
+
+        async def find_root_folder(
+            self, tokens: StoredTokens, *, folder_name: str
+        ) -> Tuple[Optional[Dict[str, Any]], StoredTokens]:
+            self.lookups += 1
+            return {"id": f"gs-{self.lookups}", "name": folder_name}, tokens
+
+        async def get_file_metadata(
+            self, tokens: StoredTokens, *, file_id: str, fields: str
+        ) -> Tuple[Optional[Dict[str, Any]], StoredTokens]:
+            return {"id": file_id, "trashed": self.trashed.get(file_id, False)}, tokens
+
+    root_client = RootClient()
+    service._client = root_client  # type: ignore[attr-defined]
+
+    async def echo(folder_id: str, tokens: StoredTokens) -> str:
+        return folder_id
+
+    async def fail(folder_id: str, tokens: StoredTokens) -> str:
+        raise HTTPException(status_code=502, detail="unrelated")
+
+    async def run() -> List[str]:
+        seen = [(await service._use_root_folder(tokens, echo))[3]]
+        with pytest.raises(HTTPException):
+            await service._use_root_folder(tokens, fail)
+        seen.append((await service._use_root_folder(tokens, echo))[3])
+        root_client.trashed["gs-1"] = True
+        seen.append((await service._use_root_folder(tokens, echo))[3])
+        return seen
+
+    assert asyncio.run(run()) == ["gs-1", "gs-1", "gs-2"]
+    assert root_client.lookups == 2
+
+
+def test_unique_folder_name_uses_next_suffix() -> None:
+    assert _unique_folder_name("Project", {"Other"}) == "Project"
+    assert _unique_folder_name("Project", {"Project"}) == "Project (2)"
+    assert (
+        _unique_folder_name("Project", {"Project", "Project (2)", "Project (7)", "Project (x)"})
+        == "Project (8)"
+    )
+    assert _unique_folder_name("[GS] A.B", {"[GS] A.B", "[GS] AxB (5)"}) == "[GS] A.B (2)"
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+import pytest
+from fastapi import HTTPException
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services.google_drive import templates  # noqa: E402
+
+
+class _RecordingClient:
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.folder_batches: List[List[Tuple[str, str]]] = []
+        self.uploads: List[Tuple[str, str, bytes]] = []
+        self.fail_on = fail_on
+
+    async def create_folders(
+        self, tokens: Any, *, folders: Sequence[Tuple[str, str]]
+    ) -> Tuple[List[Dict[str, Any]], Any]:
+        self.folder_batches.append(list(folders))
+        return [{"id": f"{parent}/{name}"} for name, parent in folders], tokens
+
+    async def upload_file_to_folder(
+        self, tokens: Any, *, file_name: str, parent_id: str, content: bytes, content_type: str
+    ) -> Tuple[Dict[str, Any], Any]:
+        await asyncio.sleep(0)
+        if file_name == self.fail_on:
+            raise HTTPException(status_code=502, detail="upload failed")
+        self.uploads.append((file_name, parent_id, content))
+        return {"id": file_name}, tokens
+
+
+def _template_tree(root: Path) -> None:
+    (root / "가.계획" / "세부").mkdir(parents=True)
+    (root / "나.설계").mkdir()
+    (root / "GS-B-XX-XXXX 안내.txt").write_bytes(b"root")
+    (root / "가.계획" / "계획.txt").write_bytes(b"plan")
+    (root / "가.계획" / "세부" / "세부.txt").write_bytes(b"detail")
+    (root / "나.설계" / "설계.txt").write_bytes(b"design")
+
+
+def test_copy_template_to_drive_batches_folders_and_uploads_every_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _template_tree(tmp_path)
+    monkeypatch.setattr(templates, "TEMPLATE_ROOT", tmp_path)
+    client = _RecordingClient()
+
+    tokens = asyncio.run(
+        templates.copy_template_to_drive(
+            client, "tokens", parent_id="project", exam_number="GS-B-25-0001"  # type: ignore[arg-type]
+        )
+    )
+
+    assert tokens == "tokens"
+    assert client.folder_batches == [
+        [("가.계획", "project"), ("나.설계", "project")],
+        [("세부", "project/가.계획")],
+    ]
+    assert sorted(client.uploads) == sorted(
+        [
+            ("GS-B-25-0001 안내.txt", "project", b"root"),
+            ("계획.txt", "project/가.계획", b"plan"),
+            ("세부.txt", "project/가.계획/세부", b"detail"),
+            ("설계.txt", "project/나.설계", b"design"),
+        ]
+    )
+
+
+def test_copy_template_to_drive_surfaces_upload_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _template_tree(tmp_path)
+    monkeypatch.setattr(templates, "TEMPLATE_ROOT", tmp_path)
+    client = _RecordingClient(fail_on="계획.txt")
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(
+            templates.copy_template_to_drive(
+                client, "tokens", parent_id="project", exam_number="GS-B-25-0001"  # type: ignore[arg-type]
+            )
+        )
+
+    assert exc.value.status_code == 502
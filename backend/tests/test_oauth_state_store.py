@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import oauth
+from app.services.oauth import OAuthStateStore
+
+
+def test_state_can_only_be_consumed_once() -> None:
+    store = OAuthStateStore()
+    store.add("state-1")
+
+    assert store.consume("state-1") is True
+    assert store.consume("state-1") is False
+    assert store.consume("unknown") is False
+
+
+def test_expired_state_is_rejected_and_swept(monkeypatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr(oauth.time, "monotonic", lambda: clock[0])
+
+    store = OAuthStateStore(ttl_seconds=10.0)
+    store.add("stale")
+    store.add("expired")
+
+    clock[0] += 11.0
+    assert store.consume("expired") is False
+
+    store.add("fresh")
+    assert len(store) == 1
+    assert store.consume("fresh") is True
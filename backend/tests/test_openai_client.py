@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import orjson
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.services import openai_client
+from app.services.openai_client import create_openai_client
+
+
+def test_openai_client_serializes_json_with_orjson() -> None:
+    client = create_openai_client("test-key")
+    payload = {"model": "gpt-test", "input": [{"role": "user", "content": "요청"}]}
+
+    request = client._client.build_request(
+        "POST", "https://api.openai.com/v1/responses", json=payload
+    )
+
+    assert request.content == orjson.dumps(payload)
+    assert request.headers["content-type"] == "application/json"
+
+
+def test_openai_client_enables_http2(monkeypatch) -> None:
+    options: dict = {}
+
+    class RecordingHttpxClient(openai_client._OrjsonHttpxClient):
+        def __init__(self, **kwargs) -> None:
+            options.update(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(openai_client, "_OrjsonHttpxClient", RecordingHttpxClient)
+    create_openai_client("test-key")
+
+    assert options["http2"] is True
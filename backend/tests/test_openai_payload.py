@@ -297,3 +297,17 @@ def test_normalize_messages_preserves_data_image_url() -> None:
             ],
         }
     ]
+
+
+def test_text_message_appends_image_parts_from_file_id() -> None:
+    message = OpenAIMessageBuilder.text_message(
+        "user",
+        "이미지 참고",
+        attachments=[{"file_id": "file-img", "kind": "image"}],
+    )
+
+    assert message["content"][1] == {"type": "input_image", "file_id": "file-img"}
+    assert OpenAIMessageBuilder.normalize_messages([message])[0]["content"][1] == {
+        "type": "input_image",
+        "file_id": "file-img",
+    }
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.token_store import TokenStorage
+
+
+def _save(storage: TokenStorage, google_id: str, email: str) -> None:
+    storage.save(
+        google_id=google_id,
+        display_name=google_id,
+        email=email,
+        payload={"access_token": f"token-{google_id}", "expires_in": 3600},
+    )
+
+
+def test_load_by_google_id_or_email_prefers_google_id(tmp_path: Path) -> None:
+    storage = TokenStorage(tmp_path / "tokens.db")
+    _save(storage, "user-a", "a@example.com")
+    _save(storage, "user-b", "b@example.com")
+
+    stored = storage.load_by_google_id_or_email("user-b", "a@example.com")
+
+    assert stored is not None
+    assert stored.google_id == "user-b"
+
+
+def test_load_by_google_id_or_email_falls_back_to_email(tmp_path: Path) -> None:
+    storage = TokenStorage(tmp_path / "tokens.db")
+    _save(storage, "user-a", "a@example.com")
+
+    assert storage.load_by_google_id_or_email("missing", "a@example.com").google_id == "user-a"
+    assert storage.load_by_google_id_or_email(None, " a@example.com ").google_id == "user-a"
+    assert storage.load_by_google_id_or_email("missing", None) is None
+    assert storage.load_by_google_id_or_email(" ", "") is None
+
+
+def test_save_upserts_existing_google_id(tmp_path: Path) -> None:
+    storage = TokenStorage(tmp_path / "tokens.db")
+    _save(storage, "user-a", "a@example.com")
+    _save(storage, "user-a", "new@example.com")
+
+    accounts = storage.list_accounts()
+
+    assert [account.google_id for account in accounts] == ["user-a"]
+    assert storage.load_by_google_id("user-a").email == "new@example.com"
+
+
+def test_stored_tokens_expires_at_ts(tmp_path: Path) -> None:
+    storage = TokenStorage(tmp_path / "tokens.db")
+    _save(storage, "user-a", "a@example.com")
+
+    stored = storage.load_by_google_id("user-a")
+
+    assert stored is not None
+    assert stored.expires_at_ts == stored.saved_at.timestamp() + 3600